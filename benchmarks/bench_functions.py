@@ -0,0 +1,600 @@
+"""
+Throughput and latency benchmarks for every public function of webcolors.
+
+Run with ``nox -s benchmarks``, or directly with
+``python benchmarks/bench_functions.py`` (pass ``--help`` for options). Inputs are
+realistic mixes of valid and invalid values; each case name describes its mix.
+
+"""
+import asyncio
+import atexit
+import functools
+import inspect
+import io
+import os
+import random
+import sys
+import tempfile
+import typing
+
+import harness
+
+import webcolors
+
+RANDOM = random.Random(1234)
+
+# Hexadecimal values.
+HEX_6 = [f"#{RANDOM.randrange(2**24):06x}" for _ in range(500)]
+HEX_6_UPPER = [value.upper() for value in HEX_6]
+HEX_3 = [f"#{RANDOM.randrange(2**12):03x}" for _ in range(500)]
+HEX_INVALID = [
+    "0099cc",
+    "#0099gg",
+    "#0000",
+    "#00000000",
+    "",
+    "#",
+    "rgb(0, 0, 0)",
+    "#" + "f" * 200,
+]
+HEX_MIXED = HEX_6[:200] + HEX_3[:100] + HEX_6_UPPER[:100] + HEX_INVALID * 12
+HEX_NAMED = list(webcolors.CSS3_HEX_TO_NAMES)
+HEX_NAMED_3 = [
+    f"#{value[1]}{value[3]}{value[5]}"
+    for value in HEX_NAMED
+    if value[1] == value[2] and value[3] == value[4] and value[5] == value[6]
+]
+HEX_BYTES = [value.encode("ascii") for value in HEX_6]
+
+# Color names.
+NAMES = list(webcolors.CSS3_NAMES_TO_HEX)
+NAMES_MIXED_CASE = [name.title() for name in NAMES]
+NAMES_MISS = ["chucknorris", "notacolor", "grren", "transparent", "", "x" * 100]
+NAMES_MIXED = NAMES + NAMES_MIXED_CASE + NAMES_MISS * 25
+
+# Integer and percentage rgb() triplets.
+INT_TRIPLETS = [tuple(RANDOM.randrange(256) for _ in range(3)) for _ in range(500)]
+INT_NAMED = [webcolors.hex_to_rgb(value) for value in HEX_NAMED]
+INT_OUT_OF_RANGE = [
+    tuple(RANDOM.randrange(-100, 400) for _ in range(3)) for _ in range(100)
+]
+INT_MIXED = INT_TRIPLETS[:300] + INT_NAMED[:100] + INT_OUT_OF_RANGE
+PERCENT_SPECIAL = [
+    webcolors.rgb_to_rgb_percent(triplet)
+    for triplet in [(0, 128, 255), (16, 32, 64), (255, 255, 255)] * 20
+]
+PERCENT_TRIPLETS = [webcolors.rgb_to_rgb_percent(value) for value in INT_TRIPLETS]
+PERCENT_INTEGERS = [
+    tuple(f"{RANDOM.randrange(101)}%" for _ in range(3)) for _ in range(200)
+]
+PERCENT_OUT_OF_RANGE = [("-10%", "250%", "50%"), ("-0%", "100.5%", "0.0%")] * 50
+PERCENT_MIXED = (
+    PERCENT_TRIPLETS[:200] + PERCENT_INTEGERS + PERCENT_SPECIAL + PERCENT_OUT_OF_RANGE
+)
+PERCENT_NAMED = [webcolors.rgb_to_rgb_percent(value) for value in INT_NAMED]
+
+# Legacy HTML values, including adversarial junk.
+LEGACY = (
+    NAMES[:50]
+    + HEX_6[:50]
+    + HEX_3[:50]
+    + [
+        "chucknorris",
+        "Window",
+        "  #fff  ",
+        "RE|SXLuAse",
+        "+=@FnnWL!Yb}5Dk",
+        "#ffffffffffffffffffffffffffffff",
+        "A" * 129,
+        "\U0001f600" * 40,
+        "x" * 10000,
+        "transparent",
+        "",
+    ]
+    * 5
+)
+
+# Buffers and pixel data.
+PIXELS = bytes(RANDOM.randrange(256) for _ in range(3 * 256 * 256))
+PIXELS_FEW_COLORS = bytes(
+    value
+    for _ in range(256 * 256)
+    for value in INT_NAMED[RANDOM.randrange(len(INT_NAMED))]
+)
+RECORDS = webcolors.rgb_to_hex_records(INT_TRIPLETS, separator=b"\n") + b"\n"
+
+
+async def _drain(async_iterator: typing.AsyncIterator) -> None:
+    """
+    Consume an asynchronous iterator.
+
+    """
+    async for _ in async_iterator:
+        pass
+
+
+async def _aiter(values: typing.Iterable) -> typing.AsyncIterator:
+    """
+    Asynchronously yield each of the given values.
+
+    """
+    for value in values:
+        yield value
+
+
+async def _convert_lines(data: bytes) -> None:
+    """
+    Convert the lines of a stream reader fed with the given data.
+
+    """
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    await _drain(webcolors.async_convert_lines(webcolors.hex_to_rgb, reader))
+
+
+@functools.lru_cache(maxsize=None)
+def _data_file() -> str:
+    """
+    Write a file of hexadecimal values, one per line, to a temporary
+    directory removed on exit, returning its path.
+
+    """
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    path = os.path.join(directory.name, "colors.txt")
+    with open(path, "w", encoding="utf-8") as colors_file:
+        colors_file.writelines(f"{value}\n" for value in HEX_6 * 20)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _legacy_cache() -> webcolors.LegacyColorCache:
+    """
+    Return a cache of legacy colors in a temporary database, prewarmed with
+    the legacy values.
+
+    """
+    cache = webcolors.LegacyColorCache(_data_file() + ".sqlite3")
+    atexit.register(cache.close)
+    cache.prewarm(LEGACY)
+    return cache
+
+
+def _sharded(shards: int) -> None:
+    """
+    Convert the data file in shards, merging the results.
+
+    """
+    path = _data_file()
+    outputs = []
+    for index, byte_range in enumerate(webcolors.shard_file(path, shards)):
+        outputs.append(f"{path}.{index}")
+        webcolors.convert_file(path, outputs[-1], byte_range=byte_range)
+    webcolors.merge_files(outputs, f"{path}.merged")
+
+
+def _instrumented(values: typing.List[str]) -> None:
+    """
+    Convert hexadecimal values to integer triplets with instrumentation enabled.
+
+    """
+    webcolors.enable_instrumentation()
+    try:
+        for value in values:
+            webcolors.hex_to_rgb(value)
+    finally:
+        webcolors.disable_instrumentation()
+
+
+def _sampled(values: typing.List[str]) -> None:
+    """
+    Parse legacy HTML color values with one in ten calls sampled.
+
+    """
+    webcolors.enable_sampling(rate=10)
+    try:
+        for value in values:
+            webcolors.html5_parse_legacy_color(value)
+    finally:
+        webcolors.disable_sampling()
+
+
+def _legacy_cached(values: typing.List[str]) -> None:
+    """
+    Parse legacy HTML color values with the legacy color cache enabled.
+
+    """
+    webcolors.enable_legacy_cache()
+    try:
+        for value in values:
+            try:
+                webcolors.html5_parse_legacy_color(value)
+            except ValueError:
+                pass
+    finally:
+        webcolors.disable_legacy_cache()
+
+
+def _spelling_indexed(values: typing.List[str]) -> None:
+    """
+    Convert hexadecimal values to names with the spelling index enabled.
+
+    """
+    webcolors.enable_spelling_index()
+    try:
+        for value in values:
+            webcolors.hex_to_name(value)
+    finally:
+        webcolors.disable_spelling_index()
+
+
+def _cases(function: str, call: typing.Callable, **mixes) -> typing.List[harness.Case]:
+    """
+    Build one case per input mix for a function.
+
+    """
+    return [
+        harness.Case(function, label, call, inputs) for label, inputs in mixes.items()
+    ]
+
+
+def _spec_cases(function: str, **mixes) -> typing.List[harness.Case]:
+    """
+    Build one case per input mix for a function which takes a spec, for the default
+    spec and for HTML4.
+
+    """
+    call = getattr(webcolors, function)
+    return _cases(function, call, **mixes) + [
+        harness.Case(
+            function, f"{label},html4", functools.partial(call, spec="html4"), inputs
+        )
+        for label, inputs in mixes.items()
+    ]
+
+
+CASES = [
+    *_cases(
+        "normalize_hex",
+        webcolors.normalize_hex,
+        hex6=HEX_6,
+        hex6_upper=HEX_6_UPPER,
+        hex3=HEX_3,
+        invalid=HEX_INVALID,
+        mixed=HEX_MIXED,
+        bytes=HEX_BYTES,
+    ),
+    *_cases(
+        "normalize_integer_triplet",
+        webcolors.normalize_integer_triplet,
+        in_range=INT_TRIPLETS,
+        out_of_range=INT_OUT_OF_RANGE,
+    ),
+    *_cases(
+        "normalize_percent_triplet",
+        webcolors.normalize_percent_triplet,
+        mixed=PERCENT_MIXED,
+        out_of_range=PERCENT_OUT_OF_RANGE,
+    ),
+    *_spec_cases("name_to_hex", hits=NAMES, mixed=NAMES_MIXED, misses=NAMES_MISS),
+    *_spec_cases("name_to_rgb", hits=NAMES, mixed=NAMES_MIXED),
+    *_spec_cases("name_to_rgb_percent", hits=NAMES, mixed=NAMES_MIXED),
+    *_spec_cases(
+        "hex_to_name",
+        hits=HEX_NAMED,
+        hits_hex3=HEX_NAMED_3,
+        hits_upper=[value.upper() for value in HEX_NAMED],
+        misses=HEX_6,
+        mixed=HEX_MIXED + HEX_NAMED,
+    ),
+    *_cases(
+        "hex_to_names",
+        webcolors.hex_to_names,
+        hits=HEX_NAMED,
+        misses=HEX_6,
+        mixed=HEX_MIXED + HEX_NAMED,
+    ),
+    *_cases(
+        "hex_to_rgb",
+        webcolors.hex_to_rgb,
+        hex6=HEX_6,
+        hex3=HEX_3,
+        mixed=HEX_MIXED,
+        bytes=HEX_BYTES,
+    ),
+    *_cases(
+        "hex_to_rgb_percent", webcolors.hex_to_rgb_percent, hex6=HEX_6, mixed=HEX_MIXED
+    ),
+    *_spec_cases("rgb_to_name", hits=INT_NAMED, misses=INT_TRIPLETS, mixed=INT_MIXED),
+    *_cases("rgb_to_hex", webcolors.rgb_to_hex, in_range=INT_TRIPLETS, mixed=INT_MIXED),
+    *_cases(
+        "rgb_to_rgb_percent",
+        webcolors.rgb_to_rgb_percent,
+        in_range=INT_TRIPLETS,
+        mixed=INT_MIXED,
+    ),
+    *_spec_cases(
+        "rgb_percent_to_name",
+        hits=PERCENT_NAMED,
+        misses=PERCENT_TRIPLETS,
+        mixed=PERCENT_MIXED,
+    ),
+    *_cases(
+        "rgb_percent_to_hex",
+        webcolors.rgb_percent_to_hex,
+        triplets=PERCENT_TRIPLETS,
+        mixed=PERCENT_MIXED,
+    ),
+    *_cases(
+        "rgb_percent_to_rgb",
+        webcolors.rgb_percent_to_rgb,
+        triplets=PERCENT_TRIPLETS,
+        mixed=PERCENT_MIXED,
+    ),
+    *_cases(
+        "html5_parse_simple_color",
+        webcolors.html5_parse_simple_color,
+        valid=HEX_6 + HEX_6_UPPER,
+        mixed=HEX_MIXED,
+    ),
+    *_cases(
+        "html5_serialize_simple_color",
+        webcolors.html5_serialize_simple_color,
+        in_range=INT_TRIPLETS,
+    ),
+    *_cases(
+        "html5_parse_legacy_color",
+        webcolors.html5_parse_legacy_color,
+        names=NAMES + NAMES_MIXED_CASE,
+        hex=HEX_6 + HEX_3,
+        mixed=LEGACY,
+    ),
+    harness.Case(
+        "hex_records_to_rgb",
+        "500_records",
+        lambda buffer: list(webcolors.hex_records_to_rgb(buffer, stride=8)),
+        [RECORDS],
+        len(INT_TRIPLETS),
+    ),
+    harness.Case(
+        "rgb_to_hex_records",
+        "500_triplets",
+        webcolors.rgb_to_hex_records,
+        [INT_TRIPLETS],
+        len(INT_TRIPLETS),
+    ),
+    harness.Case(
+        "hex_to_rgb_channels",
+        "500_values",
+        webcolors.hex_to_rgb_channels,
+        [HEX_6],
+        len(HEX_6),
+    ),
+    harness.Case(
+        "hex_to_rgb_channels",
+        "500_mixed_case",
+        webcolors.hex_to_rgb_channels,
+        [HEX_6_UPPER[:250] + HEX_3[:250]],
+        500,
+    ),
+    harness.Case(
+        "hex_records_to_rgb_channels",
+        "500_records",
+        lambda buffer: webcolors.hex_records_to_rgb_channels(buffer, stride=8),
+        [RECORDS],
+        len(INT_TRIPLETS),
+    ),
+    *[
+        harness.Case(
+            f"iter_{function}",
+            "mixed,replace",
+            lambda values, call=getattr(webcolors, f"iter_{function}"): list(
+                call(values, errors="replace")
+            ),
+            [inputs],
+            len(inputs),
+        )
+        for inputs, functions in (
+            (NAMES_MIXED, ("name_to_hex", "name_to_rgb", "name_to_rgb_percent")),
+            (
+                HEX_MIXED,
+                ("hex_to_name", "hex_to_names", "hex_to_rgb", "hex_to_rgb_percent"),
+            ),
+            (INT_MIXED, ("rgb_to_name", "rgb_to_hex", "rgb_to_rgb_percent")),
+            (
+                PERCENT_MIXED,
+                ("rgb_percent_to_name", "rgb_percent_to_hex", "rgb_percent_to_rgb"),
+            ),
+        )
+        for function in functions
+    ],
+    *[
+        harness.Case(
+            function,
+            "256x256_random",
+            lambda buffer, call=getattr(webcolors, function): list(call(buffer, 256)),
+            [PIXELS],
+            256 * 256,
+        )
+        for function in ("pixels_to_hex", "pixels_to_ints", "pixels_to_names")
+    ],
+    harness.Case(
+        "pixels_to_names",
+        "256x256_random,nearest",
+        lambda buffer: list(webcolors.pixels_to_names(buffer, 256, nearest=True)),
+        [PIXELS],
+        256 * 256,
+    ),
+    harness.Case(
+        "pixels_to_name_histogram",
+        "256x256_random",
+        webcolors.pixels_to_name_histogram,
+        [PIXELS],
+        256 * 256,
+    ),
+    harness.Case(
+        "pixels_to_name_histogram",
+        "256x256_named,nearest",
+        functools.partial(webcolors.pixels_to_name_histogram, nearest=True),
+        [PIXELS_FEW_COLORS],
+        256 * 256,
+    ),
+    harness.Case(
+        "extract_palette",
+        "256x256_random,step4",
+        functools.partial(webcolors.extract_palette, count=8, step=4),
+        [PIXELS],
+        256 * 256,
+    ),
+    harness.Case(
+        "extract_palette",
+        "500_triplets",
+        webcolors.extract_palette,
+        [INT_TRIPLETS],
+        len(INT_TRIPLETS),
+    ),
+    harness.Case(
+        "parallel_convert",
+        "hex_to_rgb,threads",
+        lambda values: list(webcolors.parallel_convert(webcolors.hex_to_rgb, values)),
+        [HEX_6 * 20],
+        len(HEX_6) * 20,
+    ),
+    harness.Case(
+        "async_convert",
+        "hex_to_rgb",
+        lambda values: asyncio.run(
+            _drain(webcolors.async_convert(webcolors.hex_to_rgb, _aiter(values)))
+        ),
+        [HEX_6 * 20],
+        len(HEX_6) * 20,
+    ),
+    harness.Case(
+        "async_convert_lines",
+        "hex_to_rgb",
+        lambda data: asyncio.run(_convert_lines(data)),
+        [RECORDS * 20],
+        len(INT_TRIPLETS) * 20,
+    ),
+    harness.Case(
+        "convert_file",
+        "hex_to_rgb,lines",
+        lambda text: webcolors.convert_file(io.StringIO(text), io.StringIO()),
+        ["".join(f"{value}\n" for value in HEX_6 * 20)],
+        len(HEX_6) * 20,
+    ),
+    harness.Case(
+        "convert_file",
+        "hex_to_name,csv",
+        lambda text: webcolors.convert_file(
+            io.StringIO(text),
+            io.StringIO(),
+            to_format="name",
+            layout="csv",
+            errors="replace",
+        ),
+        ["color\n" + "".join(f"{value}\n" for value in HEX_MIXED * 5)],
+        len(HEX_MIXED) * 5,
+    ),
+    harness.Case(
+        "shard_file",
+        "64_shards",
+        lambda shards: webcolors.shard_file(_data_file(), shards),
+        [64] * 10,
+    ),
+    harness.Case(
+        "merge_files",
+        "convert_8_shards",
+        _sharded,
+        [8] * 5,
+        len(HEX_6) * 20,
+    ),
+    harness.Case(
+        "LegacyColorCache",
+        "parse,hit",
+        lambda value: _legacy_cache().parse(value),
+        LEGACY,
+    ),
+    harness.Case(
+        "LegacyColorCache",
+        "parse_many,hit",
+        lambda values: _legacy_cache().parse_many(values, errors="replace"),
+        [LEGACY],
+        len(LEGACY),
+    ),
+    harness.Case(
+        "enable_instrumentation",
+        "hex_to_rgb,hex6",
+        _instrumented,
+        [HEX_6],
+        len(HEX_6),
+    ),
+    harness.Case("enable_sampling", "legacy,rate10", _sampled, [LEGACY], len(LEGACY)),
+    harness.Case(
+        "enable_spelling_index",
+        "hex_to_name,hits_upper",
+        _spelling_indexed,
+        [[value.upper() for value in HEX_NAMED]],
+        len(HEX_NAMED),
+    ),
+    harness.Case(
+        "enable_legacy_cache", "legacy", _legacy_cached, [LEGACY * 4], 4 * len(LEGACY)
+    ),
+    harness.Case(
+        "prewarm_caches",
+        "legacy_manifest",
+        webcolors.prewarm_caches,
+        [{"legacy": LEGACY[:50], "nearest": ["css3"]}] * 10,
+        50,
+    ),
+    *[
+        harness.Case(
+            function,
+            "after_hex_to_rgb",
+            lambda _, call=getattr(webcolors, function): call(),
+            [None] * 10,
+        )
+        for function in (
+            "reset_instrumentation",
+            "instrumentation_snapshot",
+            "instrumentation_to_prometheus",
+            "sampled_calls",
+            "cache_statistics",
+            "cache_manifest",
+        )
+    ],
+]
+
+
+# Public functions with no benchmark case: each only switches off a feature
+# whose cost is measured by the case of its enable_*() counterpart.
+EXEMPT = frozenset(
+    {
+        "disable_instrumentation",
+        "disable_legacy_cache",
+        "disable_sampling",
+        "disable_spelling_index",
+    }
+)
+
+
+def _check_coverage() -> None:
+    """
+    Fail if any public function of webcolors, other than those in
+    :data:`EXEMPT`, has no benchmark case.
+
+    """
+    functions = {
+        name
+        for name in webcolors.__all__
+        if inspect.isfunction(getattr(webcolors, name))
+    }
+    missing = functions - EXEMPT - {case.function for case in CASES}
+    if missing:
+        raise SystemExit(f"No benchmark cases for: {', '.join(sorted(missing))}")
+
+
+if __name__ == "__main__":
+    _check_coverage()
+    sys.exit(harness.main(CASES, __doc__))
@@ -0,0 +1,76 @@
+"""
+Import-time benchmarks for webcolors.
+
+Reports the time taken, in a fresh interpreter, to import webcolors and then to
+make the first use of various parts of it, over and above the time taken to start
+the interpreter. Each figure is the median of several runs.
+
+Run with ``nox -s benchmarks_import``, or directly with
+``python benchmarks/bench_import.py`` (pass ``--help`` for options).
+
+"""
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+import harness
+
+# The code run in each case, after starting the interpreter.
+CASES = {
+    "import": "import webcolors",
+    "first_hex_to_rgb": "import webcolors; webcolors.hex_to_rgb('#fff')",
+    "first_hex_to_name": "import webcolors; webcolors.hex_to_name('#fff')",
+    "first_legacy": "import webcolors; webcolors.html5_parse_legacy_color('navy')",
+    "import_all": "from webcolors import *",
+}
+
+
+def run_ms(code: str) -> float:
+    """
+    Run code in a fresh interpreter, returning the elapsed time in milliseconds.
+
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return (time.perf_counter() - start) * 1e3
+
+
+def median_ms(code: str, runs: int) -> float:
+    """
+    Return the median time, over several runs, to run code in a fresh interpreter.
+
+    """
+    return statistics.median(run_ms(code) for _ in range(runs))
+
+
+def main() -> int:
+    """
+    Run the import-time benchmarks from the command line, returning the exit
+    status.
+
+    """
+    parser = harness.argument_parser(__doc__)
+    parser.add_argument("--runs", type=int, default=20, help="runs per case")
+    args = parser.parse_args()
+    baseline = harness.load_baseline(args)
+    startup = median_ms("pass", args.runs)
+    results: typing.Dict[str, typing.Dict[str, float]] = {}
+    regressions = 0
+    print(f"interpreter startup: {startup:.1f} ms")
+    print(f"{'case':<32} {'ms':>10}")
+    for name, code in CASES.items():
+        if args.pattern and args.pattern not in name:
+            continue
+        results[name] = {"ms": max(0.0, median_ms(code, args.runs) - startup)}
+        comparison, regressed = harness.compare(
+            args, baseline, name, "ms", results[name]["ms"]
+        )
+        regressions += regressed
+        print(f"{name:<32} {results[name]['ms']:>10.2f}{comparison}", flush=True)
+    return harness.finish(args, results, regressions)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
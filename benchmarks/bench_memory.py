@@ -0,0 +1,152 @@
+"""
+Memory-footprint benchmarks for color representations and bulk conversions.
+
+For each way of holding a large collection of colors, reports the bytes retained per
+color and the peak bytes allocated per color while building the collection; for each
+bulk conversion, reports the same for its result and the peak allocation while
+converting. Memory is measured with :mod:`tracemalloc`, so figures include only
+allocations made by Python, and inputs are built before tracing begins.
+
+Run with ``nox -s benchmarks_memory``, or directly with
+``python benchmarks/bench_memory.py`` (pass ``--help`` for options).
+
+"""
+import array
+import gc
+import random
+import sys
+import tracemalloc
+import typing
+
+import harness
+
+import webcolors
+
+
+def measure(build: typing.Callable[[], typing.Any]) -> typing.Tuple[int, int]:
+    """
+    Call a function with allocation tracing enabled, returning the number of bytes
+    still allocated once it returns (that is, retained by its result) and the peak
+    number of bytes allocated while it ran.
+
+    The function is first called once without tracing, so that lookup tables and
+    caches built on first use are not counted.
+
+    """
+    build()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def _drain(iterator: typing.Iterable) -> None:
+    """
+    Consume an iterator, discarding its values.
+
+    """
+    for _ in iterator:
+        pass
+
+
+def cases(
+    count: int,
+) -> typing.List[typing.Tuple[str, typing.Callable[[], typing.Any]]]:
+    """
+    Build the benchmark cases for a collection of ``count`` random colors.
+
+    """
+    rng = random.Random(1234)
+    packed = [rng.randrange(2**24) for _ in range(count)]
+    triplets = [(value >> 16, value >> 8 & 0xFF, value & 0xFF) for value in packed]
+    hexes = [f"#{value:06x}" for value in packed]
+    pixels = bytes(channel for triplet in triplets for channel in triplet)
+    records = webcolors.rgb_to_hex_records(triplets)
+    width = 1000 if count % 1000 == 0 else count
+
+    return [
+        # Representations.
+        ("IntegerRGB", lambda: [webcolors.IntegerRGB._make(t) for t in triplets]),
+        (
+            "HTML5SimpleColor",
+            lambda: list(map(webcolors.HTML5SimpleColor._make, triplets)),
+        ),
+        ("PercentRGB", lambda: list(map(webcolors.rgb_to_rgb_percent, triplets))),
+        ("tuple", lambda: [(red, green, blue) for red, green, blue in triplets]),
+        ("hex str", lambda: [f"#{value:06x}" for value in packed]),
+        ("packed int list", lambda: [int(value) + 0 for value in packed]),
+        ("packed int array", lambda: array.array("L", packed)),
+        ("RGB888 bytearray", lambda: bytearray(pixels)),
+        ("hex records bytearray", lambda: bytearray(records)),
+        # Bulk conversions.
+        ("hex_to_rgb list", lambda: list(map(webcolors.hex_to_rgb, hexes))),
+        ("rgb_to_hex list", lambda: list(map(webcolors.rgb_to_hex, triplets))),
+        (
+            "hex_records_to_rgb list",
+            lambda: list(webcolors.hex_records_to_rgb(records)),
+        ),
+        ("rgb_to_hex_records", lambda: webcolors.rgb_to_hex_records(triplets)),
+        ("hex_to_rgb_channels", lambda: webcolors.hex_to_rgb_channels(hexes)),
+        (
+            "hex_records_to_rgb_channels",
+            lambda: webcolors.hex_records_to_rgb_channels(records),
+        ),
+        (
+            "pixels_to_hex stream",
+            lambda: _drain(webcolors.pixels_to_hex(pixels, width)),
+        ),
+        (
+            "pixels_to_names stream",
+            lambda: _drain(webcolors.pixels_to_names(pixels, width)),
+        ),
+        (
+            "pixels_to_name_histogram",
+            lambda: webcolors.pixels_to_name_histogram(pixels),
+        ),
+        ("extract_palette", lambda: webcolors.extract_palette(pixels, count=8)),
+        (
+            "parallel_convert stream",
+            lambda: _drain(webcolors.parallel_convert(webcolors.hex_to_rgb, hexes)),
+        ),
+    ]
+
+
+def main() -> int:
+    """
+    Run the memory benchmarks from the command line, returning the exit status.
+
+    """
+    parser = harness.argument_parser(__doc__)
+    parser.add_argument("--count", type=int, default=100000, help="number of colors")
+    args = parser.parse_args()
+    baseline = harness.load_baseline(args)
+    results = {}
+    regressions = 0
+    print(f"{'case':<32} {'bytes/color':>12} {'peak/color':>12} {'peak MiB':>10}")
+    for name, build in cases(args.count):
+        if args.pattern and args.pattern not in name:
+            continue
+        retained, peak = measure(build)
+        results[name] = {"retained": retained, "peak": peak}
+        comparison = ""
+        for metric, value in results[name].items():
+            description, regressed = harness.compare(
+                args, baseline, name, metric, value
+            )
+            comparison += description
+            regressions += regressed
+        print(
+            f"{name:<32} {retained / args.count:>12.1f} {peak / args.count:>12.1f} "
+            f"{peak / 2**20:>10.2f}{comparison}",
+            flush=True,
+        )
+    return harness.finish(args, results, regressions)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
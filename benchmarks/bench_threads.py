@@ -0,0 +1,121 @@
+"""
+Multi-threaded contention benchmarks for webcolors.
+
+Reports, for each case, the mean time per value when the same work is shared
+out between 1, 2, 4 and 8 threads with a ThreadPoolExecutor, all using the same
+caches and tables, and the speedup over a single thread. With the GIL, no
+speedup is expected, but neither should time per value grow with the number of
+threads; on free-threaded builds of CPython, it should fall.
+
+Run with ``nox -s benchmarks_threads``, or directly with
+``python benchmarks/bench_threads.py`` (pass ``--help`` for options).
+
+"""
+import atexit
+import os
+import random
+import sys
+import tempfile
+import time
+import typing
+from concurrent import futures
+
+import harness
+
+import webcolors
+
+RANDOM = random.Random(1234)
+
+NAMED_HEX = list(webcolors.CSS3_HEX_TO_NAMES)
+
+THREADS = (1, 2, 4, 8)
+
+
+def _legacy_cache() -> webcolors.LegacyColorCache:
+    """
+    Return a legacy color cache, stored in a temporary file, holding every
+    value looked up by the benchmark.
+
+    """
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    cache = webcolors.LegacyColorCache(os.path.join(directory.name, "cache.db"))
+    atexit.register(cache.close)
+    cache.prewarm(webcolors.CSS3_NAMES_TO_HEX)
+    return cache
+
+
+def _cases() -> typing.Dict[str, typing.Tuple[typing.Callable, typing.List]]:
+    """
+    Return the function and inputs of each case. Each input is one value, and
+    is converted in full by one thread.
+
+    """
+    pixels = bytes(RANDOM.getrandbits(8) for _ in range(64 * 64 * 3))
+    cache = _legacy_cache()
+    names = list(webcolors.CSS3_NAMES_TO_HEX)
+    return {
+        "hex_to_name": (webcolors.hex_to_name, NAMED_HEX * 20),
+        "html5_parse_legacy_color": (webcolors.html5_parse_legacy_color, names * 20),
+        "pixels_to_names[nearest]": (
+            lambda buffer: list(webcolors.pixels_to_names(buffer, 64, nearest=True)),
+            [pixels] * 2,
+        ),
+        "LegacyColorCache.parse_many": (cache.parse_many, [names] * 20),
+    }
+
+
+def time_ns(function: typing.Callable, inputs: typing.List, threads: int) -> float:
+    """
+    Return the time per input, in nanoseconds, to convert every input once per
+    thread, with the given number of threads working at once.
+
+    """
+    with futures.ThreadPoolExecutor(threads) as executor:
+        # Start the threads, and warm the caches, before timing.
+        list(executor.map(function, inputs[:threads]))
+
+        def work(_: int) -> None:
+            """
+            Convert every input.
+
+            """
+            for value in inputs:
+                function(value)
+
+        start = time.perf_counter()
+        list(executor.map(work, range(threads)))
+        elapsed = time.perf_counter() - start
+    return elapsed * 1e9 / (len(inputs) * threads)
+
+
+def main() -> int:
+    """
+    Run the contention benchmarks from the command line, returning the exit
+    status.
+
+    """
+    parser = harness.argument_parser(__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    args = parser.parse_args()
+    baseline = harness.load_baseline(args)
+    results: typing.Dict[str, typing.Dict[str, float]] = {}
+    regressions = 0
+    print(f"{'case':<48} {'ns/value':>10} {'speedup':>8}")
+    for name, (function, inputs) in _cases().items():
+        if args.pattern and args.pattern not in name:
+            continue
+        single = 0.0
+        for threads in THREADS:
+            key = f"{name}[{threads}_threads]"
+            ns = min(time_ns(function, inputs, threads) for _ in range(args.repeat))
+            single = single or ns
+            results[key] = {"ns": ns, "speedup": single / ns}
+            comparison, regressed = harness.compare(args, baseline, key, "ns", ns)
+            regressions += regressed
+            print(f"{key:<48} {ns:>10.1f} {single / ns:>8.2f}{comparison}", flush=True)
+    return harness.finish(args, results, regressions)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Shared harness for the webcolors benchmarks.
+
+Each benchmark script defines a set of :class:`Case` instances, and hands them to
+:func:`main`, which times them and prints a report. Results can be saved as JSON with
+``--json PATH``, and compared against previously-saved results with ``--compare PATH``,
+in which case the script exits with a non-zero status if any case has become worse
+(slower, or larger) by more than the tolerance given by ``--tolerance`` (default
+25%).
+
+"""
+import argparse
+import json
+import sys
+import time
+import timeit
+import typing
+
+
+class Case(typing.NamedTuple):
+    """
+    A benchmark case: a function, and a list of inputs on which to call it.
+
+    ``ValueError`` raised by the function is caught and ignored, so that cases may
+    include invalid inputs. Each input counts as ``values_per_input`` values when
+    reporting throughput, for functions which convert many values per call.
+
+    """
+
+    function: str
+    label: str
+    call: typing.Callable[[typing.Any], typing.Any]
+    inputs: typing.Sequence[typing.Any]
+    values_per_input: int = 1
+
+
+class Result(typing.NamedTuple):
+    """
+    The timings of a benchmark case, in nanoseconds per value.
+
+    """
+
+    function: str
+    label: str
+    mean_ns: float
+    p50_ns: float
+    p99_ns: float
+
+    @property
+    def key(self) -> str:
+        """
+        The key identifying this case in saved results.
+
+        """
+        return f"{self.function}[{self.label}]"
+
+
+def _run(case: Case) -> None:
+    """
+    Call the function of a case once on each of its inputs.
+
+    """
+    for value in case.inputs:
+        try:
+            case.call(value)
+        except ValueError:
+            pass
+
+
+def _latencies(case: Case, rounds: int) -> typing.List[float]:
+    """
+    Time each input of a case individually, over several rounds, returning the
+    sorted per-value latencies in nanoseconds.
+
+    """
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(rounds):
+        for value in case.inputs:
+            start = clock()
+            try:
+                case.call(value)
+            except ValueError:
+                pass
+            samples.append((clock() - start) / case.values_per_input)
+    return sorted(samples)
+
+
+def time_case(case: Case, repeat: int = 5, rounds: int = 50) -> Result:
+    """
+    Time a benchmark case: mean throughput from the best of ``repeat`` timeit runs,
+    and latency percentiles from timing each input individually.
+
+    """
+    timer = timeit.Timer(lambda: _run(case))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number))
+    values = number * len(case.inputs) * case.values_per_input
+    samples = _latencies(case, max(1, rounds // case.values_per_input))
+    return Result(
+        case.function,
+        case.label,
+        best / values * 1e9,
+        samples[len(samples) // 2],
+        samples[min(len(samples) - 1, len(samples) * 99 // 100)],
+    )
+
+
+def argument_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Return a parser for the command-line options shared by all benchmark scripts.
+
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("-k", dest="pattern", help="only run cases matching PATTERN")
+    parser.add_argument("--json", help="save results as JSON to this file")
+    parser.add_argument("--compare", help="compare with JSON results in this file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser
+
+
+def load_baseline(args: argparse.Namespace) -> typing.Dict[str, typing.Dict]:
+    """
+    Load the results to compare against, if any were given.
+
+    """
+    if not args.compare:
+        return {}
+    with open(args.compare, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare(
+    args: argparse.Namespace, baseline: typing.Dict, key: str, metric: str, value: float
+) -> typing.Tuple[str, bool]:
+    """
+    Compare one metric of a case with the baseline, returning a description of the
+    ratio between them and whether it exceeds the tolerance.
+
+    """
+    if key not in baseline or not baseline[key][metric]:
+        return "", False
+    ratio = value / baseline[key][metric]
+    regressed = ratio > 1 + args.tolerance
+    return f"  x{ratio:.2f}{' WORSE' if regressed else ''}", regressed
+
+
+def finish(args: argparse.Namespace, results: typing.Dict, regressions: int) -> int:
+    """
+    Save the results if requested, and return the exit status.
+
+    """
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+    if regressions:
+        print(f"{regressions} case(s) worse than the baseline.", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main(cases: typing.Sequence[Case], description: str) -> int:
+    """
+    Run benchmark cases from the command line, returning the exit status.
+
+    """
+    args = argument_parser(description).parse_args()
+    baseline = load_baseline(args)
+    results = {}
+    regressions = 0
+    print(
+        f"{'case':<58} {'ns/value':>10} {'p50 ns':>10} {'p99 ns':>10} {'Mvalue/s':>9}"
+    )
+    for case in cases:
+        if args.pattern and args.pattern not in f"{case.function}[{case.label}]":
+            continue
+        result = time_case(case)
+        results[result.key] = result._asdict()
+        comparison, regressed = compare(
+            args, baseline, result.key, "mean_ns", result.mean_ns
+        )
+        regressions += regressed
+        print(
+            f"{result.key:<58} {result.mean_ns:>10.1f} {result.p50_ns:>10.1f} "
+            f"{result.p99_ns:>10.1f} {1e3 / result.mean_ns:>9.3f}{comparison}",
+            flush=True,
+        )
+    return finish(args, results, regressions)
@@ -18,7 +18,7 @@ import typing
 import nox
 
 nox.options.default_venv_backend = "venv"
-nox.options.keywords = "not release"
+nox.options.keywords = "not release and not benchmarks"
 nox.options.reuse_existing_virtualenvs = True
 
 
@@ -94,10 +94,99 @@ def tests_full_colors(session: nox.Session) -> None:
     """
     Run the full color conversion test suite (slow/CPU-intensive).
 
+    The color space is checked in parallel across all CPUs. To check only one shard of
+    it, pass the shard as ``I/N``, for example ``nox -s tests_full_colors -- 3/8``.
+
     """
     session.install(".[tests]")
     session.run(
-        f"python{session.python}", "-Im", "pytest", "-vv", "tests/full_colors.py"
+        f"python{session.python}",
+        "-Im",
+        "pytest",
+        "-vv",
+        "tests/full_colors.py",
+        env={"WEBCOLORS_FULL_COLORS_SHARD": session.posargs[0]}
+        if session.posargs
+        else {},
+    )
+    clean()
+
+
+# Benchmarks.
+# -----------------------------------------------------------------------------------
+
+
+@nox.session(python=["3.11"], tags=["benchmarks"])
+def benchmarks(session: nox.Session) -> None:
+    """
+    Benchmark the throughput and latency of every public function.
+
+    Arguments are passed through to the benchmark script; for example, to save the
+    results and compare a later run against them::
+
+        nox -s benchmarks -- --json baseline.json
+        nox -s benchmarks -- --compare baseline.json
+
+    """
+    session.install(".")
+    session.run(
+        f"python{session.python}",
+        "benchmarks/bench_functions.py",
+        *session.posargs,
+    )
+    clean()
+
+
+@nox.session(python=["3.11"], tags=["benchmarks"])
+def benchmarks_memory(session: nox.Session) -> None:
+    """
+    Benchmark the memory footprint of color representations and bulk conversions.
+
+    Arguments are passed through to the benchmark script, as for the ``benchmarks``
+    session; in addition, ``--count N`` sets the number of colors to hold.
+
+    """
+    session.install(".")
+    session.run(
+        f"python{session.python}",
+        "benchmarks/bench_memory.py",
+        *session.posargs,
+    )
+    clean()
+
+
+@nox.session(python=["3.11"], tags=["benchmarks"])
+def benchmarks_import(session: nox.Session) -> None:
+    """
+    Benchmark the time taken to import webcolors and make first use of it.
+
+    Arguments are passed through to the benchmark script, as for the ``benchmarks``
+    session; in addition, ``--runs N`` sets the number of runs per case.
+
+    """
+    session.install(".")
+    session.run(
+        f"python{session.python}",
+        "benchmarks/bench_import.py",
+        *session.posargs,
+    )
+    clean()
+
+
+@nox.session(python=["3.11"], tags=["benchmarks"])
+def benchmarks_threads(session: nox.Session) -> None:
+    """
+    Benchmark conversions sharing webcolors' caches between several threads.
+
+    Arguments are passed through to the benchmark script, as for the ``benchmarks``
+    session; in addition, ``--repeat N`` sets the number of runs per case.
+
+    """
+    session.install(".")
+    session.run(
+        f"python{session.python}",
+        "benchmarks/bench_threads.py",
+        *session.posargs,
     )
     clean()
 
@@ -142,6 +231,7 @@ def docs_docstrings(session: nox.Session) -> None:
         "-Im",
         "interrogate",
         "-v",
+        "benchmarks/",
         "src/",
         "tests/",
         "noxfile.py",
@@ -226,6 +316,7 @@ def format_black(session: nox.Session) -> None:
         "black",
         "--check",
         "--diff",
+        "benchmarks/",
         "src/",
         "tests/",
         "docs/",
@@ -248,6 +339,7 @@ def format_isort(session: nox.Session) -> None:
         "isort",
         "--check-only",
         "--diff",
+        "benchmarks/",
         "src/",
         "tests/",
         "docs/",
@@ -293,6 +385,7 @@ def lint_flake8(session: nox.Session) -> None:
         f"python{session.python}",
         "-Im",
         "flake8",
+        "benchmarks/",
         "src/",
         "tests/",
         "docs/",
@@ -7,45 +7,118 @@ See documentation (in docs/ directory of source distribution) for
 details of the supported formats, conventions and conversions.
 
 """
-from .constants import (
-    CSS2,
-    CSS2_HEX_TO_NAMES,
-    CSS2_NAMES_TO_HEX,
-    CSS3,
-    CSS3_HEX_TO_NAMES,
-    CSS3_NAMES_TO_HEX,
-    CSS21,
-    CSS21_HEX_TO_NAMES,
-    CSS21_NAMES_TO_HEX,
-    HTML4,
-    HTML4_HEX_TO_NAMES,
-    HTML4_NAMES_TO_HEX,
-)
-from .conversion import (
-    hex_to_name,
-    hex_to_rgb,
-    hex_to_rgb_percent,
-    name_to_hex,
-    name_to_rgb,
-    name_to_rgb_percent,
-    rgb_percent_to_hex,
-    rgb_percent_to_name,
-    rgb_percent_to_rgb,
-    rgb_to_hex,
-    rgb_to_name,
-    rgb_to_rgb_percent,
-)
-from .html5 import (
-    html5_parse_legacy_color,
-    html5_parse_simple_color,
-    html5_serialize_simple_color,
-)
-from .normalization import (
-    normalize_hex,
-    normalize_integer_triplet,
-    normalize_percent_triplet,
-)
-from .types import HTML5SimpleColor, IntegerRGB, IntTuple, PercentRGB, PercentTuple
+import importlib
+
+# The submodules are imported on first use of one of their names, rather than
+# when webcolors is imported, to keep "import webcolors" fast. This block lets
+# type checkers see the names anyway; its condition is a private name, rather
+# than typing.TYPE_CHECKING, so that typing is not imported either.
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:  # pragma: no cover
+    from .aio import async_convert, async_convert_lines
+    from .batch import parallel_convert
+    from .buffers import (
+        hex_records_to_rgb,
+        hex_records_to_rgb_channels,
+        hex_to_rgb_channels,
+        rgb_to_hex_records,
+    )
+    from .bulk import convert_file, merge_files, shard_file
+    from .cache import LegacyColorCache
+
+    # The mappings of hexadecimal values to names are built by __getattr__().
+    from .constants import (  # pylint: disable=no-name-in-module
+        CSS2,
+        CSS2_HEX_TO_NAMES,
+        CSS2_NAMES_TO_HEX,
+        CSS3,
+        CSS3_HEX_TO_NAMES,
+        CSS3_NAMES_TO_HEX,
+        CSS21,
+        CSS21_HEX_TO_NAMES,
+        CSS21_NAMES_TO_HEX,
+        HTML4,
+        HTML4_HEX_TO_NAMES,
+        HTML4_NAMES_TO_HEX,
+    )
+    from .conversion import (
+        hex_to_name,
+        hex_to_names,
+        hex_to_rgb,
+        hex_to_rgb_percent,
+        name_to_hex,
+        name_to_rgb,
+        name_to_rgb_percent,
+        rgb_percent_to_hex,
+        rgb_percent_to_name,
+        rgb_percent_to_rgb,
+        rgb_to_hex,
+        rgb_to_name,
+        rgb_to_rgb_percent,
+    )
+    from .html5 import (
+        html5_parse_legacy_color,
+        html5_parse_simple_color,
+        html5_serialize_simple_color,
+    )
+    from .instrumentation import (
+        disable_instrumentation,
+        disable_sampling,
+        enable_instrumentation,
+        enable_sampling,
+        instrumentation_snapshot,
+        instrumentation_to_prometheus,
+        reset_instrumentation,
+        sampled_calls,
+    )
+    from .iterators import (
+        iter_hex_to_name,
+        iter_hex_to_names,
+        iter_hex_to_rgb,
+        iter_hex_to_rgb_percent,
+        iter_name_to_hex,
+        iter_name_to_rgb,
+        iter_name_to_rgb_percent,
+        iter_rgb_percent_to_hex,
+        iter_rgb_percent_to_name,
+        iter_rgb_percent_to_rgb,
+        iter_rgb_to_hex,
+        iter_rgb_to_name,
+        iter_rgb_to_rgb_percent,
+    )
+    from .normalization import (
+        normalize_hex,
+        normalize_integer_triplet,
+        normalize_percent_triplet,
+    )
+    from .palette import extract_palette
+    from .pixels import (
+        pixels_to_hex,
+        pixels_to_ints,
+        pixels_to_name_histogram,
+        pixels_to_names,
+    )
+    from .shared import SharedTables
+    from .types import (
+        BytesLike,
+        CallSample,
+        HTML5SimpleColor,
+        IntegerRGB,
+        IntTuple,
+        PaletteColor,
+        PercentRGB,
+        PercentTuple,
+        RGBChannels,
+    )
+    from .warmup import (
+        cache_manifest,
+        cache_statistics,
+        disable_legacy_cache,
+        disable_spelling_index,
+        enable_legacy_cache,
+        enable_spelling_index,
+        prewarm_caches,
+    )
 
 __version__ = "1.13"
 
@@ -66,6 +139,7 @@ __all__ = [
     "name_to_rgb",
     "name_to_rgb_percent",
     "hex_to_name",
+    "hex_to_names",
     "hex_to_rgb",
     "hex_to_rgb_percent",
     "rgb_to_hex",
@@ -77,12 +151,197 @@ __all__ = [
     "html5_parse_simple_color",
     "html5_parse_legacy_color",
     "html5_serialize_simple_color",
+    "hex_records_to_rgb",
+    "rgb_to_hex_records",
+    "hex_to_rgb_channels",
+    "hex_records_to_rgb_channels",
+    "iter_name_to_hex",
+    "iter_name_to_rgb",
+    "iter_name_to_rgb_percent",
+    "iter_hex_to_name",
+    "iter_hex_to_names",
+    "iter_hex_to_rgb",
+    "iter_hex_to_rgb_percent",
+    "iter_rgb_to_hex",
+    "iter_rgb_to_name",
+    "iter_rgb_to_rgb_percent",
+    "iter_rgb_percent_to_hex",
+    "iter_rgb_percent_to_name",
+    "iter_rgb_percent_to_rgb",
+    "pixels_to_hex",
+    "pixels_to_ints",
+    "pixels_to_names",
+    "pixels_to_name_histogram",
+    "extract_palette",
+    "parallel_convert",
+    "async_convert",
+    "async_convert_lines",
+    "convert_file",
+    "shard_file",
+    "merge_files",
+    "LegacyColorCache",
+    "SharedTables",
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "reset_instrumentation",
+    "instrumentation_snapshot",
+    "instrumentation_to_prometheus",
+    "enable_sampling",
+    "disable_sampling",
+    "sampled_calls",
+    "prewarm_caches",
+    "enable_legacy_cache",
+    "disable_legacy_cache",
+    "enable_spelling_index",
+    "disable_spelling_index",
+    "cache_statistics",
+    "cache_manifest",
     "normalize_hex",
     "normalize_integer_triplet",
     "normalize_percent_triplet",
     "IntegerRGB",
     "PercentRGB",
     "HTML5SimpleColor",
+    "PaletteColor",
+    "CallSample",
+    "RGBChannels",
     "IntTuple",
     "PercentTuple",
+    "BytesLike",
 ]
+
+# The submodule providing each public name.
+_SUBMODULES = {
+    "aio": ("async_convert", "async_convert_lines"),
+    "batch": ("parallel_convert",),
+    "buffers": (
+        "hex_records_to_rgb",
+        "rgb_to_hex_records",
+        "hex_to_rgb_channels",
+        "hex_records_to_rgb_channels",
+    ),
+    "bulk": ("convert_file", "shard_file", "merge_files"),
+    "cache": ("LegacyColorCache",),
+    "constants": (
+        "HTML4",
+        "CSS2",
+        "CSS21",
+        "CSS3",
+        "HTML4_NAMES_TO_HEX",
+        "HTML4_HEX_TO_NAMES",
+        "CSS2_NAMES_TO_HEX",
+        "CSS2_HEX_TO_NAMES",
+        "CSS21_HEX_TO_NAMES",
+        "CSS21_NAMES_TO_HEX",
+        "CSS3_HEX_TO_NAMES",
+        "CSS3_NAMES_TO_HEX",
+    ),
+    "conversion": (
+        "name_to_hex",
+        "name_to_rgb",
+        "name_to_rgb_percent",
+        "hex_to_name",
+        "hex_to_names",
+        "hex_to_rgb",
+        "hex_to_rgb_percent",
+        "rgb_to_hex",
+        "rgb_to_name",
+        "rgb_to_rgb_percent",
+        "rgb_percent_to_hex",
+        "rgb_percent_to_name",
+        "rgb_percent_to_rgb",
+    ),
+    "html5": (
+        "html5_parse_simple_color",
+        "html5_parse_legacy_color",
+        "html5_serialize_simple_color",
+    ),
+    "instrumentation": (
+        "enable_instrumentation",
+        "disable_instrumentation",
+        "reset_instrumentation",
+        "instrumentation_snapshot",
+        "instrumentation_to_prometheus",
+        "enable_sampling",
+        "disable_sampling",
+        "sampled_calls",
+    ),
+    "iterators": (
+        "iter_name_to_hex",
+        "iter_name_to_rgb",
+        "iter_name_to_rgb_percent",
+        "iter_hex_to_name",
+        "iter_hex_to_names",
+        "iter_hex_to_rgb",
+        "iter_hex_to_rgb_percent",
+        "iter_rgb_to_hex",
+        "iter_rgb_to_name",
+        "iter_rgb_to_rgb_percent",
+        "iter_rgb_percent_to_hex",
+        "iter_rgb_percent_to_name",
+        "iter_rgb_percent_to_rgb",
+    ),
+    "normalization": (
+        "normalize_hex",
+        "normalize_integer_triplet",
+        "normalize_percent_triplet",
+    ),
+    "palette": ("extract_palette",),
+    "pixels": (
+        "pixels_to_hex",
+        "pixels_to_ints",
+        "pixels_to_names",
+        "pixels_to_name_histogram",
+    ),
+    "shared": ("SharedTables",),
+    "types": (
+        "IntegerRGB",
+        "PercentRGB",
+        "HTML5SimpleColor",
+        "PaletteColor",
+        "CallSample",
+        "RGBChannels",
+        "IntTuple",
+        "PercentTuple",
+        "BytesLike",
+    ),
+    "warmup": (
+        "prewarm_caches",
+        "enable_legacy_cache",
+        "disable_legacy_cache",
+        "enable_spelling_index",
+        "disable_spelling_index",
+        "cache_statistics",
+        "cache_manifest",
+    ),
+}
+
+_EXPORTS = {
+    name: submodule for submodule, names in _SUBMODULES.items() for name in names
+}
+
+
+def __getattr__(name: str):
+    """
+    Import the submodule providing a public name on first use of the name, or
+    the submodule itself on first use of its name.
+
+    """
+    if name in _SUBMODULES:
+        # Importing a submodule also sets it as an attribute of the package.
+        return importlib.import_module(f".{name}", __name__)
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache the value, so that __getattr__ is only called once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    List the public names, including those not yet imported.
+
+    """
+    return sorted(set(globals()) | set(__all__))
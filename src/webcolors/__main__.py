@@ -0,0 +1,10 @@
+"""
+Entry point for running webcolors' command-line interface as ``python -m
+webcolors``.
+
+"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Conversion of streams of color values in :mod:`asyncio` applications.
+
+"""
+import asyncio
+import concurrent.futures
+import typing
+
+from . import batch
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+
+async def _convert_batch(
+    function: typing.Callable[[T], R],
+    values: typing.List[T],
+    offload_threshold: int,
+    executor: typing.Optional[concurrent.futures.Executor],
+    errors: str,
+) -> typing.List[typing.Optional[R]]:
+    """
+    Internal helper which converts one micro-batch of values, either inline or
+    (if the batch is large enough) in an executor.
+
+    """
+    # pylint: disable=protected-access
+    if len(values) < offload_threshold:
+        results = batch._convert_chunk(function, values, errors)
+        # Let other tasks run between inline batches.
+        await asyncio.sleep(0)
+        return results
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, batch._convert_chunk, function, values, errors
+    )
+
+
+def _check_batching(
+    size_name: str, size: int, offload_threshold: int, errors: str
+) -> None:
+    """
+    Internal helper which validates the batching arguments of the asynchronous
+    conversion functions, naming the argument which limits the size of each
+    batch as ``size_name`` in errors.
+
+    """
+    batch._check_errors(errors)  # pylint: disable=protected-access
+    if size < 1:
+        raise ValueError(f"{size_name} must be at least 1, not {size}.")
+    if offload_threshold < 1:
+        raise ValueError(
+            f"Offload threshold must be at least 1, not {offload_threshold}."
+        )
+
+
+async def async_convert(
+    function: typing.Callable[[T], R],
+    values: typing.AsyncIterable[T],
+    *,
+    batch_size: int = 256,
+    offload_threshold: int = 256,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    errors: str = "strict",
+) -> typing.AsyncIterator[typing.Optional[R]]:
+    """
+    Apply a conversion function to each value of an asynchronous iterable,
+    yielding the results in order.
+
+    Values are collected into micro-batches of up to ``batch_size`` values.
+    Batches of at least ``offload_threshold`` values are converted in an
+    executor (by default, the event loop's default executor), so that the
+    event loop remains responsive while they are converted; smaller batches
+    are converted inline. Values are only read from the input as results are
+    consumed, so a slow consumer applies backpressure to the input.
+
+    Any function of one argument can be used; see
+    :func:`~webcolors.parallel_convert` for details, and for the meaning of
+    ``errors``.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import asyncio
+        >>> async def colors():
+        ...     for value in ("#fff", "#123456", "#000080"):
+        ...         yield value
+        >>> async def main():
+        ...     return [
+        ...         name
+        ...         async for name in async_convert(
+        ...             hex_to_name, colors(), errors="replace"
+        ...         )
+        ...     ]
+        >>> asyncio.run(main())
+        ['white', None, 'navy']
+
+    :param function: The conversion function to apply.
+    :param values: The values to convert.
+    :param batch_size: The maximum number of values converted at a time.
+       Default is ``256``.
+    :param offload_threshold: The number of values in a batch at or above
+       which it is converted in the executor. Default is ``256``.
+    :param executor: The executor in which to convert large batches. Default
+       is the event loop's default executor.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``batch_size`` or ``offload_threshold`` is less
+       than 1, when ``errors`` is not a supported policy, or (with the
+       ``"strict"`` policy) when a value cannot be converted.
+
+    """
+    # pylint: disable=too-many-arguments
+    _check_batching("Batch size", batch_size, offload_threshold, errors)
+    values_batch: typing.List[T] = []
+    async for value in values:
+        values_batch.append(value)
+        if len(values_batch) == batch_size:
+            for result in await _convert_batch(
+                function, values_batch, offload_threshold, executor, errors
+            ):
+                yield result
+            values_batch = []
+    if values_batch:
+        for result in await _convert_batch(
+            function, values_batch, offload_threshold, executor, errors
+        ):
+            yield result
+
+
+async def async_convert_lines(
+    function: typing.Callable[[str], R],
+    reader: asyncio.StreamReader,
+    *,
+    read_size: int = 65536,
+    offload_threshold: int = 256,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    errors: str = "strict",
+    encoding: str = "utf-8",
+) -> typing.AsyncIterator[typing.Optional[R]]:
+    """
+    Apply a conversion function to each line of an
+    :class:`asyncio.StreamReader`, yielding the results in order.
+
+    The stream is read ``read_size`` bytes at a time, and all of the complete
+    lines in each read are converted as one micro-batch, in the same way as
+    :func:`~webcolors.async_convert`. Each line is decoded and stripped of
+    surrounding whitespace before conversion, and blank lines are skipped.
+
+    :param function: The conversion function to apply.
+    :param reader: The stream to read values from, one per line.
+    :param read_size: The maximum number of bytes read at a time. Default is
+       ``65536``.
+    :param offload_threshold: The number of values in a batch at or above
+       which it is converted in the executor. Default is ``256``.
+    :param executor: The executor in which to convert large batches. Default
+       is the event loop's default executor.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :param encoding: The encoding of the stream. Default is ``"utf-8"``.
+    :raises ValueError: when ``read_size`` or ``offload_threshold`` is less
+       than 1, when ``errors`` is not a supported policy, or (with the
+       ``"strict"`` policy) when a value cannot be converted.
+
+    """
+    # pylint: disable=too-many-arguments
+    _check_batching("Read size", read_size, offload_threshold, errors)
+    # The reads since the end of the last complete line, joined once the line
+    # is complete, rather than one at a time.
+    pending: typing.List[bytes] = []
+    while True:
+        data = await reader.read(read_size)
+        pending.append(data)
+        if data and b"\n" not in data:
+            continue
+        lines = b"".join(pending).split(b"\n")
+        # The last line is incomplete until the stream is exhausted.
+        pending = [lines.pop()] if data else []
+        values = [line.decode(encoding).strip() for line in lines]
+        values_batch = [value for value in values if value]
+        if values_batch:
+            for result in await _convert_batch(
+                function, values_batch, offload_threshold, executor, errors
+            ):
+                yield result
+        if not data:
+            break
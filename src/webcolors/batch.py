@@ -0,0 +1,196 @@
+"""
+Conversion of large batches of color values.
+
+"""
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import typing
+
+from . import constants
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+C = typing.TypeVar("C")
+
+
+def _check_errors(errors: str) -> None:
+    """
+    Internal helper which raises :exc:`ValueError` if ``errors`` is not a
+    supported error policy.
+
+    """
+    if errors not in constants.SUPPORTED_ERROR_POLICIES:
+        raise ValueError(constants.ERROR_POLICY_ERROR_TEMPLATE.format(errors=errors))
+
+
+def _convert(
+    function: typing.Callable[[T], R], values: typing.Iterable[T], errors: str
+) -> typing.Iterator[typing.Optional[R]]:
+    """
+    Internal helper which lazily applies a conversion function to each of a
+    sequence of values, handling any :exc:`ValueError` according to the given
+    error policy: ``"strict"`` re-raises it, ``"replace"`` yields
+    :data:`None` in place of the result, and ``"ignore"`` skips the value.
+
+    """
+    if errors == "strict":
+        yield from map(function, values)
+        return
+    for value in values:
+        try:
+            result = function(value)
+        except ValueError:
+            if errors == "replace":
+                yield None
+            continue
+        yield result
+
+
+def _convert_chunk(
+    function: typing.Callable[[T], R], chunk: typing.List[T], errors: str
+) -> typing.List[typing.Optional[R]]:
+    """
+    Internal helper which converts one chunk of values in a worker.
+
+    """
+    return list(_convert(function, chunk, errors))
+
+
+def _chunks(
+    values: typing.Iterable[T], chunk_size: int
+) -> typing.Iterator[typing.List[T]]:
+    """
+    Internal helper which splits an iterable into lists of at most
+    ``chunk_size`` values.
+
+    """
+    iterator = iter(values)
+    chunk = list(itertools.islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+
+def _bounded_map(
+    executor: concurrent.futures.Executor,
+    max_workers: int,
+    function: typing.Callable[[T], R],
+    items: typing.Iterable[typing.Tuple[C, T]],
+) -> typing.Iterator[typing.Tuple[C, R]]:
+    """
+    Internal generator which calls a function in an executor of
+    ``max_workers`` workers with the argument of each pair of a context and an
+    argument, yielding each context with the result, in the order given.
+
+    """
+    # Keep at most two calls per worker in flight, so that memory use is
+    # bounded regardless of the size of the input.
+    window = 2 * max_workers
+    pending: typing.Deque[
+        typing.Tuple[C, concurrent.futures.Future]
+    ] = collections.deque()
+    for context, argument in items:
+        pending.append((context, executor.submit(function, argument)))
+        if len(pending) >= window:
+            context, future = pending.popleft()
+            yield context, future.result()
+    while pending:
+        context, future = pending.popleft()
+        yield context, future.result()
+
+
+def _parallel_convert(
+    function: typing.Callable[[T], R],
+    chunks: typing.Iterable[typing.List[T]],
+    executor_class: typing.Type[concurrent.futures.Executor],
+    max_workers: int,
+    errors: str,
+) -> typing.Iterator[typing.Optional[R]]:
+    """
+    Internal generator implementing :func:`~webcolors.parallel_convert`.
+
+    """
+    convert_chunk = functools.partial(_convert_chunk, function, errors=errors)
+    with executor_class(max_workers) as executor:
+        for _, results in _bounded_map(
+            executor, max_workers, convert_chunk, ((None, chunk) for chunk in chunks)
+        ):
+            yield from results
+
+
+def parallel_convert(
+    function: typing.Callable[[T], R],
+    values: typing.Iterable[T],
+    *,
+    chunk_size: int = 4096,
+    max_workers: typing.Optional[int] = None,
+    processes: bool = False,
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[R]]:
+    """
+    Apply a conversion function to each of a large sequence of values, split
+    into chunks which are converted in a pool of threads or processes, and
+    return an iterator over the results in the same order as the input.
+
+    Any function of one argument can be used, including any of the
+    conversion, normalization and HTML5 functions of webcolors; to pass
+    additional arguments, such as a ``spec``, use
+    :func:`functools.partial`. The input is consumed lazily, and at most two
+    chunks per worker are in flight at any time.
+
+    Values which cannot be converted (that is, for which the function raises
+    :exc:`ValueError`) are handled according to ``errors``: ``"strict"``
+    (the default) raises the exception, ``"replace"`` gives :data:`None` as
+    the result for that value, and ``"ignore"`` omits the value from the
+    results.
+
+    .. note:: **Threads and processes**
+
+       Because the conversions are CPU-bound Python code, a pool of threads
+       only speeds up conversion on free-threaded builds of CPython. Pass
+       ``processes=True`` to use a pool of processes instead, in which case
+       the function and values must be picklable (module-level functions,
+       and :func:`functools.partial` objects wrapping them, are).
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(parallel_convert(rgb_to_hex, [(255, 255, 255), (0, 0, 128)]))
+        ['#ffffff', '#000080']
+        >>> list(parallel_convert(hex_to_name, ["#fff", "#123456"], errors="replace"))
+        ['white', None]
+
+    :param function: The conversion function to apply.
+    :param values: The values to convert.
+    :param chunk_size: The number of values sent to a worker at a time.
+       Default is ``4096``.
+    :param max_workers: The number of threads or processes to use. Default is
+       the number of CPUs.
+    :param processes: Whether to use a pool of processes rather than threads.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``chunk_size`` or ``max_workers`` is less than 1,
+       when ``errors`` is not a supported policy, or (on iteration, with the
+       ``"strict"`` policy) when a value cannot be converted.
+
+    """
+    # pylint: disable=too-many-arguments
+    _check_errors(errors)
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, not {chunk_size}.")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError(f"Worker count must be at least 1, not {max_workers}.")
+    executor_class = (
+        concurrent.futures.ProcessPoolExecutor
+        if processes
+        else concurrent.futures.ThreadPoolExecutor
+    )
+    return _parallel_convert(
+        function, _chunks(values, chunk_size), executor_class, max_workers, errors
+    )
@@ -0,0 +1,226 @@
+"""
+Bulk conversion of hexadecimal color values stored in, or converted to,
+bytes-like buffers.
+
+"""
+import binascii
+import itertools
+import typing
+
+from . import conversion, normalization, types
+
+
+def _record_count(view: memoryview, stride: int, offset: int) -> int:
+    """
+    Internal helper which returns the number of fixed-stride records in a
+    buffer, raising :exc:`ValueError` for a stride shorter than a record, for
+    a negative offset, or for a truncated record at the end of the buffer.
+
+    """
+    if stride < 7:
+        raise ValueError(f"Record stride must be at least 7 bytes, not {stride}.")
+    if offset < 0:
+        raise ValueError(f"Record offset must be at least 0, not {offset}.")
+    count = len(range(offset, len(view) - 6, stride))
+    # Anything but trailing whitespace where the next record would start is
+    # the beginning of a record too short to parse.
+    remainder = bytes(view[offset + count * stride :]).strip()
+    if remainder:
+        raise ValueError(
+            f'"{remainder.decode("ascii", "replace")}" is not a valid '
+            f"hexadecimal color value."
+        )
+    return count
+
+
+def hex_records_to_rgb(
+    buffer: types.BytesLike, stride: int = 7, offset: int = 0
+) -> typing.Iterator[types.IntegerRGB]:
+    """
+    Parse a sequence of fixed-stride hexadecimal color values out of a
+    single bytes-like buffer, yielding a 3-:class:`tuple` of :class:`int`
+    for each one.
+
+    Each record must consist of the ASCII character ``#`` followed by
+    six hexadecimal digits, and records must begin every ``stride``
+    bytes; any bytes in between (such as newlines or other separators)
+    are skipped. Records are parsed directly out of the buffer, without
+    creating an intermediate :class:`str` for each color value.
+
+    Examples:
+
+    .. doctest::
+
+        >>> colors = hex_records_to_rgb(b"#ffffff\\n#000080\\n", stride=8)
+        >>> next(colors)
+        IntegerRGB(red=255, green=255, blue=255)
+        >>> next(colors)
+        IntegerRGB(red=0, green=0, blue=128)
+        >>> list(hex_records_to_rgb(b"#ffffff,#0000gg", stride=8))
+        Traceback (most recent call last):
+            ...
+        ValueError: "#0000gg" is not a valid hexadecimal color value.
+
+    :param buffer: The buffer to read color values from.
+    :param stride: The distance in bytes between the start of each record.
+       Default is ``7``, meaning records are packed with no separators.
+    :param offset: The position in the buffer of the first record.
+    :raises ValueError: when ``stride`` is smaller than a record, when
+       ``offset`` is negative, when any record is not a valid six-digit
+       hexadecimal color value, or when the buffer ends with a truncated
+       record.
+
+    """
+    view = memoryview(buffer).cast("B")
+    count = _record_count(view, stride, offset)
+    for start in range(offset, offset + count * stride, stride):
+        # pylint: disable=protected-access
+        yield normalization._hex_bytes_to_rgb(view[start : start + 7])
+
+
+def _split_channels(rgb: bytes) -> types.RGBChannels:
+    """
+    Internal helper which splits interleaved RGB888 values into a separate
+    array of each channel's values.
+
+    """
+    return types.RGBChannels(rgb[0::3], rgb[1::3], rgb[2::3])
+
+
+def _slow_channels(
+    rgb_triplets: typing.Iterable[types.IntegerRGB],
+) -> types.RGBChannels:
+    """
+    Internal helper which converts integer triplets to channel arrays, for
+    values which cannot be converted all at once.
+
+    """
+    return _split_channels(bytes(itertools.chain.from_iterable(rgb_triplets)))
+
+
+def hex_to_rgb_channels(
+    hex_values: typing.Iterable[typing.Union[str, types.BytesLike]]
+) -> types.RGBChannels:
+    """
+    Convert many hexadecimal color values to a separate, contiguous array of
+    each channel's values, rather than to a triplet per color.
+
+    Channel arrays are much smaller than a list of triplets, and can be used
+    directly by code working on one channel at a time (for example, with
+    :class:`memoryview` or :func:`numpy.frombuffer`). When every value is a
+    six-digit :class:`str`, they are decoded all at once.
+
+    Examples:
+
+    .. doctest::
+
+        >>> channels = hex_to_rgb_channels(["#ffffff", "#000080", "#F00"])
+        >>> list(channels.red), list(channels.green), list(channels.blue)
+        ([255, 0, 255], [255, 0, 0], [255, 128, 0])
+        >>> channels.blue
+        b'\\xff\\x80\\x00'
+
+    :param hex_values: The hexadecimal color values to convert.
+    :raises ValueError: when any value is not a valid hexadecimal color value.
+
+    """
+    hex_values = list(hex_values)
+    count = len(hex_values)
+    try:
+        if set(map(len, hex_values)) <= {7}:
+            joined = "".join(hex_values)
+            if joined[::7] == "#" * count:
+                rgb = bytes.fromhex(joined.replace("#", ""))
+                # fromhex() skips whitespace, which would leave too few bytes.
+                if len(rgb) == 3 * count:
+                    return _split_channels(rgb)
+    except (TypeError, ValueError):
+        pass
+    return _slow_channels(map(conversion.hex_to_rgb, hex_values))
+
+
+def hex_records_to_rgb_channels(
+    buffer: types.BytesLike, stride: int = 7, offset: int = 0
+) -> types.RGBChannels:
+    """
+    Parse a sequence of fixed-stride hexadecimal color values out of a
+    single bytes-like buffer, as for :func:`~webcolors.hex_records_to_rgb`,
+    returning a separate, contiguous array of each channel's values (as
+    for :func:`~webcolors.hex_to_rgb_channels`) rather than a triplet per
+    color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> channels = hex_records_to_rgb_channels(b"#ffffff\\n#000080\\n", stride=8)
+        >>> list(channels.red), list(channels.green), list(channels.blue)
+        ([255, 0], [255, 0], [255, 128])
+
+    :param buffer: The buffer to read color values from.
+    :param stride: The distance in bytes between the start of each record.
+       Default is ``7``, meaning records are packed with no separators.
+    :param offset: The position in the buffer of the first record.
+    :raises ValueError: when ``stride`` is smaller than a record, when
+       ``offset`` is negative, when any record is not a valid six-digit
+       hexadecimal color value, or when the buffer ends with a truncated
+       record.
+
+    """
+    view = memoryview(buffer).cast("B")
+    count = _record_count(view, stride, offset)
+    records = bytes(view[offset:])
+    if records[::stride][:count] == b"#" * count:
+        channels = []
+        # Each channel's two digits are gathered from every record, and
+        # decoded at once.
+        for column in (1, 3, 5):
+            digits = bytearray(2 * count)
+            digits[0::2] = records[column::stride][:count]
+            digits[1::2] = records[column + 1 :: stride][:count]
+            try:
+                channels.append(binascii.unhexlify(digits))
+            except binascii.Error:
+                break
+        else:
+            return types.RGBChannels(*channels)
+    # Some record is invalid; parse each in turn to report it.
+    return _slow_channels(hex_records_to_rgb(buffer, stride, offset))
+
+
+def rgb_to_hex_records(
+    rgb_triplets: typing.Iterable[types.IntTuple], separator: bytes = b""
+) -> bytes:
+    """
+    Serialize a sequence of 3-:class:`tuple` of :class:`int`, suitable for
+    use in ``rgb()`` color triplets, to a single :class:`bytes` buffer of
+    normalized hexadecimal color values.
+
+    Each value is written as the ASCII character ``#`` followed by six
+    lowercase hexadecimal digits, and values are joined with
+    ``separator``. The result can be read back with
+    :func:`~webcolors.hex_records_to_rgb`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_hex_records([(255, 255, 255), (0, 0, 128)])
+        b'#ffffff#000080'
+        >>> rgb_to_hex_records([(255, 255, 255), (0, 0, 128)], separator=b"\\n")
+        b'#ffffff\\n#000080'
+
+    :param rgb_triplets: The ``rgb()`` triplets to serialize.
+    :param separator: The bytes to place between each value.
+
+    """
+    digits = binascii.hexlify(
+        bytes(
+            itertools.chain.from_iterable(
+                map(normalization.normalize_integer_triplet, rgb_triplets)
+            )
+        )
+    )
+    return separator.join(
+        b"#" + digits[start : start + 6] for start in range(0, len(digits), 6)
+    )
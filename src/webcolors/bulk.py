@@ -0,0 +1,776 @@
+"""
+Chunked conversion of color values in large files.
+
+"""
+import concurrent.futures
+import contextlib
+import csv
+import functools
+import itertools
+import json
+import os
+import shutil
+import typing
+
+from . import batch, constants, conversion, html5, normalization
+
+# The formats which values can be converted between.
+FORMATS = ("name", "hex", "rgb", "rgb_percent")
+
+# The formats which values can be read in, which also include the HTML5 legacy
+# color syntax.
+INPUT_FORMATS = FORMATS + ("legacy",)
+
+# The layouts of input and output.
+LAYOUTS = ("lines", "csv", "tsv", "jsonl")
+
+# The functions which normalize a value in each format, used when converting a
+# format to itself.
+_NORMALIZERS = {
+    "hex": normalization.normalize_hex,
+    "rgb": normalization.normalize_integer_triplet,
+    "rgb_percent": normalization.normalize_percent_triplet,
+}
+
+# The key under which each line is stored in the "lines" layout.
+_LINE = "value"
+
+# A file to read or write: either a path, or an open text file.
+File = typing.Union[str, os.PathLike, typing.TextIO]
+
+# A batch of records read from a file: the line or record number of each, the
+# records themselves, and the exception, if any, which stopped reading after
+# them.
+_Chunk = typing.Tuple[typing.List[int], typing.List[dict], typing.Optional[ValueError]]
+
+
+def _parse_text(value: typing.Any) -> str:
+    """
+    Internal helper which checks that a value, as read, is a string; values
+    read from JSON may be numbers or other types, and missing values are read
+    as :data:`None`.
+
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"{value!r} is not a color value.")
+    return value
+
+
+def _parse_triplet(value: typing.Any) -> typing.Tuple[str, ...]:
+    """
+    Internal helper which splits an ``rgb()`` triplet, written as three values
+    separated by commas or whitespace and optionally wrapped in ``rgb()``, into
+    its three values. Lists (as read from JSON) are accepted as they are.
+
+    """
+    if isinstance(value, list):
+        parts = [str(part) for part in value]
+    elif not isinstance(value, str):
+        raise ValueError(f"{value!r} is not an rgb() triplet.")
+    else:
+        text = value.strip()
+        if text[:4].lower() == "rgb(" and text.endswith(")"):
+            text = text[4:-1]
+        parts = text.replace(",", " ").split()
+    if len(parts) != 3:
+        raise ValueError(f"{value!r} is not an rgb() triplet.")
+    return tuple(parts)
+
+
+def _parse_integer_triplet(value: typing.Any) -> typing.Tuple[int, ...]:
+    """
+    Internal helper which parses an integer ``rgb()`` triplet.
+
+    """
+    return tuple(int(part) for part in _parse_triplet(value))
+
+
+# The functions which parse a value, as read, in each format.
+_PARSERS: typing.Dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    "rgb": _parse_integer_triplet,
+    "rgb_percent": _parse_triplet,
+}
+
+
+def _pipeline(
+    functions: typing.Sequence[typing.Callable], value: typing.Any
+) -> typing.Any:
+    """
+    Internal helper which applies functions of one argument to a value in
+    order. Partially applied to the functions, unlike a closure, it can be
+    pickled to send to worker processes.
+
+    """
+    for function in functions:
+        value = function(value)
+    return value
+
+
+def _converter(
+    from_format: str, to_format: str, spec: str
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Internal helper which returns a function parsing a value, as read from a
+    file, in one format and converting it to another, using the color names
+    of the given specification.
+
+    """
+    steps = [_PARSERS.get(from_format, _parse_text)]
+    if from_format == "legacy":
+        steps.append(html5.html5_parse_legacy_color)
+        from_format = "rgb"
+    if from_format == to_format == "name":
+        steps.append(functools.partial(conversion.name_to_hex, spec=spec))
+        from_format = "hex"
+    if from_format == to_format:
+        steps.append(_NORMALIZERS[to_format])
+    else:
+        function = getattr(conversion, f"{from_format}_to_{to_format}")
+        if "name" in (from_format, to_format):
+            function = functools.partial(function, spec=spec)
+        steps.append(function)
+    return functools.partial(_pipeline, tuple(steps))
+
+
+def _format_text(result: typing.Any) -> str:
+    """
+    Internal helper which formats a result as text, writing triplets as three
+    values separated by commas, and :data:`None` as an empty string.
+
+    """
+    if result is None:
+        return ""
+    if isinstance(result, tuple):
+        return ",".join(map(str, result))
+    return result
+
+
+def _convert_batch(
+    function: typing.Callable[[typing.Any], typing.Any], values: typing.List
+) -> typing.List:
+    """
+    Internal helper which converts a batch of values, giving, in place of the
+    result for each value which cannot be converted, the exception raised for
+    it.
+
+    The whole batch is first converted in one pass, and only converted value
+    by value if that fails.
+
+    """
+    try:
+        return list(map(function, values))
+    except ValueError:
+        results = []
+        for value in values:
+            try:
+                results.append(function(value))
+            except ValueError as error:
+                results.append(error)
+        return results
+
+
+def _convert_columns(
+    function: typing.Callable[[typing.Any], typing.Any],
+    columns: typing.List[typing.List],
+) -> typing.List[typing.List]:
+    """
+    Internal helper which converts the values of each column of a chunk of
+    records, in the calling process or in a worker.
+
+    """
+    return [_convert_batch(function, values) for values in columns]
+
+
+def _read_chunks(
+    records: typing.Iterator[typing.Tuple[int, dict]], chunk_size: int
+) -> typing.Iterator[_Chunk]:
+    """
+    Internal helper which splits numbered records into chunks of at most
+    ``chunk_size`` records. A :exc:`ValueError` raised while reading a record
+    ends the chunk being read, and is given with it rather than raised, so
+    that the records preceding it can still be written.
+
+    """
+    while True:
+        numbers: typing.List[int] = []
+        chunk: typing.List[dict] = []
+        try:
+            for number, record in itertools.islice(records, chunk_size):
+                numbers.append(number)
+                chunk.append(record)
+        except ValueError as error:
+            yield numbers, chunk, error
+            return
+        if not chunk:
+            return
+        yield numbers, chunk, None
+
+
+def _converted_chunks(
+    function: typing.Callable[[typing.Any], typing.Any],
+    chunks: typing.Iterator[_Chunk],
+    columns: typing.Sequence[str],
+    processes: typing.Optional[int],
+) -> typing.Iterator[typing.Tuple[typing.List[int], typing.List[dict], typing.List]]:
+    """
+    Internal generator which converts the given columns of each chunk of
+    records, in the calling process or in a pool of processes, yielding each
+    chunk with its results in the order read.
+
+    """
+    items = (
+        (
+            (numbers, records, error),
+            [[record.get(column) for record in records] for column in columns],
+        )
+        for numbers, records, error in chunks
+    )
+    with contextlib.ExitStack() as stack:
+        if processes is None:
+            results: typing.Iterable = (
+                (context, _convert_columns(function, values))
+                for context, values in items
+            )
+        else:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(processes)
+            )
+            results = batch._bounded_map(  # pylint: disable=protected-access
+                executor,
+                processes,
+                functools.partial(_convert_columns, function),
+                items,
+            )
+        error = None
+        for (numbers, records, error), converted in results:
+            yield numbers, records, converted
+    if error is not None:
+        raise error
+
+
+def _read_lines(
+    stream: typing.Iterable[str],
+) -> typing.Iterator[typing.Tuple[int, dict]]:
+    """
+    Internal helper which reads one value per line, skipping blank lines.
+
+    """
+    for number, line in enumerate(stream, 1):
+        value = line.strip()
+        if value:
+            yield number, {_LINE: value}
+
+
+def _read_jsonl(
+    stream: typing.Iterable[str],
+) -> typing.Iterator[typing.Tuple[int, dict]]:
+    """
+    Internal helper which reads one JSON object per line, skipping blank
+    lines.
+
+    """
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise ValueError(f"Line {number} is not valid JSON: {error}.") from error
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {number} is not a JSON object.")
+        yield number, record
+
+
+def _default_columns(
+    columns: typing.Optional[typing.Sequence[str]],
+    output_columns: typing.Optional[typing.Sequence[str]],
+    default: str,
+    to_format: str,
+) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """
+    Internal helper which fills in the default input and output columns,
+    checking that there is one output column for each input column.
+
+    """
+    columns = [default] if columns is None else list(columns)
+    if not columns:
+        raise ValueError("At least one column must be converted.")
+    if output_columns is None:
+        if len(columns) == 1:
+            output_columns = [to_format]
+        else:
+            output_columns = [f"{column}_{to_format}" for column in columns]
+    output_columns = list(output_columns)
+    if len(output_columns) != len(columns):
+        raise ValueError(
+            f"{len(output_columns)} output columns given for {len(columns)} columns."
+        )
+    return columns, output_columns
+
+
+class _Layout(typing.NamedTuple):
+    """
+    Internal record of how a file is read and written: the numbered records
+    read, the word used to number them in error messages, the input and output
+    columns, and a function which writes a list of converted records.
+
+    """
+
+    records: typing.Iterator[typing.Tuple[int, dict]]
+    unit: str
+    columns: typing.List[str]
+    output_columns: typing.List[str]
+    write: typing.Callable[[typing.List[dict]], None]
+
+
+def _layout(
+    layout: str,
+    stream: typing.Iterable[str],
+    output: typing.TextIO,
+    *,
+    columns: typing.Optional[typing.Sequence[str]],
+    output_columns: typing.Optional[typing.Sequence[str]],
+    from_format: str,
+    to_format: str,
+) -> _Layout:
+    """
+    Internal helper which prepares to read and write a file in the given
+    layout.
+
+    """
+    # pylint: disable=too-many-arguments
+    if layout == "lines":
+        if columns is not None or output_columns is not None:
+            raise ValueError("Columns cannot be given for the 'lines' layout.")
+
+        def write_lines(records: typing.List[dict]) -> None:
+            """
+            Write the result for each line.
+
+            """
+            output.write("".join(f"{_format_text(r[_LINE])}\n" for r in records))
+
+        return _Layout(_read_lines(stream), "Line", [_LINE], [_LINE], write_lines)
+    if layout == "jsonl":
+        columns, output_columns = _default_columns(
+            columns, output_columns, from_format, to_format
+        )
+
+        def write_jsonl(records: typing.List[dict]) -> None:
+            """
+            Write each object, one per line.
+
+            """
+            output.write("".join(f"{json.dumps(record)}\n" for record in records))
+
+        return _Layout(
+            _read_jsonl(stream), "Line", columns, output_columns, write_jsonl
+        )
+    delimiter = "\t" if layout == "tsv" else ","
+    reader = csv.DictReader(stream, delimiter=delimiter)
+    fieldnames = list(reader.fieldnames or ())
+    if not fieldnames:
+        return _Layout(iter(()), "Record", [], [], lambda records: None)
+    columns, output_columns = _default_columns(
+        columns, output_columns, fieldnames[0], to_format
+    )
+    for column in columns:
+        if column not in fieldnames:
+            raise ValueError(f"The input has no column named {column!r}.")
+    fieldnames.extend(
+        column for column in dict.fromkeys(output_columns) if column not in fieldnames
+    )
+    writer = csv.DictWriter(
+        output, fieldnames, delimiter=delimiter, lineterminator="\n"
+    )
+    writer.writeheader()
+
+    def write_rows(records: typing.List[dict]) -> None:
+        """
+        Write each row, formatting the results as text.
+
+        """
+        for record in records:
+            for column in output_columns:
+                record[column] = _format_text(record[column])
+        writer.writerows(records)
+
+    return _Layout(enumerate(reader, 1), "Record", columns, output_columns, write_rows)
+
+
+def _merge_results(
+    records: typing.List[dict],
+    results: typing.List[typing.List],
+    output_columns: typing.Sequence[str],
+    errors: str,
+) -> typing.Tuple[typing.List[dict], typing.Optional[typing.Tuple[int, Exception]]]:
+    """
+    Internal helper which stores the results for a chunk of records in their
+    output columns, returning the records to write and, with the ``"strict"``
+    policy, the index of the first record with a value which cannot be
+    converted and the exception raised for it. Records are only returned up to
+    that record.
+
+    """
+    kept = []
+    for index, record in enumerate(records):
+        for output_column, column_results in zip(output_columns, results):
+            result = column_results[index]
+            if isinstance(result, ValueError):
+                if errors == "strict":
+                    return kept, (index, result)
+                if errors == "ignore":
+                    break
+                result = None
+            record[output_column] = result
+        else:
+            kept.append(record)
+    return kept, None
+
+
+def _convert_stream(
+    function: typing.Callable[[typing.Any], typing.Any],
+    layout: _Layout,
+    *,
+    errors: str,
+    chunk_size: int,
+    processes: typing.Optional[int],
+) -> int:
+    """
+    Internal helper implementing :func:`~webcolors.convert_file` for open
+    files.
+
+    """
+    count = 0
+    chunks = _converted_chunks(
+        function, _read_chunks(layout.records, chunk_size), layout.columns, processes
+    )
+    # Close the chunks, and so any pool of processes, as soon as an error is
+    # raised.
+    with contextlib.closing(chunks):
+        for numbers, records, results in chunks:
+            kept, failure = _merge_results(
+                records, results, layout.output_columns, errors
+            )
+            # Write the records preceding any invalid value.
+            if kept:
+                layout.write(kept)
+                count += len(kept)
+            if failure is not None:
+                index, error = failure
+                raise ValueError(f"{layout.unit} {numbers[index]}: {error}") from error
+    return count
+
+
+def _range_lines(
+    binary: typing.BinaryIO, start: int, end: int, encoding: str
+) -> typing.Iterator[str]:
+    """
+    Internal helper which reads and decodes the lines of a file starting
+    within the given byte range.
+
+    """
+    binary.seek(start)
+    position = start
+    while position < end:
+        line = binary.readline()
+        if not line:
+            return
+        position += len(line)
+        yield line.decode(encoding)
+
+
+@contextlib.contextmanager
+def _open_range(
+    path: typing.Union[str, os.PathLike],
+    byte_range: typing.Tuple[int, int],
+    layout: str,
+    encoding: str,
+) -> typing.Iterator[typing.Iterator[str]]:
+    """
+    Internal context manager which opens a file to read the lines starting
+    within a byte range, preceded, for CSV and TSV files, by the header row.
+
+    """
+    start, end = byte_range
+    if not 0 <= start <= end:
+        raise ValueError(f"{byte_range!r} is not a valid byte range.")
+    with open(path, "rb") as binary:
+        if layout not in ("csv", "tsv"):
+            yield _range_lines(binary, start, end, encoding)
+            return
+        header = binary.readline()
+        lines = _range_lines(binary, max(start, len(header)), end, encoding)
+        yield itertools.chain([header.decode(encoding)], lines)
+
+
+def convert_file(
+    source: File,
+    destination: File,
+    *,
+    from_format: str = "hex",
+    to_format: str = "rgb",
+    layout: str = "lines",
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    output_columns: typing.Optional[typing.Sequence[str]] = None,
+    spec: str = constants.CSS3,
+    errors: str = "strict",
+    chunk_size: int = 4096,
+    processes: typing.Optional[int] = None,
+    encoding: str = "utf-8",
+    byte_range: typing.Optional[typing.Tuple[int, int]] = None,
+) -> int:
+    """
+    Convert the color values in a file from one format to another, writing
+    them to another file, and return the number of lines or records written.
+
+    The file is read, converted and written in chunks of ``chunk_size``
+    values, so that memory use is bounded however large the file is. Each
+    chunk is converted in a single pass, falling back to converting value by
+    value only when the chunk contains a value which cannot be converted.
+
+    Values can be read in the ``from_format`` ``"name"``, ``"hex"``,
+    ``"rgb"``, ``"rgb_percent"`` or ``"legacy"`` (parsed with
+    :func:`html5_parse_legacy_color`), and converted to the ``to_format``
+    ``"name"``, ``"hex"``, ``"rgb"`` or ``"rgb_percent"``; converting a
+    format to itself normalizes each value. ``rgb()`` triplets are read as
+    three values separated by commas or whitespace, optionally wrapped in
+    ``rgb()``, and written as three values separated by commas.
+
+    The ``layout`` of the file is one of:
+
+    ``"lines"``
+        One value per line, with blank lines skipped. Each result is written
+        on its own line.
+
+    ``"csv"`` or ``"tsv"``
+        Comma- or tab-separated values with a header row. Each row is written
+        with the results added in the output columns.
+
+    ``"jsonl"``
+        One JSON object per line, with blank lines skipped. Each object is
+        written with the results added under the output keys; ``rgb()``
+        triplets may also be given as JSON arrays, and are written as arrays.
+
+    For CSV, TSV and JSON Lines files, ``columns`` names the columns (or
+    keys) holding the values to convert, by default the first column of a
+    CSV or TSV file, or the key named after ``from_format`` in a JSON Lines
+    file. ``output_columns`` names the column to write the results of each;
+    by default, results are written to a column named after ``to_format``
+    if one column is converted, or named ``<column>_<to_format>`` if
+    several are. An output column may be the same as its input column, to
+    replace the values.
+
+    Values which cannot be converted are handled according to ``errors``:
+    ``"strict"`` (the default) raises :exc:`ValueError` giving the line or
+    record number of the value, after writing the preceding lines or
+    records; ``"replace"`` writes an empty result (``null`` in JSON Lines)
+    in its place; and ``"ignore"`` skips the line or record.
+
+    .. note:: **Parallel conversion**
+
+       By default, values are converted in the calling process. Pass the
+       number of ``processes`` to convert chunks in a pool of processes,
+       while the calling process reads and writes the files; at most two
+       chunks per process are in flight at any time, and results are
+       written in the order read.
+
+    .. note:: **Sharding**
+
+       To split the conversion of a large file across machines, pass a
+       ``byte_range`` returned by :func:`shard_file` to convert only the
+       lines which start within it, reading from a path; the header row of
+       a CSV or TSV file is read from the start of the file for every
+       shard. Line and record numbers in error messages then count from
+       the start of the shard. The outputs of the shards can be joined with
+       :func:`merge_files`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import io
+        >>> output = io.StringIO()
+        >>> convert_file(io.StringIO("#fff\\n#000080\\n"), output, to_format="name")
+        2
+        >>> print(output.getvalue(), end="")
+        white
+        navy
+        >>> output = io.StringIO()
+        >>> convert_file(
+        ...     io.StringIO('id,color\\n1,"rgb(0, 0, 128)"\\n2,junk\\n'),
+        ...     output,
+        ...     from_format="rgb",
+        ...     to_format="hex",
+        ...     layout="csv",
+        ...     columns=["color"],
+        ...     errors="replace",
+        ... )
+        2
+        >>> print(output.getvalue(), end="")
+        id,color,hex
+        1,"rgb(0, 0, 128)",#000080
+        2,junk,
+
+    :param source: The file to read: a path, or a file opened in text mode.
+       Files opened by path are opened with ``newline=""``, as required by
+       the :mod:`csv` module.
+    :param destination: The file to write: a path, or a file opened in text
+       mode.
+    :param from_format: The format of the values read. Default is
+       ``"hex"``.
+    :param to_format: The format to convert to. Default is ``"rgb"``.
+    :param layout: The layout of the files: ``"lines"``, ``"csv"``,
+       ``"tsv"`` or ``"jsonl"``. Default is ``"lines"``.
+    :param columns: The columns or keys holding the values to convert.
+    :param output_columns: The columns or keys to write the results to.
+    :param spec: The specification of color names to use. Default is
+       :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :param chunk_size: The number of lines or records converted at a time.
+       Default is ``4096``.
+    :param processes: The number of worker processes to use. Default is to
+       use none.
+    :param encoding: The encoding of files opened by path. Default is
+       ``"utf-8"``.
+    :param byte_range: The ``(start, end)`` byte offsets of the shard of
+       ``source`` to convert, as returned by :func:`shard_file`. Default is
+       to convert the whole file.
+    :raises ValueError: when any argument is not supported, when a column is
+       not in a CSV or TSV file, when a line of a JSON Lines file is not a
+       JSON object, or (with the ``"strict"`` policy) when a value cannot be
+       converted.
+
+    """
+    # pylint: disable=protected-access,too-many-arguments
+    if from_format not in INPUT_FORMATS:
+        raise ValueError(f"{from_format!r} is not a supported input format.")
+    if to_format not in FORMATS:
+        raise ValueError(f"{to_format!r} is not a supported output format.")
+    if layout not in LAYOUTS:
+        raise ValueError(f"{layout!r} is not a supported layout.")
+    if spec not in constants.SUPPORTED_SPECIFICATIONS:
+        raise ValueError(constants.SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+    batch._check_errors(errors)
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, not {chunk_size}.")
+    if processes is not None and processes < 1:
+        raise ValueError(f"Process count must be at least 1, not {processes}.")
+    if byte_range is not None and not isinstance(source, (str, os.PathLike)):
+        raise ValueError("A byte range can only be read from a file given by path.")
+    with contextlib.ExitStack() as stack:
+        stream: typing.Iterable[str]
+        if byte_range is not None:
+            stream = stack.enter_context(
+                _open_range(source, byte_range, layout, encoding)
+            )
+        elif isinstance(source, (str, os.PathLike)):
+            stream = stack.enter_context(open(source, encoding=encoding, newline=""))
+        else:
+            stream = source
+        if isinstance(destination, (str, os.PathLike)):
+            destination = stack.enter_context(
+                open(destination, "w", encoding=encoding, newline="")
+            )
+        return _convert_stream(
+            _converter(from_format, to_format, spec),
+            _layout(
+                layout,
+                stream,
+                destination,
+                columns=columns,
+                output_columns=output_columns,
+                from_format=from_format,
+                to_format=to_format,
+            ),
+            errors=errors,
+            chunk_size=chunk_size,
+            processes=processes,
+        )
+
+
+def shard_file(
+    path: typing.Union[str, os.PathLike], shards: int
+) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Split a file of newline-delimited records into byte ranges of roughly
+    equal size, each starting at the start of a line, and return the
+    ``(start, end)`` offsets of each range.
+
+    The ranges depend only on the size and contents of the file and the
+    number of shards, so that each of several processes or machines can
+    compute the same ranges independently, without coordination, and
+    convert its own shard by passing its range as the ``byte_range`` of
+    :func:`convert_file`. The ranges cover the whole file without
+    overlapping, though a range may be empty if lines are long relative to
+    the size of each shard. Records must not contain newlines, so quoted
+    CSV fields spanning several lines are not supported.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import os, tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = os.path.join(directory, "colors.txt")
+        ...     with open(path, "w") as colors_file:
+        ...         _ = colors_file.write("#fff\\n#000080\\n#c00000\\n")
+        ...     shard_file(path, 2)
+        [(0, 13), (13, 21)]
+
+    :param path: The path of the file to split.
+    :param shards: The number of ranges to split the file into.
+    :raises ValueError: when ``shards`` is less than 1.
+
+    """
+    if shards < 1:
+        raise ValueError(f"Shard count must be at least 1, not {shards}.")
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as binary:
+        for index in range(1, shards):
+            offset = max(size * index // shards, boundaries[-1])
+            if offset > 0:
+                # Move the boundary to the start of the next line, unless it
+                # is already at the start of a line.
+                binary.seek(offset - 1)
+                binary.readline()
+                offset = binary.tell()
+            boundaries.append(offset)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def merge_files(
+    sources: typing.Iterable[typing.Union[str, os.PathLike]],
+    destination: typing.Union[str, os.PathLike],
+    layout: str = "lines",
+) -> None:
+    """
+    Join the outputs of converting the shards of a file with
+    :func:`convert_file` into one file, in the order given.
+
+    For CSV and TSV files, only the first header row is kept. Files are
+    copied byte for byte otherwise, so that the result is the same as if
+    the whole file had been converted at once.
+
+    :param sources: The paths of the files to join, in order.
+    :param destination: The path of the file to write.
+    :param layout: The layout of the files: ``"lines"``, ``"csv"``,
+       ``"tsv"`` or ``"jsonl"``. Default is ``"lines"``.
+    :raises ValueError: when ``layout`` is not supported.
+
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"{layout!r} is not a supported layout.")
+    header = None
+    with open(destination, "wb") as output:
+        for source in sources:
+            with open(source, "rb") as shard:
+                if layout in ("csv", "tsv"):
+                    line = shard.readline()
+                    if header is None:
+                        header = line
+                        output.write(line)
+                shutil.copyfileobj(shard, output)
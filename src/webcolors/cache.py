@@ -0,0 +1,301 @@
+"""
+Persistent caching of the results of HTML5 legacy color parsing.
+
+"""
+import contextlib
+import os
+import sqlite3
+import threading
+import typing
+
+from . import batch, html5, types
+
+# The number of values looked up in each query, kept below the limit of 999
+# parameters per statement in older versions of SQLite.
+_QUERY_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS legacy_colors (
+    value TEXT PRIMARY KEY,
+    red INTEGER NOT NULL,
+    green INTEGER NOT NULL,
+    blue INTEGER NOT NULL
+)
+"""
+
+
+class LegacyColorCache:
+    """
+    A persistent cache of the results of :func:`html5_parse_legacy_color`,
+    stored in an SQLite database, so that values parsed in one run of a
+    program need not be parsed again in the next.
+
+    Values are keyed on the exact string given, before any stripping of
+    whitespace or folding of case. Only values which parse successfully are
+    stored. Once the cache holds more than ``max_entries`` values, the
+    values stored longest ago are removed, leaving nine tenths of
+    ``max_entries``, so that the cache is not trimmed again for each value
+    added after it fills.
+
+    A cache may be shared between threads, and, since SQLite handles
+    locking of the database, between processes; use it as a context manager
+    (or call :meth:`close`) to close the database. Each thread reads the
+    database through its own connection, so that lookups in different threads
+    do not wait for each other, except in a cache stored in memory, which is
+    private to a single connection.
+
+    Examples:
+
+    .. doctest::
+
+        >>> with LegacyColorCache(":memory:") as cache:
+        ...     cache.parse("chucknorris")
+        ...     cache.parse_many(["navy", ""], errors="replace")
+        ...     len(cache)
+        HTML5SimpleColor(red=192, green=0, blue=0)
+        [HTML5SimpleColor(red=0, green=0, blue=128), None]
+        2
+
+    :param path: The path of the database file, which is created if it does
+       not exist, or ``":memory:"`` for a cache which is not persisted.
+    :param max_entries: The maximum number of values to store. Default is
+       ``1000000``.
+    :raises ValueError: when ``max_entries`` is less than 1.
+
+    """
+
+    def __init__(
+        self, path: typing.Union[str, os.PathLike], max_entries: int = 1000000
+    ):
+        """
+        Open, and if necessary create, the database.
+
+        """
+        if max_entries < 1:
+            raise ValueError(f"Maximum entries must be at least 1, not {max_entries}.")
+        self.max_entries = max_entries
+        self._path = os.fspath(path)
+        # Writes, and all use of a database in memory, are serialized by the
+        # lock; reads of a database file need none.
+        self._lock = threading.Lock()
+        self._read_lock: typing.ContextManager = (
+            self._lock if self._path == ":memory:" else contextlib.nullcontext()
+        )
+        self._local = threading.local()
+        self._connections: typing.List[
+            typing.Tuple[threading.Thread, sqlite3.Connection]
+        ] = []
+        connection = self._connection()
+        with self._lock, connection:
+            # Write-ahead logging lets readers and a writer use the database
+            # at once.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+        self._size = len(self)
+
+    def __enter__(self) -> "LegacyColorCache":
+        """
+        Use the cache as a context manager, closing it on exit.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        """
+        Close the cache.
+
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Return the number of values stored.
+
+        """
+        connection = self._connection()
+        with self._read_lock:
+            (count,) = connection.execute(
+                "SELECT COUNT(*) FROM legacy_colors"
+            ).fetchone()
+        return count
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Return the current thread's connection to the database, opening it if
+        necessary, and closing those of threads which have exited.
+
+        """
+        try:
+            return self._local.connection
+        except AttributeError:
+            pass
+        with self._lock:
+            if self._path == ":memory:" and self._connections:
+                connection = self._connections[0][1]
+            else:
+                connection = sqlite3.connect(self._path, check_same_thread=False)
+                # Not syncing on every commit keeps writes cheap; a crash may
+                # lose the most recent values, but does not corrupt the
+                # database.
+                connection.execute("PRAGMA synchronous=NORMAL")
+                for thread, other in list(self._connections):
+                    if not thread.is_alive():
+                        self._connections.remove((thread, other))
+                        other.close()
+                self._connections.append((threading.current_thread(), connection))
+        self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """
+        Close the database. The cache cannot be used afterwards.
+
+        """
+        with self._lock:
+            for _, connection in self._connections:
+                connection.close()
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+
+        """
+        connection = self._connection()
+        with self._lock, connection:
+            connection.execute("DELETE FROM legacy_colors")
+            self._size = 0
+
+    def _lookup(
+        self, values: typing.Collection[str]
+    ) -> typing.Dict[str, types.HTML5SimpleColor]:
+        """
+        Look up stored values, returning the result for each one found.
+
+        """
+        found = {}
+        values = list(values)
+        connection = self._connection()
+        with self._read_lock:
+            for start in range(0, len(values), _QUERY_SIZE):
+                query = values[start : start + _QUERY_SIZE]
+                rows = connection.execute(
+                    "SELECT value, red, green, blue FROM legacy_colors "
+                    f"WHERE value IN ({', '.join('?' * len(query))})",
+                    query,
+                )
+                for value, red, green, blue in rows:
+                    found[value] = types.HTML5SimpleColor(red, green, blue)
+        return found
+
+    def _store(self, results: typing.Dict[str, types.HTML5SimpleColor]) -> int:
+        """
+        Store results, removing the oldest values if the cache grows too
+        large, and return the number of values added.
+
+        """
+        connection = self._connection()
+        with self._lock, connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO legacy_colors VALUES (?, ?, ?, ?)",
+                [(value, *result) for value, result in results.items()],
+            )
+            added = connection.total_changes - before
+            self._size += added
+            if self._size > self.max_entries:
+                # Other processes may have added values too, so count them
+                # before removing any.
+                self._size = connection.execute(
+                    "SELECT COUNT(*) FROM legacy_colors"
+                ).fetchone()[0]
+                excess = self._size - (self.max_entries - self.max_entries // 10)
+                if self._size > self.max_entries:
+                    connection.execute(
+                        "DELETE FROM legacy_colors WHERE rowid IN "
+                        "(SELECT rowid FROM legacy_colors ORDER BY rowid LIMIT ?)",
+                        (excess,),
+                    )
+                    self._size -= excess
+        return added
+
+    def _parse(
+        self, values: typing.Iterable[typing.Any]
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], int]:
+        """
+        Look up or parse each distinct string among the given values,
+        storing new results, and return the result (or :exc:`ValueError`)
+        for each, with the number of values added to the cache.
+
+        """
+        strings = {value for value in values if isinstance(value, str)}
+        results: typing.Dict[str, typing.Any] = self._lookup(strings)
+        parsed = {}
+        for value in strings.difference(results):
+            try:
+                parsed[value] = html5.html5_parse_legacy_color(value)
+            except ValueError as error:
+                results[value] = error
+        results.update(parsed)
+        return results, self._store(parsed) if parsed else 0
+
+    def parse(self, value: str) -> types.HTML5SimpleColor:
+        """
+        Parse a value with :func:`html5_parse_legacy_color`, using and
+        updating the cache.
+
+        :param value: The color to parse.
+        :raises ValueError: when the value cannot be parsed.
+
+        """
+        if isinstance(value, str):
+            found = self._lookup([value])
+            if found:
+                return found[value]
+        result = html5.html5_parse_legacy_color(value)
+        self._store({value: result})
+        return result
+
+    def parse_many(
+        self, values: typing.Iterable[str], errors: str = "strict"
+    ) -> typing.List[typing.Optional[types.HTML5SimpleColor]]:
+        """
+        Parse many values with :func:`html5_parse_legacy_color`, looking up
+        and storing values in bulk, and return the results in the same order
+        as the values.
+
+        :param values: The colors to parse.
+        :param errors: The policy for handling values which cannot be parsed:
+           ``"strict"`` raises :exc:`ValueError`, ``"replace"`` gives
+           :data:`None` as the result for that value, and ``"ignore"`` omits
+           the value from the results. Default is ``"strict"``.
+        :raises ValueError: when ``errors`` is not a supported policy, or
+           (with the ``"strict"`` policy) when a value cannot be parsed.
+
+        """
+        # pylint: disable=protected-access
+        batch._check_errors(errors)
+        values = list(values)
+        results, _ = self._parse(values)
+
+        def result(value: typing.Any) -> types.HTML5SimpleColor:
+            """
+            Return the result for a value, raising its error, if any.
+
+            """
+            if not isinstance(value, str):
+                return html5.html5_parse_legacy_color(value)
+            if isinstance(results[value], ValueError):
+                raise results[value]
+            return results[value]
+
+        return list(batch._convert(result, values, errors))
+
+    def prewarm(self, values: typing.Iterable[str]) -> int:
+        """
+        Parse and store many values ahead of their use, skipping any which
+        cannot be parsed, and return the number of values added.
+
+        :param values: The colors to parse.
+
+        """
+        return self._parse(values)[1]
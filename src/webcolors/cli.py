@@ -0,0 +1,183 @@
+"""
+Command-line interface for converting streams of color values, run as
+``python -m webcolors``.
+
+"""
+import argparse
+import sys
+import typing
+
+from . import bulk, constants
+
+
+def _shard(value: str) -> typing.Tuple[int, int]:
+    """
+    Internal helper which parses a shard given as ``I/N``, the ``I``-th of
+    ``N`` shards, counting from zero.
+
+    """
+    index, _, count = value.partition("/")
+    try:
+        shard = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not of the form I/N") from None
+    if not 0 <= shard[0] < shard[1]:
+        raise argparse.ArgumentTypeError(
+            f"{value!r} is not a shard from 0/N to (N-1)/N"
+        )
+    return shard
+
+
+def _argument_parser() -> argparse.ArgumentParser:
+    """
+    Internal helper which returns the parser for the command-line arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m webcolors",
+        description=(
+            "Convert color values, read from files or standard input, between "
+            "formats, writing the results to standard output."
+        ),
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="files to read (default: standard input, also given as -)",
+    )
+    parser.add_argument(
+        "-f",
+        "--from",
+        dest="from_format",
+        choices=bulk.INPUT_FORMATS,
+        default="hex",
+        help="format of the input values (default: hex)",
+    )
+    parser.add_argument(
+        "-t",
+        "--to",
+        dest="to_format",
+        choices=bulk.FORMATS,
+        default="rgb",
+        help="format to convert to (default: rgb)",
+    )
+    parser.add_argument(
+        "-s",
+        "--spec",
+        choices=constants.SUPPORTED_SPECIFICATIONS,
+        default=constants.CSS3,
+        help="specification of color names (default: css3)",
+    )
+    parser.add_argument(
+        "-l",
+        "--layout",
+        choices=bulk.LAYOUTS,
+        default="lines",
+        help=(
+            "lines: one value per line; csv, tsv: comma- or tab-separated values "
+            "with a header row; jsonl: one JSON object per line (default: lines)"
+        ),
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        action="append",
+        dest="columns",
+        help=(
+            "column or JSON key holding values; may be repeated (default: the "
+            "first column, or the input format)"
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--output-column",
+        action="append",
+        dest="output_columns",
+        help=(
+            "column or JSON key for the results of each column (default: the "
+            "output format, or <column>_<format> for several columns)"
+        ),
+    )
+    parser.add_argument(
+        "-e",
+        "--errors",
+        choices=constants.SUPPORTED_ERROR_POLICIES,
+        default="strict",
+        help=(
+            "strict: stop at the first invalid value; replace: write an empty "
+            "result; ignore: skip the value (default: strict)"
+        ),
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=4096,
+        help="number of values converted at a time (default: 4096)",
+    )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        help="number of worker processes to convert in (default: none)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="I/N",
+        help=(
+            "convert only the I-th of N shards of each file, counting from 0, "
+            "split at line boundaries (default: convert whole files)"
+        ),
+    )
+    parser.add_argument(
+        "--encoding", default="utf-8", help="encoding of input files (default: utf-8)"
+    )
+    return parser
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Run the command-line interface with the given arguments (by default, those
+    of the current process), returning the exit status.
+
+    """
+    parser = _argument_parser()
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error(f"batch size must be at least 1, not {args.batch_size}")
+    if args.processes is not None and args.processes < 1:
+        parser.error(f"process count must be at least 1, not {args.processes}")
+    if args.shard is not None and "-" in args.files:
+        parser.error("standard input cannot be sharded")
+    for path in args.files:
+        try:
+            byte_range = None
+            if args.shard is not None:
+                index, count = args.shard
+                byte_range = bulk.shard_file(path, count)[index]
+            bulk.convert_file(
+                sys.stdin if path == "-" else path,
+                sys.stdout,
+                from_format=args.from_format,
+                to_format=args.to_format,
+                layout=args.layout,
+                columns=args.columns,
+                output_columns=args.output_columns,
+                spec=args.spec,
+                errors=args.errors,
+                chunk_size=args.batch_size,
+                processes=args.processes,
+                encoding=args.encoding,
+                byte_range=byte_range,
+            )
+        except ValueError as error:
+            sys.stdout.flush()
+            print(f"{parser.prog}: {path}: {error}", file=sys.stderr)
+            return 1
+        except OSError as error:
+            sys.stdout.flush()
+            print(f"{parser.prog}: {error}", file=sys.stderr)
+            return 1
+    return 0
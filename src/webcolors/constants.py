@@ -2,7 +2,7 @@
 Constants representing valid formats and values for colors.
 
 """
-import re
+import typing
 
 
 def _reversedict(dict_to_reverse: dict) -> dict:
@@ -14,8 +14,6 @@ def _reversedict(dict_to_reverse: dict) -> dict:
     return {value: key for key, value in dict_to_reverse.items()}
 
 
-HEX_COLOR_RE = re.compile(r"^#([a-fA-F0-9]{3}|[a-fA-F0-9]{6})$")
-
 HTML4 = "html4"
 CSS2 = "css2"
 CSS21 = "css21"
@@ -28,6 +26,15 @@ SPECIFICATION_ERROR_TEMPLATE = (
     f"supported specifications are: {SUPPORTED_SPECIFICATIONS}."
 )
 
+# Policies for handling values which cannot be converted, in the functions
+# which convert many values at once.
+SUPPORTED_ERROR_POLICIES = ("strict", "replace", "ignore")
+
+ERROR_POLICY_ERROR_TEMPLATE = (
+    f"{{errors}} is not a supported error policy; "
+    f"supported error policies are: {SUPPORTED_ERROR_POLICIES}."
+)
+
 # Mappings of color names to normalized hexadecimal color values.
 # --------------------------------------------------------------------------------
 
@@ -238,14 +245,16 @@ CSS3_NAMES_TO_HEX = {
 
 # Mappings of normalized hexadecimal color values to color names.
 # --------------------------------------------------------------------------------
+#
+# These, and HEX_COLOR_RE, are built on first use by __getattr__() below, rather
+# than at import time.
 
-HTML4_HEX_TO_NAMES = _reversedict(HTML4_NAMES_TO_HEX)
-
-CSS2_HEX_TO_NAMES = HTML4_HEX_TO_NAMES
-
-CSS21_HEX_TO_NAMES = _reversedict(CSS21_NAMES_TO_HEX)
-
-CSS3_HEX_TO_NAMES = _reversedict(CSS3_NAMES_TO_HEX)
+# The mapping of color names which each reverse mapping is built from.
+_REVERSED = {
+    "HTML4_HEX_TO_NAMES": "HTML4_NAMES_TO_HEX",
+    "CSS21_HEX_TO_NAMES": "CSS21_NAMES_TO_HEX",
+    "CSS3_HEX_TO_NAMES": "CSS3_NAMES_TO_HEX",
+}
 
 # CSS3 defines both "gray" and "grey", as well as defining either
 # variant for other related colors like "darkgray"/"darkgrey". For a
@@ -260,10 +269,36 @@ CSS3_HEX_TO_NAMES = _reversedict(CSS3_NAMES_TO_HEX)
 # consistently be returned. Since "gray" was the only spelling
 # supported in HTML 4, CSS1, and CSS2, "gray" and its variants are
 # chosen.
-CSS3_HEX_TO_NAMES["#a9a9a9"] = "darkgray"
-CSS3_HEX_TO_NAMES["#2f4f4f"] = "darkslategray"
-CSS3_HEX_TO_NAMES["#696969"] = "dimgray"
-CSS3_HEX_TO_NAMES["#808080"] = "gray"
-CSS3_HEX_TO_NAMES["#d3d3d3"] = "lightgray"
-CSS3_HEX_TO_NAMES["#778899"] = "lightslategray"
-CSS3_HEX_TO_NAMES["#708090"] = "slategray"
+_CSS3_SPELLINGS = {
+    "#a9a9a9": "darkgray",
+    "#2f4f4f": "darkslategray",
+    "#696969": "dimgray",
+    "#808080": "gray",
+    "#d3d3d3": "lightgray",
+    "#778899": "lightslategray",
+    "#708090": "slategray",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Build the regular expression matching hexadecimal color values, or a
+    mapping of hexadecimal values to color names, on first use.
+
+    """
+    if name == "HEX_COLOR_RE":
+        import re  # pylint: disable=import-outside-toplevel
+
+        value: typing.Any = re.compile(r"^#([a-fA-F0-9]{3}|[a-fA-F0-9]{6})$")
+    elif name == "CSS2_HEX_TO_NAMES":
+        # CSS2 used the same list as HTML 4.
+        value = __getattr__("HTML4_HEX_TO_NAMES")
+    elif name in _REVERSED:
+        value = _reversedict(globals()[_REVERSED[name]])
+        if name == "CSS3_HEX_TO_NAMES":
+            value.update(_CSS3_SPELLINGS)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the value, so that __getattr__ is only called once per name; if
+    # several threads get here at once, the first stored is kept.
+    return globals().setdefault(name, value)
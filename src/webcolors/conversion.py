@@ -2,7 +2,9 @@
 Functions which convert between various types of color values.
 
 """
-from . import constants, normalization, types
+import typing
+
+from . import constants, normalization, tables, types
 
 # Conversions from color names to other formats.
 # --------------------------------------------------------------------------------
@@ -104,7 +106,9 @@ def name_to_rgb_percent(name: str, spec: str = constants.CSS3) -> types.PercentR
 # --------------------------------------------------------------------------------
 
 
-def hex_to_name(hex_value: str, spec: str = constants.CSS3) -> str:
+def hex_to_name(
+    hex_value: typing.Union[str, types.BytesLike], spec: str = constants.CSS3
+) -> str:
     """
     Convert a hexadecimal color value to its corresponding normalized
     color name, if any such name exists.
@@ -145,20 +149,66 @@ def hex_to_name(hex_value: str, spec: str = constants.CSS3) -> str:
     """
     if spec not in constants.SUPPORTED_SPECIFICATIONS:
         raise ValueError(constants.SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
-    name = getattr(constants, f"{spec.upper()}_HEX_TO_NAMES").get(
-        normalization.normalize_hex(hex_value)
-    )
+    # Once the spelling index is enabled, spellings of the values of named colors
+    # are normalized with a single lookup; anything else, including bytes-like
+    # values, is normalized in full.
+    normalized = None
+    if tables.HEX_SPELLINGS and isinstance(hex_value, str):
+        normalized = tables.HEX_SPELLINGS.get(hex_value)
+    if normalized is None:
+        normalized = normalization.normalize_hex(hex_value)
+    name = getattr(constants, f"{spec.upper()}_HEX_TO_NAMES").get(normalized)
     if name is None:
+        if not isinstance(hex_value, str):
+            # Having been normalized, a bytes-like value is ASCII.
+            hex_value = bytes(memoryview(hex_value).cast("B")).decode("ascii")
         raise ValueError(f'"{hex_value}" has no defined color name in {spec}.')
     return name
 
 
-def hex_to_rgb(hex_value: str) -> types.IntegerRGB:
+def hex_to_names(
+    hex_value: typing.Union[str, types.BytesLike]
+) -> typing.Dict[str, typing.Tuple[str, ...]]:
+    """
+    Convert a hexadecimal color value to its names in every supported
+    specification at once.
+
+    The hexadecimal value will be normalized before being converted. The result
+    maps each specification in which the color has a name to a :class:`tuple`
+    of all of its names in that specification, beginning with the name
+    :func:`hex_to_name` returns and followed by any alternative spellings (such
+    as ``"grey"`` for ``"gray"`` in CSS3). Specifications in which the color
+    has no name are omitted, so a color with no name at all gives an empty
+    :class:`dict`, rather than raising an exception.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hex_to_names("#000080")
+        {'html4': ('navy',), 'css2': ('navy',), 'css21': ('navy',), 'css3': ('navy',)}
+        >>> hex_to_names("#d3d3d3")
+        {'css3': ('lightgray', 'lightgrey')}
+        >>> hex_to_names("#123456")
+        {}
+
+    :param hex_value: The hexadecimal color value to convert.
+    :raises ValueError: when the supplied hex value is invalid.
+
+    """
+    return dict(
+        tables.all_names_index().get(normalization.normalize_hex(hex_value), {})
+    )
+
+
+def hex_to_rgb(hex_value: typing.Union[str, types.BytesLike]) -> types.IntegerRGB:
     """
     Convert a hexadecimal color value to a 3-:class:`tuple` of :class:`int` suitable
     for use in an ``rgb()`` triplet specifying that color.
 
-    The hexadecimal value will be normalized before being converted.
+    The hexadecimal value will be normalized before being converted. A
+    bytes-like hexadecimal value is converted directly, without being
+    decoded to a :class:`str`.
 
     Examples:
 
@@ -173,11 +223,16 @@ def hex_to_rgb(hex_value: str) -> types.IntegerRGB:
     :raises ValueError: when the supplied hex value is invalid.
 
     """
+    if not isinstance(hex_value, str):
+        # pylint: disable=protected-access
+        return normalization._hex_bytes_to_rgb(hex_value)
     int_value = int(normalization.normalize_hex(hex_value)[1:], 16)
     return types.IntegerRGB(int_value >> 16, int_value >> 8 & 0xFF, int_value & 0xFF)
 
 
-def hex_to_rgb_percent(hex_value: str) -> types.PercentRGB:
+def hex_to_rgb_percent(
+    hex_value: typing.Union[str, types.BytesLike]
+) -> types.PercentRGB:
     """
     Convert a hexadecimal color value to a 3-:class:`tuple` of percentages
     suitable for use in an ``rgb()`` triplet representing that color.
@@ -16,7 +16,7 @@ implementation.
 """
 import string
 
-from . import constants, types
+from . import constants, tables, types
 
 
 def html5_parse_simple_color(value: str) -> types.HTML5SimpleColor:
@@ -144,6 +144,21 @@ def html5_parse_legacy_color(value: str) -> types.HTML5SimpleColor:
     :raises ValueError: when the given value is not a Unicode string, when it is the
        empty string, or when it is precisely the string ``"transparent"``.
 
+    """
+    # Once caching is enabled, the results for values of up to
+    # _MAX_CACHED_LENGTH characters, such as the names and short hex values
+    # which pages repeat, are cached: even for these, the steps of the legacy
+    # algorithm cost far more than a lookup. Longer values are always parsed.
+    if _LEGACY_CACHING and isinstance(value, str) and len(value) <= _MAX_CACHED_LENGTH:
+        return _LEGACY_COLORS(value)
+    return _parse_legacy_color(value)
+
+
+def _parse_legacy_color(value: str) -> types.HTML5SimpleColor:
+    """
+    Internal implementation of the HTML5 legacy color parsing algorithm,
+    without caching.
+
     """
     # 1. Let input be the string being parsed.
     if not isinstance(value, str):
@@ -264,3 +279,17 @@ def html5_parse_legacy_color(value: str) -> types.HTML5SimpleColor:
     #
     # 20. Return result.
     return types.HTML5SimpleColor(int(red, 16), int(green, 16), int(blue, 16))
+
+
+# The cache of parsed legacy colors, whose hottest values can be listed with
+# webcolors.cache_manifest() and loaded with webcolors.prewarm_caches().
+_LEGACY_COLORS = tables.MemoCache(_parse_legacy_color, maxsize=4096)
+
+# Whether parsed legacy colors are cached: only once turned on by
+# webcolors.enable_legacy_cache(), or by loading a manifest of legacy colors
+# with webcolors.prewarm_caches().
+_LEGACY_CACHING = False
+
+# The length of the longest value which is cached, so that the cache's memory
+# use stays small; longer values are rarely parsed more than once.
+_MAX_CACHED_LENGTH = 32
@@ -0,0 +1,517 @@
+"""
+Opt-in instrumentation and sampling of the conversion, normalization and HTML5
+functions.
+
+"""
+import bisect
+import collections
+import functools
+import inspect
+import itertools
+import math
+import string
+import sys
+import threading
+import time
+import typing
+
+from . import constants, conversion, html5, normalization, types
+
+# The modules whose public functions are instrumented.
+_MODULES = (conversion, normalization, html5)
+
+# Upper bounds, in seconds, of the buckets of the latency histograms.
+LATENCY_BUCKETS = (
+    1e-06,
+    2.5e-06,
+    5e-06,
+    1e-05,
+    2.5e-05,
+    5e-05,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    math.inf,
+)
+
+
+class _FunctionStats:
+    """
+    Internal class accumulating the call count, error count and latency
+    histogram of one function.
+
+    """
+
+    __slots__ = ("lock", "calls", "errors", "seconds", "buckets")
+
+    def __init__(self) -> None:
+        """
+        Initialize with all counts at zero.
+
+        """
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Set all counts to zero.
+
+        """
+        with self.lock:
+            self.calls = 0
+            self.errors = 0
+            self.seconds = 0.0
+            self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        """
+        Record one call, which took ``elapsed`` seconds.
+
+        """
+        index = bisect.bisect_left(LATENCY_BUCKETS, elapsed)
+        with self.lock:
+            self.calls += 1
+            self.errors += failed
+            self.seconds += elapsed
+            self.buckets[index] += 1
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the current counts, with the histogram made cumulative.
+
+        """
+        with self.lock:
+            counts = list(self.buckets)
+            result = {"calls": self.calls, "errors": self.errors, "sum": self.seconds}
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip(LATENCY_BUCKETS, counts):
+            cumulative += count
+            histogram[bound] = cumulative
+        result["buckets"] = histogram
+        return result
+
+
+def _input_format(value: typing.Any) -> str:
+    """
+    Internal helper which classifies the format of an input value.
+
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "bytes"
+    if isinstance(value, str):
+        return "hex" if value.startswith("#") else "name"
+    if isinstance(value, (tuple, list)):
+        if all(isinstance(item, int) for item in value):
+            return "integer"
+        if all(isinstance(item, str) for item in value):
+            return "percent"
+    return type(value).__name__
+
+
+def _legacy_step(value: typing.Any) -> int:
+    """
+    Internal helper which returns the number of the step of the HTML5 legacy
+    color parsing algorithm at which parsing a value returns.
+
+    This mirrors the early returns of
+    :func:`~webcolors.html5_parse_legacy_color`; any value which reaches the
+    end of the algorithm returns at step 20.
+
+    """
+    if not isinstance(value, str):
+        return 1
+    if value == "":
+        return 2
+    value = value.strip().lower()
+    if value == "transparent":
+        return 4
+    if value in constants.CSS3_NAMES_TO_HEX:
+        return 5
+    if (
+        len(value) == 4
+        and value.startswith("#")
+        and all(c in string.hexdigits for c in value[1:])
+    ):
+        return 6
+    return 20
+
+
+class _Sampler(typing.NamedTuple):
+    """
+    Internal class holding the sampling rate, and the ring buffer which sampled
+    calls are recorded in.
+
+    """
+
+    rate: int
+    samples: typing.Deque[types.CallSample]
+
+
+# The uninstrumented functions, keyed by (module, name), while instrumentation or
+# sampling is enabled.
+_ORIGINALS: typing.Dict[typing.Tuple[typing.Any, str], typing.Callable] = {}
+
+# The accumulated statistics, keyed by function name.
+_STATS: typing.Dict[str, _FunctionStats] = {}
+
+# Whether statistics are being recorded.
+_RECORDING = False
+
+# The sampler in use, if sampling is enabled.
+_SAMPLER: typing.Optional[_Sampler] = None
+
+# The most recently sampled calls, kept after sampling is disabled.
+_SAMPLES: typing.Deque[types.CallSample] = collections.deque(maxlen=0)
+
+_LOCK = threading.Lock()
+
+
+def _instrumented_functions() -> typing.Iterator[typing.Tuple[typing.Any, str]]:
+    """
+    Internal helper which yields the (module, name) of each function to
+    instrument.
+
+    """
+    for module in _MODULES:
+        for name, value in vars(module).items():
+            if (
+                not name.startswith("_")
+                and callable(value)
+                and getattr(value, "__module__", None) == module.__name__
+            ):
+                yield module, name
+
+
+def _spec_getter(
+    function: typing.Callable,
+) -> typing.Callable[[tuple, dict], typing.Optional[str]]:
+    """
+    Internal helper which returns a function extracting the ``spec`` argument,
+    if any, from the arguments of a call to a function.
+
+    """
+    parameters = inspect.signature(function).parameters
+    if "spec" not in parameters:
+        return lambda args, kwargs: None
+    position = list(parameters).index("spec")
+    default = parameters["spec"].default
+
+    def spec(args: tuple, kwargs: dict) -> typing.Optional[str]:
+        """
+        Return the ``spec`` argument of a call.
+
+        """
+        if len(args) > position:
+            return args[position]
+        return kwargs.get("spec", default)
+
+    return spec
+
+
+def _wrap(
+    function: typing.Callable,
+    stats: typing.Optional[_FunctionStats],
+    sampler: typing.Optional[_Sampler],
+) -> typing.Callable[..., typing.Any]:
+    """
+    Internal helper which returns an instrumented wrapper around a function,
+    recording statistics, sampling calls, or both.
+
+    """
+    clock = time.perf_counter
+    name = function.__name__
+    spec = _spec_getter(function)
+    legacy = name == "html5_parse_legacy_color"
+    # Each function counts its own calls, so that calls made internally by
+    # other functions don't bias which calls are sampled.
+    counter = itertools.count(1)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        """
+        Call the wrapped function, recording its latency and outcome.
+
+        """
+        sample = sampler is not None and next(counter) % sampler.rate == 0
+        if stats is None and not sample:
+            return function(*args, **kwargs)
+        start = clock()
+        failed = True
+        try:
+            result = function(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = clock() - start
+            if stats is not None:
+                stats.record(elapsed, failed)
+            if sample:
+                value = args[0] if args else next(iter(kwargs.values()), None)
+                sampler.samples.append(
+                    types.CallSample(
+                        function=name,
+                        format=_input_format(value),
+                        length=len(value) if hasattr(value, "__len__") else None,
+                        spec=spec(args, kwargs),
+                        hit=not failed,
+                        step=_legacy_step(value) if legacy else None,
+                        seconds=elapsed,
+                    )
+                )
+
+    return wrapper
+
+
+def _install() -> None:
+    """
+    Internal helper which restores the original functions and then, if
+    instrumentation or sampling is enabled, replaces them with wrappers.
+
+    Must be called with the lock held.
+
+    """
+    for (module, name), function in _ORIGINALS.items():
+        setattr(module, name, function)
+    _ORIGINALS.clear()
+    if not (_RECORDING or _SAMPLER):
+        return
+    package = sys.modules[__package__]
+    for module, name in _instrumented_functions():
+        function = getattr(module, name)
+        wrapper = _wrap(
+            function,
+            _STATS.setdefault(name, _FunctionStats()) if _RECORDING else None,
+            _SAMPLER,
+        )
+        # Look the function up in the package before replacing it in its module,
+        # since the package imports names from its submodules on first use.
+        if getattr(package, name, None) is function:
+            _ORIGINALS[(package, name)] = function
+            setattr(package, name, wrapper)
+        _ORIGINALS[(module, name)] = function
+        setattr(module, name, wrapper)
+
+
+def enable_instrumentation() -> None:
+    """
+    Begin recording the call count, error count and latency of each of the
+    conversion, normalization and HTML5 functions.
+
+    While enabled, each of these functions is replaced, both in the top-level
+    ``webcolors`` module and internally, by an instrumented wrapper. Calls
+    made by one function to another (for example, :func:`~webcolors.name_to_rgb`
+    calls :func:`~webcolors.name_to_hex`) are recorded for both.
+
+    When instrumentation is disabled, the original functions are in place, so
+    it has no cost at all. Because of this, references to the functions
+    obtained before instrumentation was enabled (such as by ``from webcolors
+    import hex_to_rgb``) are not instrumented; refer to them through the
+    ``webcolors`` module instead.
+
+    Enabling instrumentation when it is already enabled has no effect.
+    Statistics accumulate until :func:`~webcolors.reset_instrumentation` is
+    called.
+
+    """
+    global _RECORDING  # pylint: disable=global-statement
+    with _LOCK:
+        if not _RECORDING:
+            _RECORDING = True
+            _install()
+
+
+def disable_instrumentation() -> None:
+    """
+    Stop recording, restoring the original, uninstrumented functions unless
+    sampling is enabled.
+
+    Statistics recorded so far are kept. Disabling instrumentation when it is
+    not enabled has no effect.
+
+    """
+    global _RECORDING  # pylint: disable=global-statement
+    with _LOCK:
+        if _RECORDING:
+            _RECORDING = False
+            _install()
+
+
+def enable_sampling(rate: int = 100, capacity: int = 10000) -> None:
+    """
+    Begin sampling one in every ``rate`` calls to each of the conversion,
+    normalization and HTML5 functions, recording the shape of the input and
+    the time taken by each sampled call, as a :class:`~webcolors.CallSample`,
+    in a ring buffer holding the most recent ``capacity`` samples.
+
+    Calls which are not sampled only pay for counting, so sampling is much
+    cheaper than :func:`~webcolors.enable_instrumentation`, and can be left on
+    in production to find out which kinds of input dominate the cost of
+    conversion. As with instrumentation, the original functions are in place
+    while sampling is disabled.
+
+    Enabling sampling when it is already enabled starts again with the new
+    rate and an empty ring buffer.
+
+    :param rate: One in how many calls to sample. Default is ``100``.
+    :param capacity: The number of samples to keep. Default is ``10000``.
+    :raises ValueError: when ``rate`` or ``capacity`` is less than 1.
+
+    """
+    global _SAMPLER, _SAMPLES  # pylint: disable=global-statement
+    if rate < 1:
+        raise ValueError(f"Sampling rate must be at least 1, not {rate}.")
+    if capacity < 1:
+        raise ValueError(f"Sample capacity must be at least 1, not {capacity}.")
+    with _LOCK:
+        _SAMPLES = collections.deque(maxlen=capacity)
+        _SAMPLER = _Sampler(rate, _SAMPLES)
+        _install()
+
+
+def disable_sampling() -> None:
+    """
+    Stop sampling, restoring the original, uninstrumented functions unless
+    instrumentation is enabled.
+
+    Samples recorded so far are kept. Disabling sampling when it is not enabled
+    has no effect.
+
+    """
+    global _SAMPLER  # pylint: disable=global-statement
+    with _LOCK:
+        if _SAMPLER is not None:
+            _SAMPLER = None
+            _install()
+
+
+def sampled_calls() -> typing.List[types.CallSample]:
+    """
+    Return the calls sampled so far, oldest first, as a :class:`list` of
+    :class:`~webcolors.CallSample`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> enable_sampling(rate=2)
+        >>> import webcolors
+        >>> for value in ("#fff", "navy", "#000080", "chucknorris"):
+        ...     _ = webcolors.html5_parse_legacy_color(value)
+        >>> disable_sampling()
+        >>> [
+        ...     (call.format, call.length, call.step)
+        ...     for call in sampled_calls()
+        ...     if call.function == "html5_parse_legacy_color"
+        ... ]
+        [('name', 4, 5), ('name', 11, 20)]
+
+    """
+    return list(_SAMPLES)
+
+
+def reset_instrumentation() -> None:
+    """
+    Discard all recorded statistics and samples.
+
+    """
+    with _LOCK:
+        for stats in _STATS.values():
+            stats.reset()
+        _SAMPLES.clear()
+
+
+def instrumentation_snapshot() -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """
+    Return the statistics recorded so far, as a :class:`dict` mapping the name
+    of each function which has been called to a :class:`dict` with the keys:
+
+    ``"calls"``
+       The number of calls.
+
+    ``"errors"``
+       The number of calls which raised an exception.
+
+    ``"sum"``
+       The total time spent in the function, in seconds.
+
+    ``"buckets"``
+       A :class:`dict` mapping the upper bound, in seconds, of each bucket of
+       the latency histogram (the last being :data:`math.inf`) to the number
+       of calls which took at most that long.
+
+    Examples:
+
+    .. doctest::
+
+        >>> reset_instrumentation()
+        >>> enable_instrumentation()
+        >>> import webcolors
+        >>> webcolors.hex_to_rgb("#fff")
+        IntegerRGB(red=255, green=255, blue=255)
+        >>> disable_instrumentation()
+        >>> stats = instrumentation_snapshot()["hex_to_rgb"]
+        >>> stats["calls"], stats["errors"]
+        (1, 0)
+
+    """
+    with _LOCK:
+        stats = dict(_STATS)
+    return {
+        name: function_stats.snapshot()
+        for name, function_stats in sorted(stats.items())
+        if function_stats.calls
+    }
+
+
+def instrumentation_to_prometheus() -> str:
+    """
+    Return the statistics recorded so far in the `Prometheus text exposition
+    format
+    <https://prometheus.io/docs/instrumenting/exposition_formats/#text-based-format>`_,
+    as the counters ``webcolors_calls_total`` and ``webcolors_errors_total``
+    and the histogram ``webcolors_call_duration_seconds``, each labelled with
+    the name of the function.
+
+    """
+    snapshot = instrumentation_snapshot()
+    lines = [
+        "# HELP webcolors_calls_total Calls to webcolors functions.",
+        "# TYPE webcolors_calls_total counter",
+    ]
+    lines.extend(
+        f'webcolors_calls_total{{function="{name}"}} {stats["calls"]}'
+        for name, stats in snapshot.items()
+    )
+    lines.extend(
+        [
+            "# HELP webcolors_errors_total Calls to webcolors functions which raised.",
+            "# TYPE webcolors_errors_total counter",
+        ]
+    )
+    lines.extend(
+        f'webcolors_errors_total{{function="{name}"}} {stats["errors"]}'
+        for name, stats in snapshot.items()
+    )
+    lines.extend(
+        [
+            "# HELP webcolors_call_duration_seconds Latency of webcolors functions.",
+            "# TYPE webcolors_call_duration_seconds histogram",
+        ]
+    )
+    for name, stats in snapshot.items():
+        for bound, count in stats["buckets"].items():
+            label = "+Inf" if bound == math.inf else repr(bound)
+            lines.append(
+                f"webcolors_call_duration_seconds_bucket"
+                f'{{function="{name}",le="{label}"}} {count}'
+            )
+        lines.append(
+            f'webcolors_call_duration_seconds_sum{{function="{name}"}} {stats["sum"]!r}'
+        )
+        lines.append(
+            f'webcolors_call_duration_seconds_count{{function="{name}"}} '
+            f'{stats["calls"]}'
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,394 @@
+"""
+Lazy conversion of iterables of color values, for composing conversions into
+streaming pipelines.
+
+"""
+import functools
+import typing
+
+from . import batch, constants, conversion, tables, types
+
+
+def _convert(name: str, spec: typing.Optional[str], value: typing.Any) -> typing.Any:
+    """
+    Internal helper which converts a value with the conversion function of the
+    given name, looked up for each value so that an iterator sees the function
+    as wrapped or unwrapped by instrumentation at the time.
+
+    """
+    function = getattr(conversion, name)
+    return function(value) if spec is None else function(value, spec=spec)
+
+
+def _iterate(
+    name: str,
+    values: typing.Iterable[typing.Any],
+    errors: str,
+    spec: typing.Optional[str] = None,
+) -> typing.Iterator[typing.Any]:
+    """
+    Internal helper which checks the error policy and specification, if any,
+    when called (rather than when the first value is converted), and returns
+    an iterator lazily applying the named conversion function to each value.
+
+    """
+    # pylint: disable=protected-access
+    batch._check_errors(errors)
+    if spec is not None:
+        tables.check_spec(spec)
+    return batch._convert(functools.partial(_convert, name, spec), values, errors)
+
+
+# Conversions from color names to other formats.
+# --------------------------------------------------------------------------------
+
+
+def iter_name_to_hex(
+    values: typing.Iterable[str], spec: str = constants.CSS3, errors: str = "strict"
+) -> typing.Iterator[typing.Optional[str]]:
+    """
+    Lazily convert each of an iterable of color names, as by
+    :func:`name_to_hex`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_name_to_hex(["white", "navy"]))
+        ['#ffffff', '#000080']
+        >>> list(iter_name_to_hex(["white", "goldenrod"], spec=HTML4, errors="replace"))
+        ['#ffffff', None]
+
+    :param values: The color names to convert.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, when the
+       given spec is not supported, or (on iteration, with the ``"strict"``
+       policy) when a name cannot be converted.
+
+    """
+    return _iterate("name_to_hex", values, errors, spec)
+
+
+def iter_name_to_rgb(
+    values: typing.Iterable[str], spec: str = constants.CSS3, errors: str = "strict"
+) -> typing.Iterator[typing.Optional[types.IntegerRGB]]:
+    """
+    Lazily convert each of an iterable of color names, as by
+    :func:`name_to_rgb`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_name_to_rgb(["navy", "ultraviolet"], errors="ignore"))
+        [IntegerRGB(red=0, green=0, blue=128)]
+
+    :param values: The color names to convert.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, when the
+       given spec is not supported, or (on iteration, with the ``"strict"``
+       policy) when a name cannot be converted.
+
+    """
+    return _iterate("name_to_rgb", values, errors, spec)
+
+
+def iter_name_to_rgb_percent(
+    values: typing.Iterable[str], spec: str = constants.CSS3, errors: str = "strict"
+) -> typing.Iterator[typing.Optional[types.PercentRGB]]:
+    """
+    Lazily convert each of an iterable of color names, as by
+    :func:`name_to_rgb_percent`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_name_to_rgb_percent(["navy"]))
+        [PercentRGB(red='0%', green='0%', blue='50%')]
+
+    :param values: The color names to convert.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, when the
+       given spec is not supported, or (on iteration, with the ``"strict"``
+       policy) when a name cannot be converted.
+
+    """
+    return _iterate("name_to_rgb_percent", values, errors, spec)
+
+
+# Conversions from hexadecimal color values to other formats.
+# --------------------------------------------------------------------------------
+
+
+def iter_hex_to_name(
+    values: typing.Iterable[typing.Union[str, types.BytesLike]],
+    spec: str = constants.CSS3,
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[str]]:
+    """
+    Lazily convert each of an iterable of hexadecimal color values, as by
+    :func:`hex_to_name`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_hex_to_name(["#fff", "#123456", "#000080"], errors="replace"))
+        ['white', None, 'navy']
+
+    :param values: The hexadecimal color values to convert.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, when the
+       given spec is not supported, or (on iteration, with the ``"strict"``
+       policy) when a value is invalid or has no name.
+
+    """
+    return _iterate("hex_to_name", values, errors, spec)
+
+
+def iter_hex_to_names(
+    values: typing.Iterable[typing.Union[str, types.BytesLike]],
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[typing.Dict[str, typing.Tuple[str, ...]]]]:
+    """
+    Lazily convert each of an iterable of hexadecimal color values, as by
+    :func:`hex_to_names`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_hex_to_names(["#000080"]))
+        [{'html4': ('navy',), 'css2': ('navy',), 'css21': ('navy',), 'css3': ('navy',)}]
+
+    :param values: The hexadecimal color values to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, or (on
+       iteration, with the ``"strict"`` policy) when a value is invalid.
+
+    """
+    return _iterate("hex_to_names", values, errors)
+
+
+def iter_hex_to_rgb(
+    values: typing.Iterable[typing.Union[str, types.BytesLike]],
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[types.IntegerRGB]]:
+    """
+    Lazily convert each of an iterable of hexadecimal color values, as by
+    :func:`hex_to_rgb`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_hex_to_rgb(["#fff", "#000080"]))
+        [IntegerRGB(red=255, green=255, blue=255), IntegerRGB(red=0, green=0, blue=128)]
+
+    :param values: The hexadecimal color values to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, or (on
+       iteration, with the ``"strict"`` policy) when a value is invalid.
+
+    """
+    return _iterate("hex_to_rgb", values, errors)
+
+
+def iter_hex_to_rgb_percent(
+    values: typing.Iterable[typing.Union[str, types.BytesLike]],
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[types.PercentRGB]]:
+    """
+    Lazily convert each of an iterable of hexadecimal color values, as by
+    :func:`hex_to_rgb_percent`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_hex_to_rgb_percent(["#000080", "#00008g"], errors="ignore"))
+        [PercentRGB(red='0%', green='0%', blue='50%')]
+
+    :param values: The hexadecimal color values to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, or (on
+       iteration, with the ``"strict"`` policy) when a value is invalid.
+
+    """
+    return _iterate("hex_to_rgb_percent", values, errors)
+
+
+# Conversions from integer rgb() triplets to other formats.
+# --------------------------------------------------------------------------------
+
+
+def iter_rgb_to_name(
+    values: typing.Iterable[types.IntTuple],
+    spec: str = constants.CSS3,
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[str]]:
+    """
+    Lazily convert each of an iterable of integer ``rgb()`` triplets, as by
+    :func:`rgb_to_name`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_rgb_to_name([(0, 0, 128), (0, 0, 129)], errors="replace"))
+        ['navy', None]
+
+    :param values: The ``rgb()`` triplets to convert.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, when the
+       given spec is not supported, or (on iteration, with the ``"strict"``
+       policy) when a triplet has no name.
+
+    """
+    return _iterate("rgb_to_name", values, errors, spec)
+
+
+def iter_rgb_to_hex(
+    values: typing.Iterable[types.IntTuple], errors: str = "strict"
+) -> typing.Iterator[typing.Optional[str]]:
+    """
+    Lazily convert each of an iterable of integer ``rgb()`` triplets, as by
+    :func:`rgb_to_hex`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_rgb_to_hex([(255, 255, 255), (0, 0, 128)]))
+        ['#ffffff', '#000080']
+
+    :param values: The ``rgb()`` triplets to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy.
+
+    """
+    return _iterate("rgb_to_hex", values, errors)
+
+
+def iter_rgb_to_rgb_percent(
+    values: typing.Iterable[types.IntTuple], errors: str = "strict"
+) -> typing.Iterator[typing.Optional[types.PercentRGB]]:
+    """
+    Lazily convert each of an iterable of integer ``rgb()`` triplets, as by
+    :func:`rgb_to_rgb_percent`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_rgb_to_rgb_percent([(0, 0, 128)]))
+        [PercentRGB(red='0%', green='0%', blue='50%')]
+
+    :param values: The ``rgb()`` triplets to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy.
+
+    """
+    return _iterate("rgb_to_rgb_percent", values, errors)
+
+
+# Conversions from percentage rgb() triplets to other formats.
+# --------------------------------------------------------------------------------
+
+
+def iter_rgb_percent_to_name(
+    values: typing.Iterable[types.PercentTuple],
+    spec: str = constants.CSS3,
+    errors: str = "strict",
+) -> typing.Iterator[typing.Optional[str]]:
+    """
+    Lazily convert each of an iterable of percentage ``rgb()`` triplets, as
+    by :func:`rgb_percent_to_name`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_rgb_percent_to_name([("0%", "0%", "50%")]))
+        ['navy']
+
+    :param values: The ``rgb()`` triplets to convert.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, when the
+       given spec is not supported, or (on iteration, with the ``"strict"``
+       policy) when a triplet has no name.
+
+    """
+    return _iterate("rgb_percent_to_name", values, errors, spec)
+
+
+def iter_rgb_percent_to_hex(
+    values: typing.Iterable[types.PercentTuple], errors: str = "strict"
+) -> typing.Iterator[typing.Optional[str]]:
+    """
+    Lazily convert each of an iterable of percentage ``rgb()`` triplets, as
+    by :func:`rgb_percent_to_hex`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_rgb_percent_to_hex([("100%", "100%", "0%")]))
+        ['#ffff00']
+
+    :param values: The ``rgb()`` triplets to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, or (on
+       iteration, with the ``"strict"`` policy) when a triplet is invalid.
+
+    """
+    return _iterate("rgb_percent_to_hex", values, errors)
+
+
+def iter_rgb_percent_to_rgb(
+    values: typing.Iterable[types.PercentTuple], errors: str = "strict"
+) -> typing.Iterator[typing.Optional[types.IntegerRGB]]:
+    """
+    Lazily convert each of an iterable of percentage ``rgb()`` triplets, as
+    by :func:`rgb_percent_to_rgb`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(iter_rgb_percent_to_rgb([("0%", "0%", "50%")]))
+        [IntegerRGB(red=0, green=0, blue=128)]
+
+    :param values: The ``rgb()`` triplets to convert.
+    :param errors: The policy for handling values which cannot be converted:
+       ``"strict"``, ``"replace"`` or ``"ignore"``. Default is ``"strict"``.
+    :raises ValueError: when ``errors`` is not a supported policy, or (on
+       iteration, with the ``"strict"`` policy) when a triplet is invalid.
+
+    """
+    return _iterate("rgb_percent_to_rgb", values, errors)
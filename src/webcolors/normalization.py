@@ -2,10 +2,39 @@
 Normalization utilities for color values.
 
 """
+import binascii
+import typing
+
 from . import constants, types
 
 
-def normalize_hex(hex_value: str) -> str:
+def _hex_bytes_to_rgb(hex_value: types.BytesLike) -> types.IntegerRGB:
+    """
+    Internal helper for converting a bytes-like hexadecimal color value
+    directly to an integer triplet, without first decoding it to a
+    :class:`str`.
+
+    """
+    view = memoryview(hex_value).cast("B")
+    size = len(view)
+    try:
+        if size not in (4, 7) or view[0] != 0x23:  # 0x23 is "#".
+            raise binascii.Error
+        if size == 7:
+            return types.IntegerRGB._make(binascii.unhexlify(view[1:]))
+        # Pad three digits to an even count so unhexlify() can validate them.
+        packed = int.from_bytes(binascii.unhexlify(b"0" + view[1:]), "big")
+    except binascii.Error:
+        raise ValueError(
+            f'"{bytes(view).decode("ascii", "replace")}" is not a valid '
+            f"hexadecimal color value."
+        ) from None
+    return types.IntegerRGB(
+        (packed >> 8) * 17, (packed >> 4 & 0xF) * 17, (packed & 0xF) * 17
+    )
+
+
+def normalize_hex(hex_value: typing.Union[str, types.BytesLike]) -> str:
     """
     Normalize a hexadecimal color value to a string consisting of the
     character `#` followed by six lowercase hexadecimal digits (what
@@ -37,10 +66,17 @@ def normalize_hex(hex_value: str) -> str:
             ...
         ValueError: '0099cc' is not a valid hexadecimal color value.
 
+    A bytes-like object (:class:`bytes`, :class:`bytearray` or
+    :class:`memoryview`) containing an ASCII-encoded hexadecimal color
+    value is also accepted.
+
     :param hex_value: The hexadecimal color value to normalize.
     :raises ValueError: when the input is not a valid hexadecimal color value.
 
     """
+    if not isinstance(hex_value, str):
+        red, green, blue = _hex_bytes_to_rgb(hex_value)
+        return f"#{red:02x}{green:02x}{blue:02x}"
     match = constants.HEX_COLOR_RE.match(hex_value)
     if match is None:
         raise ValueError(f'"{hex_value}" is not a valid hexadecimal color value.')
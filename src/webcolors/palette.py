@@ -0,0 +1,173 @@
+"""
+Palette extraction by median-cut color quantization.
+
+"""
+import bisect
+import collections
+import itertools
+import typing
+
+from . import constants, conversion, normalization, pixels, tables, types
+
+# A box of the color space being quantized: a list of (packed color, count)
+# pairs, where each packed color is an integer of the form 0xRRGGBB.
+_Box = typing.List[typing.Tuple[int, int]]
+
+# Bit offsets of the red, green and blue channels of a packed color.
+_SHIFTS = (16, 8, 0)
+
+
+def _count_triplets(
+    rgb_triplets: typing.Iterable[types.IntTuple],
+) -> typing.Counter[int]:
+    """
+    Internal helper which counts the occurrences of each color, as integers of
+    the form ``0xRRGGBB``, in a collection of ``rgb()`` triplets.
+
+    """
+    return collections.Counter(
+        red << 16 | green << 8 | blue
+        for red, green, blue in map(
+            normalization.normalize_integer_triplet, rgb_triplets
+        )
+    )
+
+
+def _count_colors(
+    colors: typing.Union[types.BytesLike, typing.Iterable[types.IntTuple]],
+    channels: int,
+    step: int,
+) -> typing.Counter[int]:
+    """
+    Internal helper which counts the occurrences of each color, as integers of
+    the form ``0xRRGGBB``, in a raw pixel buffer or a collection of ``rgb()``
+    triplets.
+
+    """
+    try:
+        view = memoryview(colors)
+    except TypeError:
+        return _count_triplets(colors)
+    # pylint: disable=protected-access
+    return pixels._count_colors(view, channels, step)
+
+
+def _widest_channel(box: _Box) -> typing.Tuple[int, int]:
+    """
+    Internal helper which returns the range of the widest channel of a box,
+    and the bit offset of that channel.
+
+    """
+    widths = []
+    for shift in _SHIFTS:
+        values = [packed >> shift & 0xFF for packed, _ in box]
+        widths.append((max(values) - min(values), shift))
+    return max(widths)
+
+
+def _split(box: _Box, shift: int) -> typing.Tuple[_Box, _Box]:
+    """
+    Internal helper which splits a box at the weighted median of the channel
+    at the given bit offset.
+
+    """
+    box.sort(key=lambda color: color[0] >> shift & 0xFF)
+    totals = list(itertools.accumulate(count for _, count in box))
+    # The median is the first color whose running total reaches half the
+    # total; keep at least one color on each side of the split.
+    index = min(bisect.bisect_left(totals, totals[-1] / 2) + 1, len(box) - 1)
+    return box[:index], box[index:]
+
+
+def _average(box: _Box) -> typing.Tuple[types.IntegerRGB, int]:
+    """
+    Internal helper which returns the count-weighted average color of a box,
+    and its total count.
+
+    """
+    total = sum(count for _, count in box)
+    sums = (
+        sum((packed >> shift & 0xFF) * count for packed, count in box)
+        for shift in _SHIFTS
+    )
+    # Round half up, in integer arithmetic.
+    return (
+        types.IntegerRGB._make((value + total // 2) // total for value in sums),
+        total,
+    )
+
+
+def extract_palette(
+    colors: typing.Union[types.BytesLike, typing.Iterable[types.IntTuple]],
+    count: int = 5,
+    channels: int = 3,
+    spec: str = constants.CSS3,
+    step: int = 1,
+) -> typing.List[types.PaletteColor]:
+    """
+    Extract the dominant colors of a raw pixel buffer or a collection of
+    ``rgb()`` triplets, using median-cut quantization.
+
+    The distinct colors of the input are counted, then repeatedly divided
+    into boxes, always splitting the box with the widest range of values in
+    any one channel at the weighted median of that channel, until there are
+    ``count`` boxes (or no box can be divided further). The average color of
+    each box is returned as a :class:`~webcolors.PaletteColor`, along with
+    its hexadecimal value, the name of its nearest named color, and the
+    number of pixels it represents, ordered from most to least common (and
+    then by color value).
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb = bytes([255, 255, 255] * 3 + [0, 0, 128, 0, 0, 130])
+        >>> for color in extract_palette(rgb, count=2):
+        ...     print(color.hex, color.name, color.count)
+        #ffffff white 3
+        #000081 navy 2
+
+    :param colors: The pixel buffer (see :ref:`the conversions of raw pixel
+       buffers <pixel-conversions>`), or an iterable of ``rgb()`` triplets.
+    :param count: The maximum number of colors to extract. Default is ``5``.
+    :param channels: For a pixel buffer, the number of channels in each
+       pixel: ``3`` for RGB888, ``4`` for RGBA8888. Default is ``3``.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param step: For a pixel buffer, use only every ``step``-th pixel.
+       Default is ``1``.
+    :raises ValueError: when ``count`` is less than 1, when a pixel buffer
+       does not hold a whole number of pixels, or when the given spec is not
+       supported.
+
+    """
+    if count < 1:
+        raise ValueError(f"Palette must have at least 1 color, not {count}.")
+    tables.check_spec(spec)
+    counts = _count_colors(colors, channels, step)
+    # Each box is kept alongside the range and bit offset of its widest
+    # channel, so that the range is only computed once per box.
+    boxes = [(_widest_channel(box), box) for box in [list(counts.items())] if box]
+    while 0 < len(boxes) < count:
+        index = max(range(len(boxes)), key=lambda position: boxes[position][0])
+        (width, shift), box = boxes[index]
+        if width == 0:
+            # Every box holds a single color.
+            break
+        del boxes[index]
+        boxes.extend((_widest_channel(half), half) for half in _split(box, shift))
+    palette = []
+    for rgb, total in sorted(
+        (_average(box) for _, box in boxes),
+        key=lambda average: (-average[1], average[0]),
+    ):
+        packed = rgb.red << 16 | rgb.green << 8 | rgb.blue
+        palette.append(
+            types.PaletteColor(
+                rgb,
+                conversion.rgb_to_hex(rgb),
+                tables.nearest_name(packed, spec),
+                total,
+            )
+        )
+    return palette
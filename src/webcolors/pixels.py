@@ -0,0 +1,274 @@
+"""
+Conversions of raw interleaved pixel buffers.
+
+A pixel buffer is any object supporting the buffer protocol whose bytes are
+interleaved 8-bit channels, either RGB888 (three bytes per pixel) or RGBA8888
+(four bytes per pixel, with the alpha channel ignored), laid out as a sequence
+of scanlines of equal width.
+
+"""
+import array
+import binascii
+import collections
+import sys
+import typing
+
+from . import constants, tables, types
+
+# An array typecode whose items are exactly four bytes, for unpacking pixels
+# into integers of the form 0xRRGGBB.
+_UINT32 = next(code for code in "IL" if array.array(code).itemsize == 4)
+
+# The number of sampled pixels unpacked at a time when counting colors.
+_HISTOGRAM_CHUNK_PIXELS = 65536
+
+
+def _pixel_view(buffer: types.BytesLike, channels: int) -> memoryview:
+    """
+    Internal helper which validates the number of channels of a pixel buffer
+    and returns a flat view of its bytes.
+
+    """
+    if channels not in (3, 4):
+        raise ValueError(f"Pixels must have 3 or 4 channels, not {channels}.")
+    view = memoryview(buffer).cast("B")
+    if len(view) % channels:
+        raise ValueError(
+            f"Buffer of {len(view)} bytes does not hold a whole number of "
+            f"pixels of {channels} channels."
+        )
+    return view
+
+
+def _scanlines(
+    buffer: types.BytesLike, width: int, channels: int
+) -> typing.Iterator[memoryview]:
+    """
+    Internal helper which validates the shape of a pixel buffer and yields
+    each of its scanlines, without copying.
+
+    """
+    view = _pixel_view(buffer, channels)
+    if width < 1:
+        raise ValueError(f"Scanline width must be at least 1 pixel, not {width}.")
+    row_size = width * channels
+    if len(view) % row_size:
+        raise ValueError(
+            f"Buffer of {len(view)} bytes does not hold a whole number of "
+            f"{width}-pixel scanlines of {channels} channels."
+        )
+    for start in range(0, len(view), row_size):
+        yield view[start : start + row_size]
+
+
+def _rgb888(scanline: memoryview, channels: int) -> types.BytesLike:
+    """
+    Internal helper which returns a scanline as RGB888 bytes, dropping the
+    alpha channel if present.
+
+    """
+    if channels == 3:
+        return scanline
+    rgb = bytearray(len(scanline) // 4 * 3)
+    rgb[0::3] = scanline[0::4]
+    rgb[1::3] = scanline[1::4]
+    rgb[2::3] = scanline[2::4]
+    return rgb
+
+
+def _packed_ints(pixels: memoryview, channels: int, step: int = 1) -> typing.List[int]:
+    """
+    Internal helper which unpacks every ``step``-th pixel of a flat view of
+    pixels into integers of the form ``0xRRGGBB``.
+
+    """
+    stride = channels * step
+    red = pixels[0::stride]
+    padded = bytearray(len(red) * 4)
+    padded[1::4] = red
+    padded[2::4] = pixels[1::stride]
+    padded[3::4] = pixels[2::stride]
+    packed = array.array(_UINT32, padded)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _count_colors(
+    buffer: types.BytesLike, channels: int, step: int
+) -> typing.Counter[int]:
+    """
+    Internal helper which counts the pixels of each color, as integers of the
+    form ``0xRRGGBB``, in every ``step``-th pixel of a pixel buffer.
+
+    """
+    if step < 1:
+        raise ValueError(f"Sampling step must be at least 1, not {step}.")
+    view = _pixel_view(buffer, channels)
+    # Unpack in fixed-size chunks, so that memory use is bounded by the number
+    # of distinct colors rather than the size of the buffer.
+    chunk_size = _HISTOGRAM_CHUNK_PIXELS * channels * step
+    colors: typing.Counter[int] = collections.Counter()
+    for start in range(0, len(view), chunk_size):
+        colors.update(_packed_ints(view[start : start + chunk_size], channels, step))
+    return colors
+
+
+def pixels_to_hex(
+    buffer: types.BytesLike, width: int, channels: int = 3
+) -> typing.Iterator[typing.List[str]]:
+    """
+    Convert a raw pixel buffer to normalized hexadecimal color values,
+    yielding a :class:`list` of values for each scanline.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(pixels_to_hex(b"\\xff\\xff\\xff\\x00\\x00\\x80", width=2))
+        [['#ffffff', '#000080']]
+        >>> rgba = b"\\xff\\xff\\xff\\x7f\\x00\\x00\\x80\\xff"
+        >>> list(pixels_to_hex(rgba, width=1, channels=4))
+        [['#ffffff'], ['#000080']]
+
+    :param buffer: The pixel buffer.
+    :param width: The number of pixels in each scanline.
+    :param channels: The number of channels in each pixel: ``3`` for RGB888,
+       ``4`` for RGBA8888. Default is ``3``.
+    :raises ValueError: when the buffer does not hold a whole number of
+       scanlines of the given shape.
+
+    """
+    for scanline in _scanlines(buffer, width, channels):
+        digits = binascii.hexlify(_rgb888(scanline, channels)).decode("ascii")
+        yield [f"#{digits[start : start + 6]}" for start in range(0, len(digits), 6)]
+
+
+def pixels_to_ints(
+    buffer: types.BytesLike, width: int, channels: int = 3
+) -> typing.Iterator[typing.List[int]]:
+    """
+    Convert a raw pixel buffer to integer color values of the form
+    ``0xRRGGBB``, yielding a :class:`list` of values for each scanline.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(pixels_to_ints(b"\\xff\\xff\\xff\\x00\\x00\\x80", width=2))
+        [[16777215, 128]]
+
+    :param buffer: The pixel buffer.
+    :param width: The number of pixels in each scanline.
+    :param channels: The number of channels in each pixel: ``3`` for RGB888,
+       ``4`` for RGBA8888. Default is ``3``.
+    :raises ValueError: when the buffer does not hold a whole number of
+       scanlines of the given shape.
+
+    """
+    for scanline in _scanlines(buffer, width, channels):
+        yield _packed_ints(scanline, channels)
+
+
+def pixels_to_names(
+    buffer: types.BytesLike,
+    width: int,
+    channels: int = 3,
+    spec: str = constants.CSS3,
+    nearest: bool = False,
+) -> typing.Iterator[typing.List[typing.Optional[str]]]:
+    """
+    Convert a raw pixel buffer to normalized color names, yielding a
+    :class:`list` of names for each scanline.
+
+    By default, only exact matches are named, and pixels whose color has no
+    name in the given specification are represented by :data:`None`. With
+    ``nearest=True``, every pixel is instead given the name of the nearest
+    named color (by Euclidean distance in RGB space).
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb = b"\\xff\\xff\\xff\\x00\\x00\\x81"
+        >>> list(pixels_to_names(rgb, width=2))
+        [['white', None]]
+        >>> list(pixels_to_names(rgb, width=2, nearest=True))
+        [['white', 'navy']]
+
+    :param buffer: The pixel buffer.
+    :param width: The number of pixels in each scanline.
+    :param channels: The number of channels in each pixel: ``3`` for RGB888,
+       ``4`` for RGBA8888. Default is ``3``.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param nearest: Whether to name every pixel with its nearest named color,
+       rather than only exact matches.
+    :raises ValueError: when the buffer does not hold a whole number of
+       scanlines of the given shape, or when the given spec is not supported.
+
+    """
+    names = tables.int_to_name(spec)
+    nearest_name = tables.nearest_names(spec)
+    for scanline in _scanlines(buffer, width, channels):
+        packed = _packed_ints(scanline, channels)
+        if nearest:
+            yield [names.get(value) or nearest_name(value) for value in packed]
+        else:
+            yield [names.get(value) for value in packed]
+
+
+def pixels_to_name_histogram(
+    buffer: types.BytesLike,
+    channels: int = 3,
+    spec: str = constants.CSS3,
+    nearest: bool = False,
+    step: int = 1,
+) -> typing.Counter[typing.Optional[str]]:
+    """
+    Count the named colors in a raw pixel buffer, returning a
+    :class:`~collections.Counter` mapping each color name to the number of
+    pixels of that color.
+
+    The buffer is read in a single pass, and each distinct color is looked up
+    only once. By default, only exact matches are named, and pixels whose color
+    has no name in the given specification are counted under the key
+    :data:`None`. With ``nearest=True``, every pixel is instead counted under
+    the name of the nearest named color (by Euclidean distance in RGB space).
+
+    Large images can be downsampled by passing ``step``, in which case only
+    every ``step``-th pixel is counted.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb = b"\\xff\\xff\\xff\\x00\\x00\\x80\\x00\\x00\\x81\\xff\\xff\\xff"
+        >>> pixels_to_name_histogram(rgb)
+        Counter({'white': 2, 'navy': 1, None: 1})
+        >>> pixels_to_name_histogram(rgb, nearest=True)
+        Counter({'white': 2, 'navy': 2})
+        >>> pixels_to_name_histogram(rgb, step=2)
+        Counter({'white': 1, None: 1})
+
+    :param buffer: The pixel buffer.
+    :param channels: The number of channels in each pixel: ``3`` for RGB888,
+       ``4`` for RGBA8888. Default is ``3``.
+    :param spec: The specification from which to draw the list of color
+       names. Default is :data:`CSS3`.
+    :param nearest: Whether to count every pixel under its nearest named
+       color, rather than only exact matches.
+    :param step: Count only every ``step``-th pixel. Default is ``1``.
+    :raises ValueError: when the buffer does not hold a whole number of
+       pixels, when ``step`` is less than 1, or when the given spec is not
+       supported.
+
+    """
+    names = tables.int_to_name(spec)
+    histogram: typing.Counter[typing.Optional[str]] = collections.Counter()
+    for packed, count in _count_colors(buffer, channels, step).items():
+        name = names.get(packed)
+        if name is None and nearest:
+            name = tables.nearest_name(packed, spec)
+        histogram[name] += count
+    return histogram
@@ -0,0 +1,240 @@
+"""
+Lookup tables placed in shared memory, so that many processes can use a single
+copy.
+
+"""
+import array
+import json
+import struct
+import sys
+import typing
+
+from . import constants, tables
+
+# The type of each entry of a distance table: the squared difference of two
+# channel values, at most 255 ** 2, fits in an unsigned 16-bit integer.
+_ITEM = "H"
+
+# A block of shared tables starts with the length of a JSON header, which
+# lists, for each specification, its color names and the offset of its
+# distance tables from the end of the header, rounded up to _ALIGNMENT bytes.
+_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+
+# The shared tables opened by this process, kept open until closed.
+_OPEN: typing.List["SharedTables"] = []
+
+
+def _pack(specs: typing.Iterable[str]) -> bytes:
+    """
+    Internal helper which lays out the header and distance tables of the given
+    specifications as a block of shared tables.
+
+    """
+    # pylint: disable=protected-access
+    header: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    offsets: typing.Dict[int, int] = {}
+    data = array.array(_ITEM)
+    for spec in specs:
+        names, *channels = tables._distance_tables(spec)
+        # CSS2 has the same colors as HTML 4, so their tables are stored once.
+        key = id(tables.int_to_name(spec))
+        if key not in offsets:
+            offsets[key] = len(data) * data.itemsize
+            for channel in channels:
+                for row in channel:
+                    data.extend(row)
+        header[spec] = {"names": list(names), "offset": offsets[key]}
+    encoded = json.dumps(header).encode("utf-8")
+    return (
+        _LENGTH.pack(len(encoded))
+        + encoded.ljust(_data_start(len(encoded)) - _LENGTH.size, b" ")
+        + data.tobytes()
+    )
+
+
+def _data_start(length: int) -> int:
+    """
+    Internal helper which returns the offset of the distance tables in a block
+    whose header is ``length`` bytes long.
+
+    """
+    return -(-(_LENGTH.size + length) // _ALIGNMENT) * _ALIGNMENT
+
+
+class SharedTables:
+    """
+    The tables used to find the nearest named color to a color with no name
+    (as by :func:`pixels_to_names`, :func:`pixels_to_name_histogram` and
+    :func:`extract_palette`), placed in a block of shared memory, so that a
+    pool of worker processes can use one copy of them rather than each
+    building its own.
+
+    Create the block once, with ``create=True``, and attach to it by name in
+    each worker; processes forked after the block was created need not attach.
+    Once created or attached, the tables are used by the current process until
+    closed. A block holds the tables of every specification in about 250KB,
+    where each process would otherwise build, for each specification used,
+    tables taking about 4MB.
+
+    The block persists until unlinked, which the creating process should do
+    once the workers are finished with it; used as a context manager, a block
+    is closed on exit, and unlinked if it was created.
+
+    Examples:
+
+    .. doctest::
+
+        >>> with SharedTables(create=True, specs=["css3"]) as shared:
+        ...     attached = SharedTables(shared.name)
+        ...     attached.specs
+        ...     attached.close()
+        ['css3']
+
+    .. note::
+
+       Shared tables require Python 3.8 or later, and raise
+       :exc:`RuntimeError` on Python 3.7. Before Python 3.13, a
+       process which attaches to a block, and was not started by the process
+       which created it or by one of that process's workers, unlinks the block
+       when it exits.
+
+    :param name: The name of the block to attach to, or, with ``create=True``,
+       the name of the block to create (by default, a unique name is
+       generated).
+    :param create: Whether to create the block, rather than attach to it.
+    :param specs: The specifications whose tables to create. Default is all
+       supported specifications.
+    :raises RuntimeError: when running on Python 3.7.
+    :raises FileNotFoundError: when there is no block to attach to with the
+       given name.
+    :raises ValueError: when attaching with no name given, or when a
+       specification is not supported.
+
+    """
+
+    def __init__(
+        self,
+        name: typing.Optional[str] = None,
+        create: bool = False,
+        specs: typing.Optional[typing.Iterable[str]] = None,
+    ):
+        """
+        Create, or attach to, the block of shared tables, and use the tables.
+
+        """
+        if sys.version_info < (3, 8):  # pragma: no cover
+            raise RuntimeError("Shared tables require Python 3.8 or later.")
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        if create:
+            specs = list(constants.SUPPORTED_SPECIFICATIONS if specs is None else specs)
+            for spec in specs:
+                tables.check_spec(spec)
+            block = _pack(specs)
+            self._memory = shared_memory.SharedMemory(
+                name=name, create=True, size=len(block)
+            )
+            self._memory.buf[: len(block)] = block
+        elif name is None:
+            raise ValueError("The name of the shared tables to attach to is required.")
+        elif sys.version_info >= (3, 13):  # pragma: no cover
+            # Attaching to a block would otherwise register it to be unlinked
+            # when this process exits, which is left to the process which
+            # created it. Before Python 3.13, that happens only in processes
+            # not started by the creating process or its workers.
+            # pylint: disable-next=unexpected-keyword-arg
+            self._memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        self.name: str = self._memory.name
+        self.created = create
+        self._views: typing.List[memoryview] = []
+        self._tables: typing.Dict[str, tables._DistanceTables] = {}
+        self._use()
+        _OPEN.append(self)
+
+    def _use(self) -> None:
+        """
+        Read the header, and use the tables of each specification in place of
+        any built by this process.
+
+        """
+        buffer = self._memory.buf
+        (length,) = _LENGTH.unpack_from(buffer)
+        header = json.loads(bytes(buffer[_LENGTH.size : _LENGTH.size + length]))
+        # The tables of each offset, which those of CSS2 and HTML 4 share.
+        shared: typing.Dict[int, tables._DistanceTables] = {}
+        for spec, entry in header.items():
+            if entry["offset"] not in shared:
+                names = tuple(entry["names"])
+                size = 256 * len(names) * struct.calcsize(_ITEM)
+                offset = _data_start(length) + entry["offset"]
+                channels = []
+                for start in range(offset, offset + 3 * size, size):
+                    table = buffer[start : start + size].cast(_ITEM)
+                    rows = tuple(
+                        table[value * len(names) : (value + 1) * len(names)]
+                        for value in range(256)
+                    )
+                    self._views.extend((table, *rows))
+                    channels.append(rows)
+                shared[entry["offset"]] = (names, *channels)
+            self._tables[spec] = shared[entry["offset"]]
+        tables.DISTANCE_TABLES.update(self._tables)
+
+    @property
+    def specs(self) -> typing.List[str]:
+        """
+        The specifications whose tables are shared.
+
+        """
+        return list(self._tables)
+
+    def __enter__(self) -> "SharedTables":
+        """
+        Use the shared tables as a context manager, closing them on exit and
+        unlinking them if they were created.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        """
+        Close the shared tables, unlinking them if they were created.
+
+        """
+        self.close()
+        if self.created:
+            self.unlink()
+
+    def close(self) -> None:
+        """
+        Stop using the shared tables in the current process, which uses those
+        of other shared tables it has open instead, or builds its own tables
+        again when next needed. No conversions using the tables may be in
+        progress.
+
+        """
+        # pylint: disable=protected-access
+        if self in _OPEN:
+            _OPEN.remove(self)
+        for spec, shared in self._tables.items():
+            if tables.DISTANCE_TABLES.get(spec) is shared:
+                del tables.DISTANCE_TABLES[spec]
+        for other in _OPEN:
+            for spec, shared in other._tables.items():
+                tables.DISTANCE_TABLES.setdefault(spec, shared)
+        self._tables = {}
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """
+        Remove the block of shared tables, once every process has closed it.
+
+        """
+        self._memory.unlink()
@@ -0,0 +1,448 @@
+"""
+Lookup tables derived from the color definitions in :mod:`~webcolors.constants`.
+
+These are internal to webcolors, and are built on first use rather than at
+import time.
+
+"""
+import functools
+import itertools
+import operator
+import threading
+import typing
+from types import SimpleNamespace
+
+from . import constants
+
+
+def check_spec(spec: str) -> None:
+    """
+    Raise :exc:`ValueError` if ``spec`` is not a supported specification.
+
+    """
+    if spec not in constants.SUPPORTED_SPECIFICATIONS:
+        raise ValueError(constants.SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+
+
+# The tables built on first use by functions decorated with once(). Reading a
+# dict takes no lock, even on free-threaded builds of CPython, unlike calling a
+# function wrapped by functools.lru_cache.
+BUILT_TABLES: typing.Dict[str, typing.Any] = {}
+
+T = typing.TypeVar("T")
+
+
+def once(function: typing.Callable[[], T]) -> typing.Callable[[], T]:
+    """
+    Decorate a function of no arguments which builds a table, so that it is
+    built on first use and stored in :data:`BUILT_TABLES`. If several threads
+    build the table at once, the first stored is kept, so that all of them
+    share the same table.
+
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper() -> T:
+        """
+        Return the stored table, building it if necessary.
+
+        """
+        try:
+            return BUILT_TABLES[name]
+        except KeyError:
+            return BUILT_TABLES.setdefault(name, function())
+
+    return wrapper
+
+
+# The mappings of integer color values to names of each specification, built
+# on first use; CSS2 shares the mapping of HTML 4.
+INT_TO_NAME: typing.Dict[str, typing.Dict[int, str]] = {}
+
+
+def int_to_name(spec: str) -> typing.Dict[int, str]:
+    """
+    Return a mapping of integer color values of the form ``0xRRGGBB`` to the
+    normalized color names of the given specification.
+
+    """
+    check_spec(spec)
+    if spec == constants.CSS2:
+        spec = constants.HTML4
+    try:
+        return INT_TO_NAME[spec]
+    except KeyError:
+        pass
+    colors = {
+        int(hex_value[1:], 16): name
+        for hex_value, name in getattr(
+            constants, f"{spec.upper()}_HEX_TO_NAMES"
+        ).items()
+    }
+    # If several threads build the mapping at once, the first stored is kept.
+    return INT_TO_NAME.setdefault(spec, colors)
+
+
+@once
+def all_names_index() -> typing.Dict[str, typing.Dict[str, typing.Tuple[str, ...]]]:
+    """
+    Return a mapping of normalized hexadecimal values to a mapping of each
+    specification which names the value (in the order of
+    ``SUPPORTED_SPECIFICATIONS``) to every name it has in that specification,
+    the normalized name first.
+
+    """
+    index: typing.Dict[str, typing.Dict[str, typing.Tuple[str, ...]]] = {}
+    for spec in constants.SUPPORTED_SPECIFICATIONS:
+        hex_to_names = getattr(constants, f"{spec.upper()}_HEX_TO_NAMES")
+        aliases: typing.Dict[str, typing.List[str]] = {}
+        for name, hex_value in getattr(
+            constants, f"{spec.upper()}_NAMES_TO_HEX"
+        ).items():
+            if name != hex_to_names[hex_value]:
+                aliases.setdefault(hex_value, []).append(name)
+        for hex_value, name in hex_to_names.items():
+            index.setdefault(hex_value, {})[spec] = (
+                name,
+                *aliases.get(hex_value, ()),
+            )
+    return index
+
+
+# Every accepted spelling of the hexadecimal value of each named color, mapped
+# to its normalized value, which hex_to_name() looks up before normalizing a
+# value in full; empty unless filled by webcolors.enable_spelling_index().
+HEX_SPELLINGS: typing.Dict[str, str] = {}
+
+
+def hex_spellings() -> typing.Dict[str, str]:
+    """
+    Build a mapping of every accepted spelling of the hexadecimal value of
+    each named color, in any specification, to its normalized value.
+
+    Spellings include the three-digit form, where there is one, and every
+    combination of upper- and lowercase digits, so that a value can be
+    normalized with a single lookup rather than by
+    :func:`~webcolors.normalize_hex`.
+
+    """
+    spellings = {}
+    for hex_value in all_names_index():
+        digits = hex_value[1:]
+        forms = [digits]
+        if digits[0::2] == digits[1::2]:
+            forms.append(digits[0::2])
+        for form in forms:
+            for spelling in itertools.product(
+                *({digit.lower(), digit.upper()} for digit in form)
+            ):
+                spellings["#" + "".join(spelling)] = hex_value
+    return spellings
+
+
+# A table of squared distances, indexed first by channel value and then by
+# named color; the rows are tuples, or views of shared tables (see
+# webcolors.shared).
+_DistanceTable = typing.Sequence[typing.Sequence[int]]
+
+
+_DistanceTables = typing.Tuple[
+    typing.Tuple[str, ...], _DistanceTable, _DistanceTable, _DistanceTable
+]
+
+# The distance tables of each specification, built on first use; a plain dict
+# rather than an lru_cache, so that the specifications used can be listed.
+DISTANCE_TABLES: typing.Dict[str, _DistanceTables] = {}
+
+
+def _distance_tables(spec: str) -> _DistanceTables:
+    """
+    Return the names of the colors of the given specification, followed by
+    three tables (one per channel) mapping each channel value 0-255 to the
+    squared distances between that value and each named color's channel.
+
+    Summing one entry from each channel table gives the squared Euclidean
+    distance from an arbitrary color to every named color, without a Python
+    loop over the named colors.
+
+    """
+    try:
+        return DISTANCE_TABLES[spec]
+    except KeyError:
+        pass
+    colors = int_to_name(spec)
+
+    def distances(shift: int) -> _DistanceTable:
+        """
+        Build the distance table for the channel at the given bit offset.
+
+        """
+        channel = [packed >> shift & 0xFF for packed in colors]
+        return tuple(
+            tuple((named - value) ** 2 for named in channel) for value in range(256)
+        )
+
+    result = tuple(colors.values()), distances(16), distances(8), distances(0)
+    return DISTANCE_TABLES.setdefault(spec, result)
+
+
+def nearest_name(packed: int, spec: str) -> str:
+    """
+    Return the name of the color in the given specification nearest (by
+    Euclidean distance in RGB space) to the integer color value ``packed``.
+
+    Ties are broken in favor of the color listed first in the specification's
+    mapping of hexadecimal values to names.
+
+    """
+    return nearest_names(spec)(packed)
+
+
+# The caches of nearest named colors of each specification, created on first
+# use.
+NEAREST_NAMES: typing.Dict[str, "LookupCache"] = {}
+
+
+def nearest_names(spec: str) -> "LookupCache":
+    """
+    Return the cache of nearest named colors of the given specification, to
+    be called with integer color values, for callers looking up many values.
+
+    """
+    try:
+        return NEAREST_NAMES[spec]
+    except KeyError:
+        cache = LookupCache(functools.partial(_nearest_name, spec=spec), 65536)
+        return NEAREST_NAMES.setdefault(spec, cache)
+
+
+def _nearest_name(packed: int, spec: str) -> str:
+    """
+    Find the nearest named color for :func:`nearest_name`.
+
+    """
+    names, red, green, blue = _distance_tables(spec)
+    distances = list(
+        map(
+            operator.add,
+            map(operator.add, red[packed >> 16], green[packed >> 8 & 0xFF]),
+            blue[packed & 0xFF],
+        )
+    )
+    return names[distances.index(min(distances))]
+
+
+# Marks a value with no cached result.
+_MISSING = object()
+
+
+def _new_counts() -> SimpleNamespace:
+    """
+    Internal helper which returns zeroed counts of the hits and misses on a
+    :class:`LookupCache` by one thread, and of the hits on each of its
+    entries (counted only by a :class:`MemoCache`).
+
+    """
+    return SimpleNamespace(hits=0, misses=0, entries={})
+
+
+class LookupCache:
+    """
+    A bounded cache of the results of a function of one argument. When full,
+    the entries cached longest ago are evicted, down to half the maximum
+    number. Exceptions are not cached.
+
+    Lookups take no lock: results are read from a dict shared by all threads,
+    and each thread counts its own hits and misses, so that threads do not
+    contend with each other on free-threaded builds of CPython. Storing a
+    result takes a lock, so that the cache never holds more than ``maxsize``
+    entries, as do reading and resetting the counts; a few hits counted while
+    the counts are reset may be lost.
+
+    """
+
+    def __init__(
+        self, function: typing.Callable[[typing.Any], typing.Any], maxsize: int
+    ):
+        """
+        Wrap the function, caching at most ``maxsize`` results.
+
+        """
+        self.function = function
+        self.maxsize = maxsize
+        self.results: typing.Dict[typing.Any, typing.Any] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # The counts of each thread using the cache, and those carried over
+        # from threads which have exited.
+        self._threads: typing.Dict[threading.Thread, SimpleNamespace] = {}
+        self._carried = _new_counts()
+
+    def _start_counting(self) -> SimpleNamespace:
+        """
+        Start the counts of the current thread, carrying over those of threads
+        which have exited.
+
+        """
+        counts = self._local.counts = _new_counts()
+        with self._lock:
+            for thread in [thread for thread in self._threads if not thread.is_alive()]:
+                self._carry(self._threads.pop(thread))
+            self._threads[threading.current_thread()] = counts
+        return counts
+
+    def _carry(self, counts: SimpleNamespace) -> None:
+        """
+        Add a thread's counts to the carried counts. The lock must be held.
+
+        """
+        self._carried.hits += counts.hits
+        self._carried.misses += counts.misses
+        for value, hits in counts.entries.items():
+            self._carried.entries[value] = self._carried.entries.get(value, 0) + hits
+
+    def __call__(self, value: typing.Any) -> typing.Any:
+        """
+        Return the cached result for the value, calling the function on a
+        miss.
+
+        """
+        try:
+            counts = self._local.counts
+        except AttributeError:
+            counts = self._start_counting()
+        result = self.results.get(value, _MISSING)
+        if result is not _MISSING:
+            counts.hits += 1
+            return result
+        result = self.function(value)
+        counts.misses += 1
+        self._store(value, result)
+        return result
+
+    def _store(self, value: typing.Any, result: typing.Any) -> None:
+        """
+        Cache the result for a value, evicting entries first if the cache is
+        full.
+
+        """
+        with self._lock:
+            if len(self.results) >= self.maxsize:
+                self.results = self._kept()
+            self.results[value] = result
+
+    def _kept(self) -> typing.Dict[typing.Any, typing.Any]:
+        """
+        Return the entries to keep on eviction. The lock must be held.
+
+        """
+        entries = list(self.results.items())
+        return dict(entries[max(len(entries) - self.maxsize // 2, 0) :])
+
+    def evict(self) -> None:
+        """
+        Evict entries, keeping at most half of the maximum number.
+
+        """
+        with self._lock:
+            self.results = self._kept()
+
+    def statistics(self) -> typing.Dict[str, int]:
+        """
+        Return the numbers of hits and misses, and the current and maximum
+        numbers of entries.
+
+        """
+        with self._lock:
+            hits, misses = self._carried.hits, self._carried.misses
+            for counts in self._threads.values():
+                hits += counts.hits
+                misses += counts.misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": len(self.results),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """
+        Remove all entries, and reset the numbers of hits and misses.
+
+        """
+        with self._lock:
+            self.results = {}
+            self._carried = _new_counts()
+            for counts in self._threads.values():
+                counts.hits = counts.misses = 0
+                counts.entries.clear()
+
+
+class MemoCache(LookupCache):
+    """
+    A :class:`LookupCache` which also counts the hits on each entry, so that
+    the hottest entries can be listed.
+
+    When full, the least-hit entries are evicted instead, and the hit counts
+    of the rest are halved, so that entries which were hot long ago
+    eventually make way for those hot now.
+
+    """
+
+    def __call__(self, value: typing.Any) -> typing.Any:
+        """
+        Return the cached result for the value, calling the function on a
+        miss.
+
+        """
+        try:
+            counts = self._local.counts
+        except AttributeError:
+            counts = self._start_counting()
+        result = self.results.get(value, _MISSING)
+        if result is not _MISSING:
+            counts.hits += 1
+            counts.entries[value] = counts.entries.get(value, 0) + 1
+            return result
+        result = self.function(value)
+        counts.misses += 1
+        self._store(value, result)
+        return result
+
+    def _entry_hits(self) -> typing.Dict[typing.Any, int]:
+        """
+        Return the number of hits on each cached value, totalled over all
+        threads. The lock must be held.
+
+        """
+        totals = {value: self._carried.entries.get(value, 0) for value in self.results}
+        for counts in self._threads.values():
+            for value, hits in list(counts.entries.items()):
+                if value in totals:
+                    totals[value] += hits
+        return totals
+
+    def _kept(self) -> typing.Dict[typing.Any, typing.Any]:
+        """
+        Return the most-hit entries to keep on eviction, carrying over their
+        hit counts halved. The lock must be held.
+
+        """
+        totals = self._entry_hits()
+        kept = sorted(totals, key=totals.__getitem__)[
+            max(len(totals) - self.maxsize // 2, 0) :
+        ]
+        self._carried.entries = {value: totals[value] >> 1 for value in kept}
+        for counts in self._threads.values():
+            counts.entries.clear()
+        return {value: self.results[value] for value in kept}
+
+    def hottest(self, limit: int) -> typing.List:
+        """
+        Return up to ``limit`` of the cached values, the most-hit first.
+
+        """
+        with self._lock:
+            totals = self._entry_hits()
+        return sorted(totals, key=lambda value: -totals[value])[:limit]
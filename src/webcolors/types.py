@@ -88,8 +88,119 @@ class HTML5SimpleColor(typing.NamedTuple):
     blue: int
 
 
+class PaletteColor(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing one color of a palette
+    extracted from an image or a collection of colors.
+
+    Has four fields:
+
+    .. attribute:: rgb
+
+       The color, as an :class:`IntegerRGB`.
+
+    .. attribute:: hex
+
+       The color, as a normalized hexadecimal color value.
+
+    .. attribute:: name
+
+       The name of the nearest named color.
+
+    .. attribute:: count
+
+       The number of pixels or colors the palette color represents.
+
+    """
+
+    rgb: IntegerRGB
+    hex: str
+    name: str
+    count: int
+
+
+class RGBChannels(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing many colors as a separate,
+    contiguous array of each channel's values, as returned by
+    :func:`~webcolors.hex_to_rgb_channels`.
+
+    Has three fields:
+
+    .. attribute:: red
+
+       The red value of each color, as :class:`bytes`.
+
+    .. attribute:: green
+
+       The green value of each color, as :class:`bytes`.
+
+    .. attribute:: blue
+
+       The blue value of each color, as :class:`bytes`.
+
+    """
+
+    red: bytes
+    green: bytes
+    blue: bytes
+
+
+class CallSample(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing one call sampled by
+    :func:`~webcolors.enable_sampling`.
+
+    Has seven fields:
+
+    .. attribute:: function
+
+       The name of the function called.
+
+    .. attribute:: format
+
+       The format of the (first) argument: ``"hex"``, ``"name"``, ``"bytes"``,
+       ``"integer"`` or ``"percent"``, or otherwise the name of its type.
+
+    .. attribute:: length
+
+       The length of the argument, or :data:`None` if it has no length.
+
+    .. attribute:: spec
+
+       The specification argument, or :data:`None` if the function takes
+       none.
+
+    .. attribute:: hit
+
+       Whether the call returned a result, rather than raising an exception.
+
+    .. attribute:: step
+
+       For :func:`~webcolors.html5_parse_legacy_color`, the number of the
+       step of the algorithm at which it returned; otherwise :data:`None`.
+
+    .. attribute:: seconds
+
+       The time taken by the call, in seconds.
+
+    """
+
+    function: str
+    format: str
+    length: typing.Optional[int]
+    spec: typing.Optional[str]
+    hit: bool
+    step: typing.Optional[int]
+    seconds: float
+
+
 # Union type representing the possible types of an integer RGB tuple.
 IntTuple = typing.Union[IntegerRGB, HTML5SimpleColor, typing.Tuple[int, int, int]]
 
 # Union type representing the possible types of a percentage RGB tuple.
 PercentTuple = typing.Union[PercentRGB, typing.Tuple[str, str, str]]
+
+# Union type representing the bytes-like objects accepted in place of a string
+# hexadecimal color value.
+BytesLike = typing.Union[bytes, bytearray, memoryview]
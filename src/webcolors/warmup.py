@@ -0,0 +1,234 @@
+"""
+Pre-warming of webcolors' caches and lookup tables.
+
+"""
+import importlib
+import json
+import os
+import typing
+
+from . import constants, html5, tables
+
+# The submodules imported by prewarm_caches().
+_SUBMODULES = ("conversion", "normalization", "html5", "types")
+
+# The keys of a cache manifest.
+_MANIFEST_KEYS = ("legacy", "nearest")
+
+Manifest = typing.Dict[str, typing.List[str]]
+
+
+def _load_manifest(
+    manifest: typing.Union[typing.Mapping[str, typing.Iterable[str]], str, os.PathLike]
+) -> typing.Mapping[str, typing.Iterable[str]]:
+    """
+    Internal helper which reads a manifest from a JSON file, if given a path,
+    and checks its keys.
+
+    """
+    if isinstance(manifest, (str, os.PathLike)):
+        with open(manifest, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    if not isinstance(manifest, typing.Mapping):
+        raise ValueError("A cache manifest must be a mapping.")
+    unknown = set(manifest).difference(_MANIFEST_KEYS)
+    if unknown:
+        raise ValueError(
+            f"Unknown keys in cache manifest: {', '.join(map(repr, sorted(unknown)))}."
+        )
+    return manifest
+
+
+def prewarm_caches(
+    manifest: typing.Optional[
+        typing.Union[typing.Mapping[str, typing.Iterable[str]], str, os.PathLike]
+    ] = None
+) -> None:
+    """
+    Do, ahead of time, the work which would otherwise be done on first use of
+    the conversion, normalization and HTML5 functions, so that the first
+    conversions after an application starts are as fast as later ones.
+
+    The submodules providing those functions are imported, and the lookup
+    tables of every specification are loaded. A manifest, as returned by
+    :func:`cache_manifest` (or a path to a JSON file containing one), can
+    also be given, to prepare for the values an application converts most
+    often:
+
+    ``"legacy"``
+        Values to parse with :func:`html5_parse_legacy_color`, whose results
+        are cached; loading these enables the cache, as
+        :func:`enable_legacy_cache` does. Values which cannot be parsed are
+        skipped.
+
+    ``"nearest"``
+        Specifications for which to build the tables used to find the
+        nearest named color, as by :func:`pixels_to_names`,
+        :func:`pixels_to_name_histogram` and :func:`extract_palette`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> prewarm_caches({"legacy": ["chucknorris"], "nearest": ["css3"]})
+        >>> cache_manifest()["nearest"]
+        ['css3']
+        >>> disable_legacy_cache()
+
+    :param manifest: The manifest, or the path of a JSON file containing it.
+    :raises ValueError: when the manifest is not a mapping, or has keys other
+       than ``"legacy"`` and ``"nearest"``, or when a specification is not
+       supported.
+
+    """
+    # pylint: disable=protected-access
+    for submodule in _SUBMODULES:
+        importlib.import_module(f".{submodule}", __package__)
+    # Looking up a lazily built constant builds it, as does calling each
+    # table-building function.
+    constants.HEX_COLOR_RE  # pylint: disable=pointless-statement
+    for spec in constants.SUPPORTED_SPECIFICATIONS:
+        getattr(constants, f"{spec.upper()}_HEX_TO_NAMES")
+    tables.all_names_index()
+    if manifest is None:
+        return
+    manifest = _load_manifest(manifest)
+    for spec in manifest.get("nearest", ()):
+        tables.check_spec(spec)
+        tables._distance_tables(spec)
+    if "legacy" in manifest:
+        enable_legacy_cache()
+    for value in manifest.get("legacy", ()):
+        try:
+            html5.html5_parse_legacy_color(value)
+        except ValueError:
+            pass
+
+
+def enable_legacy_cache() -> None:
+    """
+    Cache the results of :func:`html5_parse_legacy_color` for the most
+    recently and frequently parsed values, up to 4,096 of them, so that values
+    parsed repeatedly are parsed only once.
+
+    Only values of up to 32 characters are cached. The cache is not used
+    unless this function is called, or a manifest listing legacy color values
+    is loaded with :func:`prewarm_caches`.
+
+    """
+    # pylint: disable=protected-access
+    html5._LEGACY_CACHING = True
+
+
+def disable_legacy_cache() -> None:
+    """
+    Stop caching the results of :func:`html5_parse_legacy_color`, and empty
+    the cache.
+
+    """
+    # pylint: disable=protected-access
+    html5._LEGACY_CACHING = False
+    html5._LEGACY_COLORS.clear()
+
+
+def enable_spelling_index() -> None:
+    """
+    Build an index of every accepted spelling of the hexadecimal value of each
+    named color, in upper, lower or mixed case and with three or six digits, so
+    that :func:`hex_to_name` looks up such values directly rather than
+    normalizing them first.
+
+    The index holds about 2,000 spellings, and is worth building only by
+    applications converting many hexadecimal values to names; it is not built
+    unless this function is called.
+
+    Examples:
+
+    .. doctest::
+
+        >>> enable_spelling_index()
+        >>> hex_to_name("#D3d3D3")
+        'lightgray'
+        >>> disable_spelling_index()
+
+    """
+    if not tables.HEX_SPELLINGS:
+        tables.HEX_SPELLINGS.update(tables.hex_spellings())
+
+
+def disable_spelling_index() -> None:
+    """
+    Discard the index built by :func:`enable_spelling_index`, so that
+    :func:`hex_to_name` normalizes every value before looking it up.
+
+    """
+    tables.HEX_SPELLINGS.clear()
+
+
+def cache_statistics() -> typing.Dict[str, typing.Dict[str, int]]:
+    """
+    Return the numbers of hits and misses, and the current and maximum
+    numbers of entries, of each of webcolors' caches of conversion
+    results.
+
+    There are two caches: one of the results of
+    :func:`html5_parse_legacy_color` (``"legacy"``), and one of the nearest
+    named colors found for colors with no name (``"nearest"``), whose numbers
+    are totals over the specifications used.
+
+    Examples:
+
+    .. doctest::
+
+        >>> sorted(cache_statistics()["legacy"])
+        ['hits', 'maxsize', 'misses', 'size']
+
+    """
+    # pylint: disable=protected-access
+    nearest = {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+    for cache in list(tables.NEAREST_NAMES.values()):
+        for key, value in cache.statistics().items():
+            nearest[key] += value
+    return {"legacy": html5._LEGACY_COLORS.statistics(), "nearest": nearest}
+
+
+def cache_manifest(limit: int = 1000) -> Manifest:
+    """
+    Return a manifest of the values most used by the current process, which
+    can be saved as JSON and passed to :func:`prewarm_caches` when the
+    application next starts.
+
+    The manifest lists up to ``limit`` of the values whose results of
+    :func:`html5_parse_legacy_color` are cached, those with the most cache
+    hits first (``"legacy"``), and the specifications for which the nearest
+    named color has been looked up (``"nearest"``).
+
+    Examples:
+
+    .. doctest::
+
+        >>> enable_legacy_cache()
+        >>> for _ in range(3):
+        ...     html5_parse_legacy_color("chucknorris")
+        HTML5SimpleColor(red=192, green=0, blue=0)
+        HTML5SimpleColor(red=192, green=0, blue=0)
+        HTML5SimpleColor(red=192, green=0, blue=0)
+        >>> cache_manifest(limit=1)["legacy"]
+        ['chucknorris']
+        >>> disable_legacy_cache()
+
+    :param limit: The maximum number of values to list.
+    :raises ValueError: when ``limit`` is less than 0.
+
+    """
+    # pylint: disable=protected-access
+    if limit < 0:
+        raise ValueError(f"Limit must be at least 0, not {limit}.")
+    return {
+        "legacy": html5._LEGACY_COLORS.hottest(limit),
+        "nearest": [
+            spec
+            for spec in constants.SUPPORTED_SPECIFICATIONS
+            if spec in tables.DISTANCE_TABLES
+        ],
+    }
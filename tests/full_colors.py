@@ -8,9 +8,17 @@ normal unit-test suite, and is used only as a final check when
 preparing a new release of webcolors.
 
 Because it generates each of the nearly 17 million color values
-multiple times, this test case takes some time to run and consumes
-most or all available CPU while running. As a consolation, it is
-somewhat efficient with respect to memory.
+multiple times, this test case is CPU-intensive. To make it practical,
+the color space is divided into blocks which are checked in parallel
+in a pool of processes (by default, one per CPU; set the environment
+variable ``WEBCOLORS_FULL_COLORS_WORKERS`` to change this). The work
+can also be split across several runs or machines: setting the
+environment variable ``WEBCOLORS_FULL_COLORS_SHARD`` to ``"I/N"``
+checks only the ``I``-th (counting from zero) of ``N`` equal shards of
+the color space. The ``tests_full_colors`` nox session passes its
+positional arguments through as the shard, for example::
+
+    nox -s tests_full_colors -- 3/8
 
 Due to the inherent imprecision of floating-point percentage values,
 and the fact that the legal (with respect to the CSS standards) set of
@@ -23,36 +31,175 @@ The only test performed here for percentage rgb() triplets is to
 ensure that converting an integer rgb() triplet to percentage and back
 returns the original integer values, for consistency.
 
+In addition to the scalar conversion functions, the bulk conversions
+of buffers and raw pixel data are checked across the whole color
+space, by generating each block of colors as a single buffer and
+comparing the results of the bulk functions, in one pass, with the
+results of the scalar functions for the same colors.
+
 """
 
+import array
+import concurrent.futures
+import os
+import sys
+import typing
 import unittest
 
 import webcolors
 
+# The number of colors in the sRGB color space as represented by webcolors.
+COLOR_COUNT = 2**24
+
+# The number of colors checked by each task sent to a worker process.
+BLOCK_SIZE = 2**16
+
 
-def hex_colors():
+def shard_range(shard: str) -> range:
     """
-    Generator which yields all 2**24 hexadecimal color values, in
-    order starting from #000000.
+    Return the range of integer color values covered by a shard
+    specification of the form ``"I/N"``.
 
     """
-    for i in range(16777217):
-        yield f"#{i:06x}"
+    index, count = (int(part) for part in shard.split("/"))
+    if not 0 <= index < count <= COLOR_COUNT:
+        raise ValueError(f"Invalid shard specification: {shard!r}.")
+    return range(COLOR_COUNT * index // count, COLOR_COUNT * (index + 1) // count)
 
 
-def int_colors():
+def blocks(colors: range) -> typing.List[range]:
     """
-    Generator which yields all 2**24 integer rgb() triplets, in
-    order starting from (0,0,0).
+    Split a range of integer color values into blocks of at most
+    ``BLOCK_SIZE`` values.
+
+    """
+    return [
+        range(start, min(start + BLOCK_SIZE, colors.stop))
+        for start in range(colors.start, colors.stop, BLOCK_SIZE)
+    ]
+
 
+def block_pixels(colors: range) -> bytearray:
     """
-    red_counter = tuple(range(256))
-    green_counter = tuple(range(256))
-    blue_counter = tuple(range(256))
-    for red_value in red_counter:
-        for green_value in green_counter:
-            for blue_value in blue_counter:
-                yield (red_value, green_value, blue_value)
+    Generate a block of integer color values as an RGB888 pixel buffer,
+    without creating a triplet for each color.
+
+    """
+    # Items of typecode "L" are at least four bytes wide.
+    packed = array.array("L", colors)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    view = memoryview(packed).cast("B")
+    width = packed.itemsize
+    pixels = bytearray(len(colors) * 3)
+    # Take the three least-significant bytes of each big-endian value.
+    pixels[0::3] = view[width - 3 :: width]
+    pixels[1::3] = view[width - 2 :: width]
+    pixels[2::3] = view[width - 1 :: width]
+    return pixels
+
+
+def check_hex_block(colors: range) -> typing.Optional[str]:
+    """
+    Check conversion between hexadecimal and integer rgb() for a
+    block of integer color values, returning a description of the
+    first failure, if any.
+
+    """
+    for value in colors:
+        hex_color = f"#{value:06x}"
+        int_triplet = (value >> 16, value >> 8 & 0xFF, value & 0xFF)
+        if webcolors.hex_to_rgb(hex_color) != int_triplet:
+            return f"hex_to_rgb({hex_color!r}) != {int_triplet}"
+        if webcolors.rgb_to_hex(int_triplet) != hex_color:
+            return f"rgb_to_hex({int_triplet}) != {hex_color!r}"
+    return None
+
+
+def check_triplet_block(colors: range) -> typing.Optional[str]:
+    """
+    Check conversion between integer and percentage rgb() for a block
+    of integer color values, returning a description of the first
+    failure, if any.
+
+    """
+    for value in colors:
+        int_triplet = (value >> 16, value >> 8 & 0xFF, value & 0xFF)
+        conversion = webcolors.rgb_percent_to_rgb(
+            webcolors.rgb_to_rgb_percent(int_triplet)
+        )
+        if conversion != int_triplet:
+            return f"percent round trip of {int_triplet} gave {conversion}"
+    return None
+
+
+def check_bulk_hex_block(colors: range) -> typing.Optional[str]:
+    """
+    Check the bulk conversions between hexadecimal and integer values
+    for a block of integer color values against the scalar functions,
+    returning a description of the first failure, if any.
+
+    """
+    pixels = block_pixels(colors)
+    triplets = [(value >> 16, value >> 8 & 0xFF, value & 0xFF) for value in colors]
+    expected_hex = [webcolors.rgb_to_hex(triplet) for triplet in triplets]
+    expected_rgb = [webcolors.hex_to_rgb(hex_value) for hex_value in expected_hex]
+    records = "".join(expected_hex).encode("ascii")
+    channels = webcolors.hex_to_rgb_channels(expected_hex)
+    record_channels = webcolors.hex_records_to_rgb_channels(records)
+    checks = (
+        (
+            "pixels_to_ints",
+            [list(colors)],
+            webcolors.pixels_to_ints(pixels, len(colors)),
+        ),
+        ("pixels_to_hex", [expected_hex], webcolors.pixels_to_hex(pixels, len(colors))),
+        ("rgb_to_hex_records", records, webcolors.rgb_to_hex_records(triplets)),
+        ("hex_records_to_rgb", expected_rgb, webcolors.hex_records_to_rgb(records)),
+        (
+            "hex_to_rgb_channels",
+            expected_rgb,
+            zip(channels.red, channels.green, channels.blue),
+        ),
+        (
+            "hex_records_to_rgb_channels",
+            expected_rgb,
+            zip(record_channels.red, record_channels.green, record_channels.blue),
+        ),
+    )
+    for function, expected, result in checks:
+        if list(result) != list(expected):
+            return f"{function} differs from the scalar conversions in {colors}"
+    return None
+
+
+def check_bulk_names_block(colors: range) -> typing.Optional[str]:
+    """
+    Check the bulk conversions to color names for a block of integer
+    color values against the scalar functions, returning a description
+    of the first failure, if any.
+
+    """
+    pixels = block_pixels(colors)
+    for spec in webcolors.constants.SUPPORTED_SPECIFICATIONS:
+        # Every color which has a name, according to the scalar functions,
+        # must be named identically in bulk; every other color must not.
+        expected: typing.List[typing.Optional[str]] = [None] * len(colors)
+        for hex_value in getattr(webcolors, f"{spec.upper()}_NAMES_TO_HEX").values():
+            red, green, blue = webcolors.hex_to_rgb(hex_value)
+            value = red << 16 | green << 8 | blue
+            if value in colors:
+                expected[value - colors.start] = webcolors.hex_to_name(
+                    hex_value, spec=spec
+                )
+        (result,) = webcolors.pixels_to_names(pixels, len(colors), spec=spec)
+        if result != expected:
+            return f"pixels_to_names differs from hex_to_name in {colors} ({spec})"
+        histogram = webcolors.pixels_to_name_histogram(pixels, spec=spec)
+        named = {name: 1 for name in expected if name is not None}
+        if histogram != {**named, None: len(colors) - len(named)}:
+            return f"pixels_to_name_histogram is incorrect in {colors} ({spec})"
+    return None
 
 
 class FullColorTest(unittest.TestCase):
@@ -61,15 +208,35 @@ class FullColorTest(unittest.TestCase):
 
     """
 
+    def setUp(self):
+        """
+        Determine the shard of the color space to check, and the number
+        of worker processes to check it with.
+
+        """
+        self.colors = shard_range(
+            os.environ.get("WEBCOLORS_FULL_COLORS_SHARD") or "0/1"
+        )
+        workers = os.environ.get("WEBCOLORS_FULL_COLORS_WORKERS")
+        self.workers = int(workers) if workers else None
+
+    def check_blocks(self, check: typing.Callable[[range], typing.Optional[str]]):
+        """
+        Run a check function over every block of the shard in a pool of
+        processes, and fail on the first failure reported.
+
+        """
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+            for failure in executor.map(check, blocks(self.colors)):
+                assert failure is None, failure
+
     def test_full_colors(self):
         """
         Test conversion between hexadecimal and integer rgb() for
         all 2**24 possible values.
 
         """
-        for hex_color, int_triplet in zip(hex_colors(), int_colors()):
-            assert int_triplet == webcolors.hex_to_rgb(hex_color)
-            assert hex_color == webcolors.rgb_to_hex(int_triplet)
+        self.check_blocks(check_hex_block)
 
     def test_triplet_conversion(self):
         """
@@ -82,11 +249,43 @@ class FullColorTest(unittest.TestCase):
         conversion to percentage and back gives the starting value.
 
         """
-        for int_triplet in int_colors():
-            conversion = webcolors.rgb_percent_to_rgb(
-                webcolors.rgb_to_rgb_percent(int_triplet)
-            )
-            assert int_triplet == conversion
+        self.check_blocks(check_triplet_block)
+
+    def test_bulk_hex(self):
+        """
+        Test the bulk conversions between hexadecimal and integer
+        values against the scalar functions for all 2**24 possible
+        values.
+
+        """
+        self.check_blocks(check_bulk_hex_block)
+
+    def test_bulk_names(self):
+        """
+        Test the bulk conversions to color names against the scalar
+        functions for all 2**24 possible values.
+
+        """
+        self.check_blocks(check_bulk_names_block)
+
+    def test_shards(self):
+        """
+        Shards and their blocks cover the color space exactly once.
+
+        """
+        for count in (1, 3, 8):
+            covered = [
+                value
+                for index in range(count)
+                for block in blocks(shard_range(f"{index}/{count}"))
+                for value in (block.start, block.stop)
+            ]
+            assert covered[0] == 0
+            assert covered[-1] == COLOR_COUNT
+            # Each block must begin where the previous one ended.
+            assert covered[1:-1:2] == covered[2:-1:2]
+        for shard in ("1/1", "-1/2", "0/0", "3"):
+            self.assertRaises(ValueError, shard_range, shard)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+"""
+Helpers shared by the test modules.
+
+"""
+import os
+import subprocess
+import sys
+
+
+def run_script(script):
+    """
+    Run a Python script in a fresh interpreter, returning its output.
+
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    return result.stdout.strip()
@@ -0,0 +1,155 @@
+"""
+Test the asynchronous conversion functions.
+
+"""
+import asyncio
+import concurrent.futures
+import unittest
+
+import webcolors
+
+
+async def _aiter(values):
+    """
+    Asynchronously yield each of the given values.
+
+    """
+    for value in values:
+        yield value
+
+
+async def _collect(async_iterator):
+    """
+    Collect the values of an asynchronous iterator into a list.
+
+    """
+    return [value async for value in async_iterator]
+
+
+async def _convert_lines(function, data, **kwargs):
+    """
+    Feed the given data, in small chunks, to a stream reader, and collect
+    the results of converting its lines.
+
+    """
+    reader = asyncio.StreamReader()
+    for start in range(0, len(data), 5):
+        reader.feed_data(data[start : start + 5])
+    reader.feed_eof()
+    return await _collect(webcolors.async_convert_lines(function, reader, **kwargs))
+
+
+class AsyncConvertTests(unittest.TestCase):
+    """
+    Test the function which converts asynchronous iterables of values.
+
+    """
+
+    def test_async_convert(self):
+        """
+        Results match the scalar function, in order, whether batches are
+        converted inline or in an executor.
+
+        """
+        values = [f"#{value:06x}" for value in range(0, 2**24, 99991)]
+        expected = list(map(webcolors.hex_to_rgb, values))
+        for batch_size, offload_threshold in ((1, 256), (7, 7), (1000, 3)):
+            assert expected == asyncio.run(
+                _collect(
+                    webcolors.async_convert(
+                        webcolors.hex_to_rgb,
+                        _aiter(values),
+                        batch_size=batch_size,
+                        offload_threshold=offload_threshold,
+                    )
+                )
+            )
+
+    def test_async_convert_executor(self):
+        """
+        A supplied executor is used for large batches.
+
+        """
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            assert ["#ffffff", "#000080"] == asyncio.run(
+                _collect(
+                    webcolors.async_convert(
+                        webcolors.name_to_hex,
+                        _aiter(["white", "navy"]),
+                        offload_threshold=1,
+                        executor=executor,
+                    )
+                )
+            )
+
+    def test_async_convert_errors(self):
+        """
+        Unconvertible values are raised, replaced or skipped according to
+        the error policy, and invalid arguments raise ValueError.
+
+        """
+        values = ["white", "nonsense", "navy"]
+        with self.assertRaises(ValueError):
+            asyncio.run(
+                _collect(webcolors.async_convert(webcolors.name_to_hex, _aiter(values)))
+            )
+        assert ["#ffffff", "#000080"] == asyncio.run(
+            _collect(
+                webcolors.async_convert(
+                    webcolors.name_to_hex, _aiter(values), errors="ignore"
+                )
+            )
+        )
+        for kwargs in (
+            {"batch_size": 0},
+            {"offload_threshold": 0},
+            {"errors": "skip"},
+        ):
+            with self.assertRaises(ValueError):
+                asyncio.run(
+                    _collect(
+                        webcolors.async_convert(
+                            webcolors.name_to_hex, _aiter(values), **kwargs
+                        )
+                    )
+                )
+
+
+class AsyncConvertLinesTests(unittest.TestCase):
+    """
+    Test the function which converts lines of a stream.
+
+    """
+
+    def test_async_convert_lines(self):
+        """
+        Lines split across reads are reassembled, stripped and converted,
+        and blank lines are skipped.
+
+        """
+        data = b"#fff\r\n\n  #000080\n#daa520"
+        for read_size in (1, 4, 65536):
+            assert [(255, 255, 255), (0, 0, 128), (218, 165, 32)] == asyncio.run(
+                _convert_lines(
+                    webcolors.hex_to_rgb, data, read_size=read_size, offload_threshold=2
+                )
+            )
+        assert [] == asyncio.run(_convert_lines(webcolors.hex_to_rgb, b""))
+        # A line longer than many reads.
+        assert [(255, 255, 255), (0, 0, 128)] == asyncio.run(
+            _convert_lines(
+                webcolors.hex_to_rgb, b" " * 1000 + b"#fff\n#000080", read_size=3
+            )
+        )
+
+    def test_async_convert_lines_errors(self):
+        """
+        Unconvertible lines follow the error policy, and invalid arguments
+        raise ValueError.
+
+        """
+        assert ["white", None] == asyncio.run(
+            _convert_lines(webcolors.hex_to_name, b"#fff\n#123456\n", errors="replace")
+        )
+        with self.assertRaisesRegex(ValueError, "^Read size"):
+            asyncio.run(_convert_lines(webcolors.hex_to_name, b"#fff\n", read_size=0))
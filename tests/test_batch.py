@@ -0,0 +1,80 @@
+"""
+Test the batch conversion functions.
+
+"""
+import functools
+import unittest
+
+import webcolors
+
+
+class ParallelConvertTests(unittest.TestCase):
+    """
+    Test the function which converts batches of values in a pool of
+    workers.
+
+    """
+
+    def test_parallel_convert(self):
+        """
+        Results match the scalar function, in input order, for any chunk
+        size.
+
+        """
+        values = [f"#{value:06x}" for value in range(0, 2**24, 9973)]
+        expected = list(map(webcolors.hex_to_rgb, values))
+        for chunk_size in (1, 7, 4096):
+            for max_workers in (1, 3):
+                assert expected == list(
+                    webcolors.parallel_convert(
+                        webcolors.hex_to_rgb,
+                        iter(values),
+                        chunk_size=chunk_size,
+                        max_workers=max_workers,
+                    )
+                )
+
+    def test_parallel_convert_processes(self):
+        """
+        A pool of processes gives the same results as threads, including
+        for partially-applied functions.
+
+        """
+        values = ["#fff", "#000080", "#daa520", "#123456"]
+        function = functools.partial(webcolors.hex_to_name, spec=webcolors.HTML4)
+        assert ["white", "navy", None, None] == list(
+            webcolors.parallel_convert(
+                function,
+                values,
+                chunk_size=2,
+                max_workers=2,
+                processes=True,
+                errors="replace",
+            )
+        )
+
+    def test_parallel_convert_errors(self):
+        """
+        Unconvertible values are raised, replaced or skipped according to
+        the error policy.
+
+        """
+        values = ["white", "nonsense", "navy"]
+        with self.assertRaises(ValueError):
+            list(webcolors.parallel_convert(webcolors.name_to_hex, values))
+        assert ["#ffffff", None, "#000080"] == list(
+            webcolors.parallel_convert(webcolors.name_to_hex, values, errors="replace")
+        )
+        assert ["#ffffff", "#000080"] == list(
+            webcolors.parallel_convert(webcolors.name_to_hex, values, errors="ignore")
+        )
+        assert not list(webcolors.parallel_convert(webcolors.name_to_hex, []))
+
+    def test_parallel_convert_arguments(self):
+        """
+        Invalid arguments raise ValueError immediately.
+
+        """
+        for kwargs in ({"chunk_size": 0}, {"max_workers": 0}, {"errors": "skip"}):
+            with self.assertRaises(ValueError):
+                webcolors.parallel_convert(webcolors.hex_to_rgb, ["#fff"], **kwargs)
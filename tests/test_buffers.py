@@ -0,0 +1,131 @@
+"""
+Test the bulk conversions of bytes-like buffers.
+
+"""
+import unittest
+
+import webcolors
+
+
+class BufferConversionTests(unittest.TestCase):
+    """
+    Test the functions which convert many hexadecimal color values
+    stored in a single buffer.
+
+    """
+
+    def test_hex_records_to_rgb(self):
+        """
+        Packed and separated records are parsed in order, from any
+        bytes-like object.
+
+        """
+        expected = [(255, 255, 255), (0, 0, 128), (218, 165, 32)]
+        test_pairs = (
+            (b"#ffffff#000080#DAA520", {}),
+            (bytearray(b"#ffffff\n#000080\n#DAA520\n"), {"stride": 8}),
+            (memoryview(b"xx#ffffff, #000080, #daa520"), {"stride": 9, "offset": 2}),
+        )
+        for buffer, kwargs in test_pairs:
+            result = list(webcolors.hex_records_to_rgb(buffer, **kwargs))
+            assert all(isinstance(color, webcolors.IntegerRGB) for color in result)
+            assert expected == result
+
+    def test_hex_records_to_rgb_error(self):
+        """
+        Invalid records, truncated records and strides shorter than a record
+        raise ValueError.
+
+        """
+        for buffer in (b"#ffffff#0000gg", b"#ffffff ffffff0", b"#ffffff#00008"):
+            with self.assertRaises(ValueError):
+                list(webcolors.hex_records_to_rgb(buffer))
+        with self.assertRaises(ValueError):
+            list(webcolors.hex_records_to_rgb(b"#ffffff\n#fff\n", stride=8))
+        with self.assertRaises(ValueError):
+            list(webcolors.hex_records_to_rgb(b"#ffffff", stride=6))
+        with self.assertRaisesRegex(ValueError, "offset must be at least 0"):
+            list(webcolors.hex_records_to_rgb(b"#ffffff#000080", offset=-7))
+
+    def test_rgb_to_hex_records(self):
+        """
+        Triplets are clipped, normalized and joined into one buffer.
+
+        """
+        triplets = [(255, 255, 255), webcolors.IntegerRGB(0, 0, 128), (270, -20, 32)]
+        assert b"#ffffff#000080#ff0020" == webcolors.rgb_to_hex_records(triplets)
+        assert b"#ffffff\n#000080\n#ff0020" == webcolors.rgb_to_hex_records(
+            triplets, separator=b"\n"
+        )
+        assert b"" == webcolors.rgb_to_hex_records([])
+
+    def test_round_trip(self):
+        """
+        Serializing and then parsing a sequence of triplets returns the
+        original triplets.
+
+        """
+        triplets = [(red, red // 2, 255 - red) for red in range(256)]
+        buffer = webcolors.rgb_to_hex_records(triplets, separator=b"\n")
+        assert triplets == list(webcolors.hex_records_to_rgb(buffer, stride=8))
+
+    def test_hex_to_rgb_channels(self):
+        """
+        Hexadecimal values of any form are converted to an array of each
+        channel's values, in order.
+
+        """
+        test_values = (
+            ["#ffffff", "#000080", "#DAA520"],
+            ["#fff", "#000080", b"#daa520"],
+            iter(["#FFFFFF", "#000080", "#daa520"]),
+        )
+        for hex_values in test_values:
+            result = webcolors.hex_to_rgb_channels(hex_values)
+            assert isinstance(result, webcolors.RGBChannels)
+            assert (b"\xff\x00\xda", b"\xff\x00\xa5", b"\xff\x80\x20") == result
+        assert (b"", b"", b"") == webcolors.hex_to_rgb_channels([])
+
+    def test_hex_to_rgb_channels_error(self):
+        """
+        Invalid values raise ValueError, even when they would decode as a
+        whole.
+
+        """
+        for hex_values in (
+            ["#ffffff", "#0000gg"],
+            ["#ffffff", " ffffff"],
+            ["#ff ffff", "#ffffff"],
+            ["#aabbcc#", "ddeeff"],
+            ["#ffffff", "ffffff#"],
+        ):
+            with self.assertRaises(ValueError):
+                webcolors.hex_to_rgb_channels(hex_values)
+
+    def test_hex_records_to_rgb_channels(self):
+        """
+        Records are parsed to the same values as by hex_records_to_rgb(),
+        and invalid records raise ValueError.
+
+        """
+        test_pairs = (
+            (b"#ffffff#000080#DAA520", {}),
+            (bytearray(b"#ffffff\n#000080\n#DAA520\n"), {"stride": 8}),
+            (memoryview(b"xx#ffffff, #000080, #daa520"), {"stride": 9, "offset": 2}),
+            (b"", {}),
+        )
+        for buffer, kwargs in test_pairs:
+            expected = webcolors.hex_to_rgb_channels(
+                webcolors.rgb_to_hex(rgb)
+                for rgb in webcolors.hex_records_to_rgb(buffer, **kwargs)
+            )
+            assert expected == webcolors.hex_records_to_rgb_channels(buffer, **kwargs)
+        for buffer in (b"#ffffff#0000gg", b"#ffffff ffffff0", b"#ffffff#00008"):
+            with self.assertRaises(ValueError):
+                webcolors.hex_records_to_rgb_channels(buffer)
+        with self.assertRaises(ValueError):
+            webcolors.hex_records_to_rgb_channels(b"#ffffff\n#fff\n", stride=8)
+        with self.assertRaises(ValueError):
+            webcolors.hex_records_to_rgb_channels(b"#ffffff", stride=6)
+        with self.assertRaisesRegex(ValueError, "offset must be at least 0"):
+            webcolors.hex_records_to_rgb_channels(b"#ffffff#000080", offset=-7)
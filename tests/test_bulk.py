@@ -0,0 +1,304 @@
+"""
+Test the chunked conversion of color values in files.
+
+"""
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import webcolors
+
+
+def convert(text, **kwargs):
+    """
+    Convert the given text, returning the number of lines or records written
+    and the output.
+
+    """
+    output = io.StringIO()
+    count = webcolors.convert_file(io.StringIO(text), output, **kwargs)
+    return count, output.getvalue()
+
+
+class ConvertFileTests(unittest.TestCase):
+    """
+    Test conversion of files of color values.
+
+    """
+
+    def test_lines(self):
+        """
+        Values are converted one per line, in chunks, skipping blank lines.
+
+        """
+        for chunk_size in (1, 2, 4096):
+            assert (3, "255,255,255\n0,0,128\n192,0,0\n") == convert(
+                "#fff\n\n#000080\n#c00000\n", chunk_size=chunk_size
+            )
+        assert (2, "#ffffff\n#c00000\n") == convert(
+            "white\nchucknorris\n", from_format="legacy", to_format="hex"
+        )
+        assert (1, "gray\n") == convert("grey\n", from_format="name", to_format="name")
+        assert (0, "") == convert("")
+
+    def test_csv(self):
+        """
+        Columns of CSV and TSV files are converted into other columns.
+
+        """
+        text = "id,a,b\n1,#fff,#000080\n2,#000,#c00000\n"
+        assert (
+            2,
+            "id,a,b,a_name,b_name\n1,#fff,#000080,white,navy\n"
+            "2,#000,#c00000,black,\n",
+        ) == convert(
+            text, to_format="name", layout="csv", columns=["a", "b"], errors="replace"
+        )
+        assert (1, "id,a,b\n1,white,navy\n") == convert(
+            text,
+            to_format="name",
+            layout="csv",
+            columns=["a", "b"],
+            output_columns=["a", "b"],
+            errors="ignore",
+        )
+        assert (1, "a\tname\nnavy\tnavy\n") == convert(
+            "a\nnavy\n", from_format="name", to_format="name", layout="tsv"
+        )
+        assert (1, 'x,rgb_percent\n"0,0,128","0%,0%,50%"\n') == convert(
+            'x\n"0,0,128"\n', from_format="rgb", to_format="rgb_percent", layout="csv"
+        )
+        assert (0, "") == convert("", layout="csv")
+
+    def test_jsonl(self):
+        """
+        Keys of JSON objects are converted into other keys.
+
+        """
+        text = '{"rgb": [0, 0, 128]}\n\n{"rgb": "1 2 3", "n": 1}\n{"rgb": 5}\n'
+        count, output = convert(
+            text, from_format="rgb", to_format="hex", layout="jsonl", errors="replace"
+        )
+        assert 3 == count
+        assert [
+            {"rgb": [0, 0, 128], "hex": "#000080"},
+            {"rgb": "1 2 3", "n": 1, "hex": "#010203"},
+            {"rgb": 5, "hex": None},
+        ] == [json.loads(line) for line in output.splitlines()]
+        count, output = convert(
+            '{"c": "#fff"}\n{}\n', layout="jsonl", columns=["c"], errors="ignore"
+        )
+        assert (1, {"c": "#fff", "rgb": [255, 255, 255]}) == (
+            count,
+            json.loads(output),
+        )
+
+    def test_errors(self):
+        """
+        With the strict policy, conversion stops at the first invalid value or
+        record, after writing those preceding it.
+
+        """
+        cases = (
+            ("#fff\n#ggg\n#000\n", {}, "Line 2: "),
+            ("a\n#fff\n#ggg\n", {"layout": "csv"}, "Record 2: "),
+            ('{"hex": "#fff"}\n[1]\n', {"layout": "jsonl"}, "Line 2 is not a JSON"),
+            ('{"hex": "#fff"}\n{\n', {"layout": "jsonl"}, "Line 2 is not valid JSON"),
+            (
+                '{"hex": "#fff"}\n{"hex": 5}\n',
+                {"layout": "jsonl"},
+                "Line 2: 5 is not a",
+            ),
+            ('{"hex": "#fff"}\n{}\n', {"layout": "jsonl"}, "Line 2: None is not a"),
+        )
+        for chunk_size in (1, 4096):
+            for text, kwargs, message in cases:
+                output = io.StringIO()
+                with self.assertRaisesRegex(ValueError, message):
+                    webcolors.convert_file(
+                        io.StringIO(text), output, chunk_size=chunk_size, **kwargs
+                    )
+                assert "255" in output.getvalue()
+                assert "0," not in output.getvalue().replace(" ", "")
+
+    def test_processes(self):
+        """
+        Chunks can be converted in a pool of processes, with results written
+        in the order read.
+
+        """
+        text = "".join(
+            f"{red},{green},{blue}\n"
+            for red in range(0, 256, 32)
+            for green in range(0, 256, 32)
+            for blue in ("0", "128", "255", "x")
+        )
+        kwargs = {
+            "from_format": "rgb",
+            "to_format": "name",
+            "spec": webcolors.HTML4,
+            "errors": "replace",
+            "chunk_size": 10,
+        }
+        serial = convert(text, **kwargs)
+        assert 256 == serial[0]
+        assert serial[1].startswith("black\nnavy\nblue\n\n")
+        assert serial == convert(text, processes=2, **kwargs)
+        output = io.StringIO()
+        with self.assertRaisesRegex(ValueError, "Line 4: "):
+            webcolors.convert_file(
+                io.StringIO(text), output, from_format="rgb", processes=2, chunk_size=1
+            )
+        assert "0,0,0\n0,0,128\n0,0,255\n" == output.getvalue()
+
+    def test_paths(self):
+        """
+        Files can be given by path.
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "colors.csv")
+            destination = os.path.join(directory, "names.csv")
+            with open(source, "w", encoding="utf-8", newline="") as colors_file:
+                colors_file.write("color\r\n#fff\r\n")
+            assert 1 == webcolors.convert_file(
+                source, destination, to_format="name", layout="csv"
+            )
+            with open(destination, encoding="utf-8", newline="") as names_file:
+                assert "color,name\n#fff,white\n" == names_file.read()
+
+    def test_invalid_arguments(self):
+        """
+        Unsupported arguments are rejected.
+
+        """
+        for kwargs in (
+            {"from_format": "hsl"},
+            {"to_format": "legacy"},
+            {"layout": "xml"},
+            {"spec": "css4"},
+            {"errors": "skip"},
+            {"chunk_size": 0},
+            {"processes": 0},
+            {"columns": ["a"]},
+            {"layout": "csv", "columns": ["b"]},
+            {"layout": "csv", "columns": []},
+            {"layout": "csv", "output_columns": ["x", "y"]},
+        ):
+            with self.assertRaises(ValueError):
+                convert("a\n#fff\n", **kwargs)
+
+
+class ShardTests(unittest.TestCase):
+    """
+    Test splitting files into byte ranges, converting each, and merging the
+    results.
+
+    """
+
+    def setUp(self):
+        """
+        Create a directory for the files of each test.
+
+        """
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write(self, name, text):
+        """
+        Write a file in the test directory, returning its path.
+
+        """
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8", newline="") as test_file:
+            test_file.write(text)
+        return path
+
+    def read(self, path):
+        """
+        Read a file in the test directory.
+
+        """
+        with open(path, encoding="utf-8", newline="") as test_file:
+            return test_file.read()
+
+    def test_shard_file(self):
+        """
+        Ranges cover the file without overlapping, and start at line
+        boundaries.
+
+        """
+        text = "".join(f"#{value:06x}\n" for value in range(0, 2**24, 2**16))
+        path = self.write("colors.txt", text)
+        data = text.encode("utf-8")
+        for shards in (1, 2, 3, 7, 256, 1000):
+            ranges = webcolors.shard_file(path, shards)
+            assert shards == len(ranges)
+            assert ranges == webcolors.shard_file(path, shards)
+            assert 0 == ranges[0][0] and len(data) == ranges[-1][1]
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                assert end == start
+                assert start in (0, len(data)) or data[start - 1 : start] == b"\n"
+        assert [(0, 0), (0, 0)] == webcolors.shard_file(self.write("e", ""), 2)
+        assert [(0, 7), (7, 7)] == webcolors.shard_file(self.write("n", "#abcdef"), 2)
+        with self.assertRaises(ValueError):
+            webcolors.shard_file(path, 0)
+
+    def test_round_trip(self):
+        """
+        Converting each shard and merging the results gives the same file as
+        converting the whole file.
+
+        """
+        rows = "".join(
+            f"{index},#{index * 40503 % 2**24:06x},x\r\n" for index in range(500)
+        )
+        for layout, text in (
+            (
+                "lines",
+                "".join(f"#{index * 40503 % 2**24:06x}\n" for index in range(500)),
+            ),
+            ("csv", f"id,color,other\r\n{rows}"),
+            ("tsv", "id\tcolor\n" + rows.replace(",x\r", "").replace(",", "\t")),
+            (
+                "jsonl",
+                "".join(f'{{"hex": "#{index:06x}"}}\n' for index in range(500)),
+            ),
+        ):
+            path = self.write(f"colors.{layout}", text)
+            kwargs = {"layout": layout}
+            if layout in ("csv", "tsv"):
+                kwargs["columns"] = ["color"]
+            whole = os.path.join(self.directory, f"whole.{layout}")
+            webcolors.convert_file(path, whole, **kwargs)
+            for shards in (1, 3, 16):
+                outputs = []
+                for index, byte_range in enumerate(webcolors.shard_file(path, shards)):
+                    outputs.append(os.path.join(self.directory, f"{layout}.{index}"))
+                    webcolors.convert_file(
+                        path, outputs[-1], byte_range=byte_range, **kwargs
+                    )
+                merged = os.path.join(self.directory, f"merged.{layout}")
+                webcolors.merge_files(outputs, merged, layout)
+                assert self.read(whole) == self.read(merged)
+
+    def test_invalid(self):
+        """
+        Byte ranges may extend past the end of the file, but invalid byte
+        ranges, and sources which are not paths, are rejected.
+
+        """
+        path = self.write("colors.txt", "#fff\n")
+        output = io.StringIO()
+        webcolors.convert_file(path, output, byte_range=(0, 100))
+        assert "255,255,255\n" == output.getvalue()
+        for byte_range in ((-1, 2), (3, 2)):
+            with self.assertRaises(ValueError):
+                webcolors.convert_file(path, io.StringIO(), byte_range=byte_range)
+        with self.assertRaises(ValueError):
+            webcolors.convert_file(io.StringIO(), io.StringIO(), byte_range=(0, 1))
+        with self.assertRaises(ValueError):
+            webcolors.merge_files([path], path + ".out", "xml")
@@ -0,0 +1,155 @@
+"""
+Test the persistent cache of HTML5 legacy color parsing.
+
+"""
+import concurrent.futures
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import webcolors
+from webcolors import html5
+
+
+class LegacyColorCacheTests(unittest.TestCase):
+    """
+    Test storing, looking up and evicting parsed legacy colors.
+
+    """
+
+    def setUp(self):
+        """
+        Create a directory for the database of each test.
+
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "legacy.sqlite3")
+
+    def test_persistence(self):
+        """
+        Values parsed by one cache are found, without parsing, by another
+        using the same database.
+
+        """
+        with webcolors.LegacyColorCache(self.path) as cache:
+            assert (192, 0, 0) == cache.parse("chucknorris")
+            assert (192, 0, 0) == cache.parse("chucknorris")
+            assert 1 == len(cache)
+        with mock.patch.object(
+            html5, "html5_parse_legacy_color", side_effect=AssertionError
+        ), webcolors.LegacyColorCache(self.path) as cache:
+            result = cache.parse("chucknorris")
+            assert isinstance(result, webcolors.HTML5SimpleColor)
+            assert (192, 0, 0) == result
+            assert [result] == cache.parse_many(["chucknorris"])
+
+    def test_parse_many(self):
+        """
+        Many values are looked up and parsed in bulk, handling invalid
+        values according to the error policy.
+
+        """
+        values = ["navy", " #fff ", "", "navy", None, "transparent", "Window"]
+        expected = [
+            (0, 0, 128),
+            (255, 255, 255),
+            None,
+            (0, 0, 128),
+            None,
+            None,
+            (0, 13, 0),
+        ]
+        with webcolors.LegacyColorCache(self.path) as cache:
+            assert expected == cache.parse_many(values, errors="replace")
+            assert 3 == len(cache)
+            assert [
+                result for result in expected if result is not None
+            ] == cache.parse_many(iter(values), errors="ignore")
+            many = [f"#{value:06x}" for value in range(2000)]
+            assert [webcolors.html5_parse_legacy_color(v) for v in many] == (
+                cache.parse_many(many)
+            )
+            for bad in ("", None, "transparent"):
+                with self.assertRaises(ValueError):
+                    cache.parse(bad)
+                with self.assertRaises(ValueError):
+                    cache.parse_many(["navy", bad])
+            with self.assertRaises(ValueError):
+                cache.parse_many(["navy"], errors="skip")
+
+    def test_prewarm(self):
+        """
+        Prewarming stores values ahead of use, skipping invalid values and
+        counting only values not already stored.
+
+        """
+        with webcolors.LegacyColorCache(self.path) as cache:
+            assert 2 == cache.prewarm(["navy", "navy", "", "#fab"])
+            assert 1 == cache.prewarm(["navy", "teal"])
+            assert 3 == len(cache)
+            cache.clear()
+            assert 0 == len(cache)
+            assert 1 == cache.prewarm(["navy"])
+
+    def test_max_entries(self):
+        """
+        The values stored longest ago are removed once the cache is full,
+        leaving nine tenths of the maximum number.
+
+        """
+        with webcolors.LegacyColorCache(self.path, max_entries=3) as cache:
+            cache.prewarm(["#000001", "#000002"])
+            cache.parse("#000003")
+            cache.parse("#000004")
+            assert 3 == len(cache)
+            cache.prewarm([f"#0000{value:02x}" for value in range(5, 20)])
+            assert 3 == len(cache)
+        with webcolors.LegacyColorCache(self.path, max_entries=2) as cache:
+            cache.parse("#000001")
+            assert 2 == len(cache)
+        with webcolors.LegacyColorCache(self.path, max_entries=20) as cache:
+            cache.clear()
+            cache.prewarm([f"#0000{value:02x}" for value in range(21)])
+            assert 18 == len(cache)
+            assert 2 == cache.prewarm(["#000015", "#000016"])
+            assert 20 == len(cache)
+            cache.parse("#000017")
+            assert 18 == len(cache)
+        with self.assertRaises(ValueError):
+            webcolors.LegacyColorCache(self.path, max_entries=0)
+
+    def test_threads(self):
+        """
+        A cache can be shared between threads.
+
+        """
+        values = [f"#{value:06x}" for value in range(0, 2**24, 2**12)]
+        with webcolors.LegacyColorCache(self.path) as cache:
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(cache.parse, values * 2))
+            assert results == [
+                webcolors.html5_parse_legacy_color(v) for v in values * 2
+            ]
+            assert len(values) == len(cache)
+            # The connections of the exited threads are closed when another
+            # thread connects.
+            thread = threading.Thread(target=cache.parse, args=(values[0],))
+            thread.start()
+            thread.join()
+            # pylint: disable=protected-access
+            assert 2 == len(cache._connections)
+
+    def test_threads_in_memory(self):
+        """
+        A cache in memory is shared by all threads.
+
+        """
+        with webcolors.LegacyColorCache(":memory:") as cache:
+            with concurrent.futures.ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(cache.parse, ["navy", "black"] * 4))
+            assert [(0, 0, 128), (0, 0, 0)] * 4 == results
+            assert 2 == len(cache)
@@ -0,0 +1,219 @@
+"""
+Test the command-line interface.
+
+"""
+import contextlib
+import io
+import os
+import runpy
+import tempfile
+import unittest
+from unittest import mock
+
+from webcolors import cli
+
+
+class CommandLineTests(unittest.TestCase):
+    """
+    Test conversion of streams of values from the command line.
+
+    """
+
+    def run_cli(self, argv, stdin=""):
+        """
+        Run the command-line interface with the given arguments and standard
+        input, returning the exit status, standard output and standard
+        error.
+
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(stdin)), contextlib.redirect_stdout(
+            stdout
+        ), contextlib.redirect_stderr(stderr):
+            status = cli.main(argv)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_lines(self):
+        """
+        Values are converted one per line, skipping blank lines.
+
+        """
+        assert (0, "255,255,255\n0,0,128\n", "") == self.run_cli(
+            [], "#fff\n\n  #000080  \n"
+        )
+        assert (0, "white\nnavy\n", "") == self.run_cli(
+            ["-t", "name", "-b", "1"], "#fff\n#000080\n"
+        )
+
+    def test_formats(self):
+        """
+        Values are converted between every pair of formats, and from HTML5
+        legacy colors.
+
+        """
+        cases = (
+            (["-f", "name", "-t", "hex"], "Navy\n", "#000080\n"),
+            (["-f", "name", "-t", "name"], "grey\n", "gray\n"),
+            (["-f", "name", "-t", "name", "-s", "html4"], "navy\n", "navy\n"),
+            (["-f", "hex", "-t", "hex"], "#FFF\n", "#ffffff\n"),
+            (["-f", "rgb", "-t", "hex"], "rgb(0, 0, 128)\n", "#000080\n"),
+            (["-f", "rgb", "-t", "rgb"], "0 0 128\n", "0,0,128\n"),
+            (["-f", "rgb_percent", "-t", "name"], "0%,0%,50%\n", "navy\n"),
+            (["-f", "rgb", "-t", "rgb_percent"], "0,0,128\n", "0%,0%,50%\n"),
+            (["-f", "legacy", "-t", "hex"], "chucknorris\n", "#c00000\n"),
+            (["-f", "legacy", "-t", "rgb"], "navy\n", "0,0,128\n"),
+        )
+        for argv, stdin, stdout in cases:
+            assert (0, stdout, "") == self.run_cli(argv, stdin)
+
+    def test_errors(self):
+        """
+        Invalid values are reported, replaced or skipped according to the
+        error policy.
+
+        """
+        stdin = "#fff\n#ggg\n0,0\n#000080\n"
+        status, stdout, stderr = self.run_cli([], stdin)
+        assert (1, "255,255,255\n") == (status, stdout)
+        assert stderr.startswith("python -m webcolors: -: Line 2: ")
+        assert (0, "255,255,255\n\n\n0,0,128\n", "") == self.run_cli(
+            ["-e", "replace"], stdin
+        )
+        assert (0, "255,255,255\n0,0,128\n", "") == self.run_cli(
+            ["-e", "ignore"], stdin
+        )
+        status, _, stderr = self.run_cli(["-f", "rgb"], "1,2\n")
+        assert status == 1
+        assert "is not an rgb() triplet" in stderr
+
+    def test_csv(self):
+        """
+        One column of a CSV file is converted into another column.
+
+        """
+        stdin = 'id,color\n1,#fff\n2,#ggg\n3,"#000080"\n'
+        assert (
+            0,
+            'id,color,rgb\n1,#fff,"255,255,255"\n2,#ggg,\n3,#000080,"0,0,128"\n',
+            "",
+        ) == self.run_cli(["-l", "csv", "-c", "color", "-e", "replace"], stdin)
+        assert (0, "color,name\nnavy,navy\n", "") == self.run_cli(
+            ["-l", "csv", "-f", "name", "-t", "name"], "color\nnavy\n"
+        )
+        assert (0, "color\n#000088\n", "") == self.run_cli(
+            ["-l", "csv", "-t", "hex", "-o", "color", "-b", "1"],
+            "color\n#008\n",
+        )
+        status, stdout, stderr = self.run_cli(["-l", "csv", "-c", "color"], stdin)
+        assert (1, 'id,color,rgb\n1,#fff,"255,255,255"\n') == (status, stdout)
+        assert "Record 2" in stderr
+        status, _, stderr = self.run_cli(["-l", "csv", "-c", "missing"], stdin)
+        assert status == 1
+        assert "no column named 'missing'" in stderr
+        assert (0, "", "") == self.run_cli(["-l", "csv"], "")
+
+    def test_jsonl(self):
+        """
+        One key of each JSON object is converted into another key.
+
+        """
+        stdin = '{"rgb": [0, 0, 128]}\n\n{"rgb": "rgb(1, 2, 3)"}\n{"rgb": 5}\n'
+        assert (
+            0,
+            '{"rgb": [0, 0, 128], "hex": "#000080"}\n'
+            '{"rgb": "rgb(1, 2, 3)", "hex": "#010203"}\n'
+            '{"rgb": 5, "hex": null}\n',
+            "",
+        ) == self.run_cli(
+            ["-l", "jsonl", "-f", "rgb", "-t", "hex", "-e", "replace"], stdin
+        )
+        assert (0, '{"c": "#fff", "c2": [255, 255, 255]}\n', "") == self.run_cli(
+            ["-l", "jsonl", "-c", "c", "-o", "c2"], '{"c": "#fff"}\n'
+        )
+        for stdin, message in (
+            ('{"hex": "#fff"}\n[1]\n', "Line 2 is not a JSON object"),
+            ('{"hex": "#fff"}\n{\n', "Line 2 is not valid JSON"),
+        ):
+            status, stdout, stderr = self.run_cli(["-l", "jsonl"], stdin)
+            assert (1, '{"hex": "#fff", "rgb": [255, 255, 255]}\n') == (
+                status,
+                stdout,
+            )
+            assert message in stderr
+
+    def test_files(self):
+        """
+        Values are read from each file named, in turn.
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index, contents in enumerate(("#fff\n", "#000080\n")):
+                path = os.path.join(directory, f"{index}.txt")
+                with open(path, "w", encoding="utf-8") as colors_file:
+                    colors_file.write(contents)
+                paths.append(path)
+            assert (0, "255,255,255\n0,0,128\n", "") == self.run_cli(paths)
+            assert (0, "255,255,255\n0,0,128\n", "") == self.run_cli(
+                [paths[0], "-"], "#000080\n"
+            )
+            status, _, stderr = self.run_cli([os.path.join(directory, "missing")])
+            assert status == 1
+            assert "No such file" in stderr
+
+    def test_shards(self):
+        """
+        Each shard of each file can be converted separately.
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "colors.csv")
+            with open(path, "w", encoding="utf-8") as colors_file:
+                colors_file.write("color\n#fff\n#000080\n#c00000\n")
+            assert [
+                (0, "color,name\n#fff,white\n#000080,navy\n", ""),
+                (0, "color,name\n#c00000,\n", ""),
+            ] == [
+                self.run_cli(
+                    ["-l", "csv", "-t", "name", "-e", "replace", "--shard", shard, path]
+                )
+                for shard in ("0/2", "1/2")
+            ]
+            for argv in (["--shard", "1/2"], ["--shard", "1/2", "-", path]):
+                with self.assertRaises(SystemExit), contextlib.redirect_stderr(
+                    io.StringIO()
+                ):
+                    cli.main(argv)
+
+    def test_arguments(self):
+        """
+        Invalid arguments are rejected.
+
+        """
+        for argv in (
+            ["-b", "0"],
+            ["-p", "0"],
+            ["-t", "legacy"],
+            ["-s", "css4"],
+            ["--shard", "2"],
+            ["--shard", "2/2"],
+            ["--shard", "1/0"],
+        ):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(
+                io.StringIO()
+            ):
+                cli.main(argv)
+
+    def test_main_module(self):
+        """
+        The interface runs as ``python -m webcolors``.
+
+        """
+        stdout = io.StringIO()
+        with mock.patch("sys.argv", ["webcolors", "-t", "name"]), mock.patch(
+            "sys.stdin", io.StringIO("#fff\n")
+        ), contextlib.redirect_stdout(stdout), self.assertRaises(SystemExit) as raised:
+            runpy.run_module("webcolors", run_name="__main__")
+        assert raised.exception.code == 0
+        assert "white\n" == stdout.getvalue()
@@ -5,6 +5,7 @@ Test the color-format conversion utilities.
 import unittest
 
 import webcolors
+from webcolors import tables
 
 
 class HexConversionTests(unittest.TestCase):
@@ -43,6 +44,31 @@ class HexConversionTests(unittest.TestCase):
             ValueError, webcolors.hex_to_name, "#daa520", spec=webcolors.HTML4
         )
 
+    def test_hex_to_name_spellings(self):
+        """
+        Every spelling of a named color's value gives the same name, and
+        agrees with normalization, whether or not the spelling index is
+        enabled.
+
+        """
+        assert not tables.HEX_SPELLINGS
+        webcolors.enable_spelling_index()
+        self.addCleanup(webcolors.disable_spelling_index)
+        assert tables.HEX_SPELLINGS
+        for spelling in ("#D3D3D3", "#d3D3d3", "#FfF", "#fFfFfF", "#000080"):
+            assert webcolors.hex_to_name(spelling) == webcolors.hex_to_name(
+                webcolors.normalize_hex(spelling)
+            )
+        for spelling, hex_value in tables.HEX_SPELLINGS.items():
+            assert hex_value == webcolors.normalize_hex(spelling)
+        for value in ("#DAA520", "#daa520", "#DaA520"):
+            self.assertRaises(
+                ValueError, webcolors.hex_to_name, value, spec=webcolors.HTML4
+            )
+        webcolors.disable_spelling_index()
+        assert not tables.HEX_SPELLINGS
+        assert "lightgray" == webcolors.hex_to_name("#d3D3d3")
+
     def test_hex_to_name_specs(self):
         """
         Using one of the supported specifications succeeds; using an
@@ -58,6 +84,31 @@ class HexConversionTests(unittest.TestCase):
                 ValueError, webcolors.hex_to_name, "#ffffff", spec=unsupported_spec
             )
 
+    def test_hex_to_names(self):
+        """
+        All names of a color, in every specification, are returned at
+        once, and agree with hex_to_name().
+
+        """
+        for hex_value in ("#fff", "#FFA500", b"#808080", "#daa520", "#123456"):
+            names = webcolors.hex_to_names(hex_value)
+            for spec in webcolors.constants.SUPPORTED_SPECIFICATIONS:
+                try:
+                    name = webcolors.hex_to_name(hex_value, spec=spec)
+                except ValueError:
+                    assert spec not in names
+                else:
+                    assert name == names[spec][0]
+        assert {
+            "css21": ("orange",),
+            "css3": ("orange",),
+        } == webcolors.hex_to_names("#ffa500")
+        assert ("darkslategray", "darkslategrey") == webcolors.hex_to_names("#2f4f4f")[
+            "css3"
+        ]
+        assert not webcolors.hex_to_names("#123456")
+        self.assertRaises(ValueError, webcolors.hex_to_names, "#12345")
+
     def test_hex_to_rgb(self):
         """
         Test conversion from hex to integer RGB triplet.
@@ -74,6 +125,22 @@ class HexConversionTests(unittest.TestCase):
             assert isinstance(result, webcolors.IntegerRGB)
             assert triplet == result
 
+    def test_hex_to_bytes(self):
+        """
+        Conversions from hex accept bytes-like values.
+
+        """
+        for value in (b"#000080", bytearray(b"#000080"), memoryview(b"#000080")):
+            result = webcolors.hex_to_rgb(value)
+            assert isinstance(result, webcolors.IntegerRGB)
+            assert (0, 0, 128) == result
+            assert "navy" == webcolors.hex_to_name(value)
+            assert ("0%", "0%", "50%") == webcolors.hex_to_rgb_percent(value)
+        assert (255, 255, 255) == webcolors.hex_to_rgb(b"#FFF")
+        self.assertRaises(ValueError, webcolors.hex_to_rgb, b"#0000gg")
+        with self.assertRaisesRegex(ValueError, '^"#123456" has no defined'):
+            webcolors.hex_to_name(memoryview(b"#123456"))
+
     def test_hex_to_rgb_percent(self):
         """
         Test conversion from hex to percent RGB triplet.
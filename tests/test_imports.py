@@ -0,0 +1,110 @@
+"""
+Test the deferred loading of webcolors' submodules and lookup tables.
+
+"""
+import unittest
+
+import webcolors
+from webcolors import constants, tables
+
+from .helpers import run_script
+
+
+class LazyImportTests(unittest.TestCase):
+    """
+    Test that submodules are imported on first use of their names.
+
+    """
+
+    def test_import_is_lazy(self):
+        """
+        Importing webcolors imports none of its submodules, and does not
+        build any lookup tables.
+
+        """
+        script = (
+            "import sys, webcolors; "
+            "print(sorted(name for name in sys.modules "
+            "if name.startswith('webcolors.') "
+            "or name in ('asyncio', 're', 'string', 'typing')))"
+        )
+        assert "[]" == run_script(script)
+
+    def test_submodules(self):
+        """
+        Submodules providing public names can be used as attributes of the
+        package without importing them first.
+
+        """
+        script = (
+            "import webcolors; "
+            "print(webcolors.constants.SUPPORTED_SPECIFICATIONS, "
+            "webcolors.conversion.name_to_hex('navy'), "
+            "webcolors.html5.html5_parse_simple_color('#ffffff'), "
+            "webcolors.normalization.normalize_hex('#FFF'), "
+            "webcolors.types.IntegerRGB.__name__)"
+        )
+        assert (
+            "('html4', 'css2', 'css21', 'css3') #000080 "
+            "HTML5SimpleColor(red=255, green=255, blue=255) #ffffff IntegerRGB"
+        ) == run_script(script)
+
+    def test_all_names(self):
+        """
+        Every public name can be looked up, and is listed by dir().
+
+        """
+        for name in webcolors.__all__:
+            assert getattr(webcolors, name) is not None
+        assert set(webcolors.__all__) <= set(dir(webcolors))
+        with self.assertRaises(AttributeError):
+            webcolors.not_a_function  # pylint: disable=pointless-statement
+
+    def test_lazy_constants(self):
+        """
+        Mappings of hexadecimal values to names, and the regular
+        expression matching hexadecimal values, are built on first use.
+
+        """
+        assert constants.CSS2_HEX_TO_NAMES is constants.HTML4_HEX_TO_NAMES
+        assert constants.CSS21_HEX_TO_NAMES["#ffa500"] == "orange"
+        assert constants.CSS3_HEX_TO_NAMES["#808080"] == "gray"
+        assert constants.HEX_COLOR_RE.match("#fff")
+        with self.assertRaises(AttributeError):
+            constants.NOT_A_CONSTANT  # pylint: disable=pointless-statement
+
+
+class LookupTablesTests(unittest.TestCase):
+    """
+    Test the lookup tables built from the color definitions.
+
+    """
+
+    def test_tables(self):
+        """
+        The lookup tables agree with the color definitions, and CSS2 shares
+        the tables of HTML 4.
+
+        """
+        index = tables.all_names_index()
+        for spec in constants.SUPPORTED_SPECIFICATIONS:
+            names_to_hex = getattr(constants, f"{spec.upper()}_NAMES_TO_HEX")
+            hex_to_names = getattr(constants, f"{spec.upper()}_HEX_TO_NAMES")
+            assert tables.int_to_name(spec) == {
+                int(hex_value[1:], 16): name for hex_value, name in hex_to_names.items()
+            }
+            all_names = {
+                hex_value: specs[spec]
+                for hex_value, specs in index.items()
+                if spec in specs
+            }
+            assert sorted(names_to_hex) == sorted(
+                name for names in all_names.values() for name in names
+            )
+            for hex_value, names in all_names.items():
+                assert names[0] == hex_to_names[hex_value]
+                assert {hex_value} == {names_to_hex[name] for name in names}
+        assert ("gray", "grey") == index["#808080"][constants.CSS3]
+        assert tables.int_to_name(constants.CSS2) is (
+            tables.int_to_name(constants.HTML4)
+        )
@@ -0,0 +1,236 @@
+"""
+Test the opt-in instrumentation of the conversion functions.
+
+"""
+import math
+import unittest
+
+import webcolors
+
+
+class InstrumentationTests(unittest.TestCase):
+    """
+    Test recording and reporting of call counts, error counts and
+    latencies.
+
+    """
+
+    def setUp(self):
+        """
+        Start each test with no recorded statistics.
+
+        """
+        webcolors.reset_instrumentation()
+        self.addCleanup(webcolors.disable_instrumentation)
+
+    def test_disabled(self):
+        """
+        When disabled, the original functions are in place and nothing is
+        recorded.
+
+        """
+        original = webcolors.hex_to_rgb
+        webcolors.enable_instrumentation()
+        assert webcolors.hex_to_rgb is not original
+        assert webcolors.hex_to_rgb.__name__ == "hex_to_rgb"
+        webcolors.disable_instrumentation()
+        assert webcolors.hex_to_rgb is original
+        webcolors.hex_to_rgb("#fff")
+        webcolors.disable_instrumentation()
+        assert {} == webcolors.instrumentation_snapshot()
+
+    def test_snapshot(self):
+        """
+        Calls, errors and latencies are recorded per function, including
+        calls made internally by other functions.
+
+        """
+        webcolors.enable_instrumentation()
+        webcolors.enable_instrumentation()
+        for value in ("#fff", "#000080", "#0000"):
+            try:
+                webcolors.hex_to_rgb(value)
+            except ValueError:
+                pass
+        webcolors.name_to_rgb("navy")
+        webcolors.html5_parse_legacy_color("chucknorris")
+        snapshot = webcolors.instrumentation_snapshot()
+        assert {
+            "hex_to_rgb",
+            "html5_parse_legacy_color",
+            "name_to_hex",
+            "name_to_rgb",
+        } <= set(snapshot)
+        stats = snapshot["hex_to_rgb"]
+        assert stats["calls"] == 4
+        assert stats["errors"] == 1
+        assert stats["sum"] > 0
+        buckets = list(stats["buckets"].items())
+        assert buckets[-1] == (math.inf, 4)
+        assert [count for _, count in buckets] == sorted(count for _, count in buckets)
+        assert snapshot["name_to_rgb"]["calls"] == 1
+
+    def test_reset(self):
+        """
+        Resetting discards recorded statistics, but leaves instrumentation
+        enabled.
+
+        """
+        webcolors.enable_instrumentation()
+        webcolors.rgb_to_hex((0, 0, 128))
+        webcolors.reset_instrumentation()
+        assert {} == webcolors.instrumentation_snapshot()
+        webcolors.rgb_to_hex((0, 0, 128))
+        assert webcolors.instrumentation_snapshot()["rgb_to_hex"]["calls"] == 1
+
+    def test_prometheus(self):
+        """
+        Statistics are exposed in the Prometheus text format.
+
+        """
+        webcolors.enable_instrumentation()
+        webcolors.normalize_hex("#FFF")
+        try:
+            webcolors.normalize_hex("#ff")
+        except ValueError:
+            pass
+        lines = webcolors.instrumentation_to_prometheus().splitlines()
+        assert "# TYPE webcolors_calls_total counter" in lines
+        assert "# TYPE webcolors_call_duration_seconds histogram" in lines
+        assert 'webcolors_calls_total{function="normalize_hex"} 2' in lines
+        assert 'webcolors_errors_total{function="normalize_hex"} 1' in lines
+        assert (
+            'webcolors_call_duration_seconds_bucket{function="normalize_hex",le="+Inf"}'
+            " 2"
+        ) in lines
+        assert 'webcolors_call_duration_seconds_count{function="normalize_hex"} 2' in (
+            lines
+        )
+        assert any(
+            line.startswith(
+                'webcolors_call_duration_seconds_bucket{function="normalize_hex",'
+                'le="1e-06"}'
+            )
+            for line in lines
+        )
+
+
+class SamplingTests(unittest.TestCase):
+    """
+    Test sampling of calls into a ring buffer.
+
+    """
+
+    def setUp(self):
+        """
+        Start each test with no recorded samples.
+
+        """
+        webcolors.reset_instrumentation()
+        self.addCleanup(webcolors.disable_sampling)
+
+    def test_sampling(self):
+        """
+        One in every ``rate`` calls is recorded, with the shape of its input.
+
+        """
+        original = webcolors.hex_to_name
+        webcolors.enable_sampling(rate=1)
+        webcolors.hex_to_name("#000080", spec=webcolors.HTML4)
+        webcolors.hex_to_name(b"#000080")
+        for value in ((0, 0, 128), ("0%", "0%", "50%"), None):
+            try:
+                webcolors.rgb_to_name(value, webcolors.CSS21)
+            except (TypeError, ValueError):
+                pass
+        webcolors.disable_sampling()
+        assert webcolors.hex_to_name is original
+        samples = [
+            sample
+            for sample in webcolors.sampled_calls()
+            if sample.function in ("hex_to_name", "rgb_to_name")
+        ]
+        assert [
+            ("hex_to_name", "hex", 7, "html4", True, None),
+            ("hex_to_name", "bytes", 7, "css3", True, None),
+            # Calls made internally are sampled, and recorded first.
+            ("hex_to_name", "hex", 7, "css21", True, None),
+            ("rgb_to_name", "integer", 3, "css21", True, None),
+            ("rgb_to_name", "percent", 3, "css21", False, None),
+            ("rgb_to_name", "NoneType", None, "css21", False, None),
+        ] == [sample[:-1] for sample in samples]
+        assert all(sample.seconds > 0 for sample in samples)
+
+    def test_rate_and_capacity(self):
+        """
+        Only one in ``rate`` calls is sampled, and only the most recent
+        ``capacity`` samples are kept.
+
+        """
+        webcolors.enable_sampling(rate=3, capacity=2)
+        for value in range(9):
+            webcolors.normalize_integer_triplet((value, 0, 0))
+        assert [3, 3] == [sample.length for sample in webcolors.sampled_calls()]
+        webcolors.enable_sampling(rate=1, capacity=10)
+        assert not webcolors.sampled_calls()
+        webcolors.normalize_hex("#fff")
+        webcolors.reset_instrumentation()
+        assert not webcolors.sampled_calls()
+        for rate, capacity in ((0, 1), (1, 0)):
+            with self.assertRaises(ValueError):
+                webcolors.enable_sampling(rate, capacity)
+
+    def test_legacy_steps(self):
+        """
+        Samples of HTML5 legacy color parsing record the step at which
+        parsing returned.
+
+        """
+        values = {
+            "": 2,
+            " Transparent ": 4,
+            "NAVY": 5,
+            "#fab": 6,
+            "#ffffff": 20,
+            "chucknorris": 20,
+            b"#fff": 1,
+        }
+        webcolors.enable_sampling(rate=1)
+        for value in values:
+            try:
+                webcolors.html5_parse_legacy_color(value)
+            except ValueError:
+                pass
+        samples = [
+            sample
+            for sample in webcolors.sampled_calls()
+            if sample.function == "html5_parse_legacy_color"
+        ]
+        assert list(values.values()) == [sample.step for sample in samples]
+        assert [False, False, True, True, True, True, False] == [
+            sample.hit for sample in samples
+        ]
+
+    def test_with_instrumentation(self):
+        """
+        Sampling and instrumentation can be enabled together, and each
+        can be disabled independently.
+
+        """
+        webcolors.enable_sampling(rate=2)
+        webcolors.enable_instrumentation()
+        self.addCleanup(webcolors.disable_instrumentation)
+        for _ in range(4):
+            webcolors.rgb_to_hex((0, 0, 0))
+        webcolors.disable_sampling()
+        webcolors.rgb_to_hex((0, 0, 0))
+        webcolors.disable_instrumentation()
+        webcolors.rgb_to_hex((0, 0, 0))
+        assert 5 == webcolors.instrumentation_snapshot()["rgb_to_hex"]["calls"]
+        assert 2 == len(
+            [
+                sample
+                for sample in webcolors.sampled_calls()
+                if sample.function == "rgb_to_hex"
+            ]
+        )
@@ -0,0 +1,206 @@
+"""
+Test the lazy conversion iterators.
+
+"""
+import itertools
+import unittest
+
+import webcolors
+
+# Each iterator, the scalar function it applies, whether it takes a spec, and
+# some values to convert, one of which cannot be converted (or, for integer
+# triplets, is out of range and clipped).
+CONVERSIONS = [
+    (
+        webcolors.iter_name_to_hex,
+        webcolors.name_to_hex,
+        True,
+        ["white", "Navy", "ultraviolet"],
+    ),
+    (
+        webcolors.iter_name_to_rgb,
+        webcolors.name_to_rgb,
+        True,
+        ["white", "Navy", "ultraviolet"],
+    ),
+    (
+        webcolors.iter_name_to_rgb_percent,
+        webcolors.name_to_rgb_percent,
+        True,
+        ["white", "Navy", "ultraviolet"],
+    ),
+    (
+        webcolors.iter_hex_to_name,
+        webcolors.hex_to_name,
+        True,
+        ["#fff", "#000080", "#123456", "#00008g"],
+    ),
+    (
+        webcolors.iter_hex_to_names,
+        webcolors.hex_to_names,
+        False,
+        ["#fff", "#123456", "#00008g"],
+    ),
+    (
+        webcolors.iter_hex_to_rgb,
+        webcolors.hex_to_rgb,
+        False,
+        ["#fff", "#000080", "#00008g"],
+    ),
+    (
+        webcolors.iter_hex_to_rgb_percent,
+        webcolors.hex_to_rgb_percent,
+        False,
+        ["#fff", "#000080", "#00008g"],
+    ),
+    (
+        webcolors.iter_rgb_to_name,
+        webcolors.rgb_to_name,
+        True,
+        [(255, 255, 255), (0, 0, 128), (0, 0, 129)],
+    ),
+    (
+        webcolors.iter_rgb_to_hex,
+        webcolors.rgb_to_hex,
+        False,
+        [(255, 255, 255), (0, 0, 128), (0, 0, 300)],
+    ),
+    (
+        webcolors.iter_rgb_to_rgb_percent,
+        webcolors.rgb_to_rgb_percent,
+        False,
+        [(255, 255, 255), (0, 0, 128), (0, 0, 300)],
+    ),
+    (
+        webcolors.iter_rgb_percent_to_name,
+        webcolors.rgb_percent_to_name,
+        True,
+        [("100%", "100%", "100%"), ("0%", "0%", "50%"), ("0%", "0%", "51%")],
+    ),
+    (
+        webcolors.iter_rgb_percent_to_hex,
+        webcolors.rgb_percent_to_hex,
+        False,
+        [("100%", "100%", "100%"), ("0%", "0%", "50%"), ("0%", "0%", "x%")],
+    ),
+    (
+        webcolors.iter_rgb_percent_to_rgb,
+        webcolors.rgb_percent_to_rgb,
+        False,
+        [("100%", "100%", "100%"), ("0%", "0%", "50%"), ("0%", "0%", "x%")],
+    ),
+]
+
+
+def _convert(function, values, **kwargs):
+    """
+    Convert each value with a scalar conversion function, replacing those
+    which cannot be converted with None.
+
+    """
+    results = []
+    for value in values:
+        try:
+            results.append(function(value, **kwargs))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+class IteratorTests(unittest.TestCase):
+    """
+    Test the iterators which lazily convert iterables of values.
+
+    """
+
+    def test_results(self):
+        """
+        Results match the scalar function, in input order, under each error
+        policy.
+
+        """
+        for iterator, function, _, values in CONVERSIONS:
+            with self.subTest(iterator=iterator.__name__):
+                expected = _convert(function, values)
+                assert expected == list(iterator(iter(values), errors="replace"))
+                assert [result for result in expected if result is not None] == list(
+                    iterator(values, errors="ignore")
+                )
+                converted = [value for value, result in zip(values, expected) if result]
+                assert [result for result in expected if result] == list(
+                    iterator(converted)
+                )
+
+    def test_strict(self):
+        """
+        With the default policy, results are yielded until a value cannot be
+        converted, which raises ValueError.
+
+        """
+        for iterator, function, _, values in CONVERSIONS:
+            if iterator in (
+                webcolors.iter_rgb_to_hex,
+                webcolors.iter_rgb_to_rgb_percent,
+            ):
+                # Out-of-range integer values are clipped, rather than raising.
+                continue
+            with self.subTest(iterator=iterator.__name__):
+                results = iterator(values)
+                assert function(values[0]) == next(results)
+                with self.assertRaises(ValueError):
+                    list(results)
+
+    def test_spec(self):
+        """
+        Iterators taking a spec pass it to the scalar function, and reject an
+        unsupported spec when called, before any value is converted.
+
+        """
+        for iterator, function, takes_spec, values in CONVERSIONS:
+            if not takes_spec:
+                continue
+            with self.subTest(iterator=iterator.__name__):
+                assert _convert(function, values, spec=webcolors.HTML4) == list(
+                    iterator(values, spec=webcolors.HTML4, errors="replace")
+                )
+                with self.assertRaises(ValueError):
+                    iterator(values, spec="css4")
+
+    def test_invalid_errors(self):
+        """
+        An unsupported error policy is rejected when the iterator is called.
+
+        """
+        for iterator, _, _, values in CONVERSIONS:
+            with self.subTest(iterator=iterator.__name__):
+                with self.assertRaises(ValueError):
+                    iterator(values, errors="skip")
+
+    def test_lazy(self):
+        """
+        Values are converted only as results are consumed, so iterators can
+        be chained over unbounded inputs.
+
+        """
+        names = itertools.cycle(["white", "ultraviolet", "navy"])
+        hex_values = webcolors.iter_name_to_hex(names, errors="ignore")
+        rgb_triplets = webcolors.iter_hex_to_rgb(hex_values)
+        assert [
+            (255, 255, 255),
+            (0, 0, 128),
+            (255, 255, 255),
+        ] == list(itertools.islice(rgb_triplets, 3))
+
+    def test_instrumentation(self):
+        """
+        Each value is converted by the scalar function as it is when the value
+        is converted, so that conversions by an iterator created before
+        instrumentation was enabled are recorded.
+
+        """
+        webcolors.reset_instrumentation()
+        hex_values = webcolors.iter_name_to_hex(["white", "navy"])
+        webcolors.enable_instrumentation()
+        self.addCleanup(webcolors.disable_instrumentation)
+        assert ["#ffffff", "#000080"] == list(hex_values)
+        assert 2 == webcolors.instrumentation_snapshot()["name_to_hex"]["calls"]
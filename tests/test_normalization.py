@@ -30,6 +30,26 @@ class NormalizationTests(unittest.TestCase):
         for raw, normalized in test_pairs:
             assert normalized == webcolors.normalize_hex(raw)
 
+    def test_normalize_hex_bytes(self):
+        """
+        Hexadecimal normalization accepts bytes-like values and returns
+        a string.
+
+        """
+        test_pairs = (
+            (b"#0099cc", "#0099cc"),
+            (bytearray(b"#0099CC"), "#0099cc"),
+            (memoryview(b"#09c"), "#0099cc"),
+            (b"#09C", "#0099cc"),
+        )
+
+        for raw, normalized in test_pairs:
+            assert normalized == webcolors.normalize_hex(raw)
+
+        test_values = (b"0099cc", b"#0000gg", b"#0000", b"#00000000", b"#+fff", b"")
+        for value in test_values:
+            self.assertRaises(ValueError, webcolors.normalize_hex, value)
+
     def test_normalize_hex_format(self):
         """
         Hex normalization raises ValueError on invalid hex color code.
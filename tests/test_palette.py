@@ -0,0 +1,89 @@
+"""
+Test palette extraction.
+
+"""
+import array
+import unittest
+
+import webcolors
+
+
+class PaletteTests(unittest.TestCase):
+    """
+    Test the median-cut palette extraction function.
+
+    """
+
+    def test_extract_palette(self):
+        """
+        Dominant colors are extracted, named and ordered by count.
+
+        """
+        triplets = [(255, 255, 255)] * 5 + [(0, 0, 128)] * 3 + [(218, 165, 32)] * 2
+        result = webcolors.extract_palette(triplets, count=3)
+        assert all(isinstance(color, webcolors.PaletteColor) for color in result)
+        assert all(isinstance(color.rgb, webcolors.IntegerRGB) for color in result)
+        assert [
+            ((255, 255, 255), "#ffffff", "white", 5),
+            ((0, 0, 128), "#000080", "navy", 3),
+            ((218, 165, 32), "#daa520", "goldenrod", 2),
+        ] == result
+
+    def test_extract_palette_buffers(self):
+        """
+        Pixel buffers give the same palette as the equivalent triplets.
+
+        """
+        triplets = [(red, 255 - red, red // 2) for red in range(0, 256, 5)] * 3
+        expected = webcolors.extract_palette(triplets, count=4)
+        assert 4 == len(expected)
+        assert len(triplets) == sum(color.count for color in expected)
+
+        rgb = bytes(value for triplet in triplets for value in triplet)
+        rgba = bytes(value for triplet in triplets for value in (*triplet, 0))
+        assert expected == webcolors.extract_palette(rgb, count=4)
+        assert expected == webcolors.extract_palette(
+            array.array("B", rgba), count=4, channels=4
+        )
+
+    def test_extract_palette_merges(self):
+        """
+        Colors merged into one box are averaged, weighted by count, and
+        named with the nearest named color.
+
+        """
+        triplets = [(0, 0, 128)] * 2 + [(0, 0, 132)] * 2 + [(255, 255, 255)] * 5
+        assert [
+            ((255, 255, 255), "#ffffff", "white", 5),
+            ((0, 0, 130), "#000082", "navy", 4),
+        ] == webcolors.extract_palette(triplets, count=2)
+        assert [((142, 142, 199), "#8e8ec7", "mediumpurple", 9)] == (
+            webcolors.extract_palette(triplets, count=1)
+        )
+        assert [((0, 0, 130), "#000082", "navy", 4)] == webcolors.extract_palette(
+            triplets[:4], count=1, spec=webcolors.HTML4
+        )
+
+    def test_extract_palette_few_colors(self):
+        """
+        Fewer colors than requested, or none at all, give a shorter
+        palette.
+
+        """
+        assert 2 == len(webcolors.extract_palette([(0, 0, 0), (1, 1, 1)], count=5))
+        assert not webcolors.extract_palette([])
+        assert not webcolors.extract_palette(b"")
+
+    def test_extract_palette_errors(self):
+        """
+        Invalid counts, buffers and specs raise ValueError.
+
+        """
+        for colors, kwargs in (
+            ([(0, 0, 0)], {"count": 0}),
+            ([(0, 0, 0)], {"spec": "css4"}),
+            (b"\x00\x00", {}),
+            (b"\x00\x00\x00", {"step": 0}),
+        ):
+            with self.assertRaises(ValueError):
+                webcolors.extract_palette(colors, **kwargs)
@@ -0,0 +1,156 @@
+"""
+Test the conversions of raw pixel buffers.
+
+"""
+import unittest
+
+import webcolors
+
+# A 2x2 RGB888 image: white, navy / goldenrod, and an unnamed near-navy.
+RGB_PIXELS = bytes((255, 255, 255, 0, 0, 128, 218, 165, 32, 0, 0, 129))
+
+# The same image as RGBA8888, with varying alpha.
+RGBA_PIXELS = bytes(
+    (255, 255, 255, 0, 0, 0, 128, 64, 218, 165, 32, 128, 0, 0, 129, 255)
+)
+
+
+class PixelConversionTests(unittest.TestCase):
+    """
+    Test the functions which convert raw pixel buffers.
+
+    """
+
+    def test_pixels_to_hex(self):
+        """
+        Pixels convert to normalized hex values, one list per scanline.
+
+        """
+        expected = [["#ffffff", "#000080"], ["#daa520", "#000081"]]
+        assert expected == list(webcolors.pixels_to_hex(RGB_PIXELS, width=2))
+        assert expected == list(
+            webcolors.pixels_to_hex(bytearray(RGBA_PIXELS), width=2, channels=4)
+        )
+
+    def test_pixels_to_ints(self):
+        """
+        Pixels convert to integers of the form 0xRRGGBB.
+
+        """
+        expected = [[0xFFFFFF, 0x000080], [0xDAA520, 0x000081]]
+        assert expected == list(webcolors.pixels_to_ints(RGB_PIXELS, width=2))
+        assert expected == list(
+            webcolors.pixels_to_ints(memoryview(RGBA_PIXELS), width=2, channels=4)
+        )
+        assert [[0xFFFFFF, 0x000080, 0xDAA520, 0x000081]] == list(
+            webcolors.pixels_to_ints(RGB_PIXELS, width=4)
+        )
+
+    def test_pixels_to_names(self):
+        """
+        Exact matches are named and misses are None; with nearest=True,
+        every pixel is named.
+
+        """
+        assert [["white", "navy"], ["goldenrod", None]] == list(
+            webcolors.pixels_to_names(RGB_PIXELS, width=2)
+        )
+        assert [["white", "navy"], ["goldenrod", "navy"]] == list(
+            webcolors.pixels_to_names(RGBA_PIXELS, width=2, channels=4, nearest=True)
+        )
+        assert [["white", "navy"], ["olive", "navy"]] == list(
+            webcolors.pixels_to_names(
+                RGB_PIXELS, width=2, spec=webcolors.HTML4, nearest=True
+            )
+        )
+
+    def test_pixels_to_names_consistency(self):
+        """
+        Exact matches agree with rgb_to_name() for every named color.
+
+        """
+        for spec in webcolors.constants.SUPPORTED_SPECIFICATIONS:
+            names = getattr(webcolors, f"{spec.upper()}_NAMES_TO_HEX")
+            pixels = bytes(
+                value
+                for hex_value in names.values()
+                for value in webcolors.hex_to_rgb(hex_value)
+            )
+            (result,) = webcolors.pixels_to_names(pixels, width=len(names), spec=spec)
+            assert result == [
+                webcolors.hex_to_name(hex_value, spec=spec)
+                for hex_value in names.values()
+            ]
+            (result,) = webcolors.pixels_to_names(
+                pixels, width=len(names), spec=spec, nearest=True
+            )
+            assert result == [
+                webcolors.hex_to_name(hex_value, spec=spec)
+                for hex_value in names.values()
+            ]
+
+    def test_pixels_to_name_histogram(self):
+        """
+        Named colors are counted, with misses under None unless nearest
+        matching is requested.
+
+        """
+        assert {"white": 1, "navy": 1, "goldenrod": 1, None: 1} == (
+            webcolors.pixels_to_name_histogram(RGB_PIXELS)
+        )
+        assert {"white": 1, "navy": 2, "goldenrod": 1} == (
+            webcolors.pixels_to_name_histogram(RGBA_PIXELS, channels=4, nearest=True)
+        )
+        assert {"white": 1, "goldenrod": 1} == webcolors.pixels_to_name_histogram(
+            RGB_PIXELS, step=2
+        )
+        assert {"white": 1, "olive": 1, "navy": 2} == (
+            webcolors.pixels_to_name_histogram(
+                RGB_PIXELS, spec=webcolors.HTML4, nearest=True
+            )
+        )
+        assert not webcolors.pixels_to_name_histogram(b"")
+
+    def test_pixels_to_name_histogram_consistency(self):
+        """
+        The histogram agrees with per-scanline name conversion.
+
+        """
+        pixels = bytes(range(256)) * 3
+        for nearest in (False, True):
+            expected = {}
+            for scanline in webcolors.pixels_to_names(
+                pixels, width=16, nearest=nearest
+            ):
+                for name in scanline:
+                    expected[name] = expected.get(name, 0) + 1
+            assert expected == webcolors.pixels_to_name_histogram(
+                pixels, nearest=nearest
+            )
+
+    def test_pixel_buffer_errors(self):
+        """
+        Malformed buffer shapes and unsupported specs raise ValueError.
+
+        """
+        bad_shapes = (
+            (RGB_PIXELS, {"width": 5}),
+            (RGB_PIXELS, {"width": 0}),
+            (RGB_PIXELS, {"width": 2, "channels": 2}),
+            (RGB_PIXELS[:-1], {"width": 2}),
+        )
+        for function in (
+            webcolors.pixels_to_hex,
+            webcolors.pixels_to_ints,
+            webcolors.pixels_to_names,
+        ):
+            for buffer, kwargs in bad_shapes:
+                with self.assertRaises(ValueError):
+                    list(function(buffer, **kwargs))
+        with self.assertRaises(ValueError):
+            list(webcolors.pixels_to_names(RGB_PIXELS, width=2, spec="css4"))
+        for kwargs in ({"channels": 5}, {"step": 0}, {"spec": "css4"}):
+            with self.assertRaises(ValueError):
+                webcolors.pixels_to_name_histogram(RGB_PIXELS, **kwargs)
+        with self.assertRaises(ValueError):
+            webcolors.pixels_to_name_histogram(RGB_PIXELS[:-1])
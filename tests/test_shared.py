@@ -0,0 +1,98 @@
+"""
+Test lookup tables placed in shared memory.
+
+"""
+import concurrent.futures
+import random
+import sys
+import unittest
+
+import webcolors
+from webcolors import tables
+
+RANDOM_PIXELS = bytes(random.Random(1234).getrandbits(8) for _ in range(3 * 64))
+
+
+def _nearest_names():
+    """
+    Name the random pixels with their nearest named colors, and report whether
+    shared tables were used.
+
+    """
+    names = list(webcolors.pixels_to_names(RANDOM_PIXELS, 64, nearest=True))
+    return names, isinstance(tables.DISTANCE_TABLES["css3"][1][0], memoryview)
+
+
+@unittest.skipIf(sys.version_info < (3, 8), "Shared memory requires Python 3.8.")
+class SharedTablesTests(unittest.TestCase):
+    """
+    Test creating, attaching to and closing shared tables.
+
+    """
+
+    def setUp(self):
+        """
+        Start each test with no cached nearest names or distance tables.
+
+        """
+        for cache in tables.NEAREST_NAMES.values():
+            cache.clear()
+        tables.DISTANCE_TABLES.clear()
+
+    def test_nearest_names(self):
+        """
+        Nearest names found with shared tables are those found with tables
+        built by the process.
+
+        """
+        expected, shared = _nearest_names()
+        assert not shared
+        for spec in webcolors.constants.SUPPORTED_SPECIFICATIONS:
+            names = [
+                tables.nearest_name(value, spec) for value in range(0, 2**24, 999)
+            ]
+            tables.NEAREST_NAMES[spec].clear()
+            with webcolors.SharedTables(create=True) as shared_tables:
+                assert (
+                    list(webcolors.constants.SUPPORTED_SPECIFICATIONS)
+                    == shared_tables.specs
+                )
+                assert names == [
+                    tables.nearest_name(value, spec) for value in range(0, 2**24, 999)
+                ]
+            tables.NEAREST_NAMES[spec].clear()
+        with webcolors.SharedTables(create=True, specs=["css3"]):
+            assert (expected, True) == _nearest_names()
+        assert not tables.DISTANCE_TABLES
+
+    def test_workers(self):
+        """
+        Worker processes attach to shared tables by name, and leave them for
+        the creating process to unlink.
+
+        """
+        with webcolors.SharedTables(create=True, specs=["css3"]) as shared_tables:
+            expected = _nearest_names()
+            with concurrent.futures.ProcessPoolExecutor(
+                2, initializer=webcolors.SharedTables, initargs=(shared_tables.name,)
+            ) as executor:
+                futures = [executor.submit(_nearest_names) for _ in range(4)]
+                assert [expected] * 4 == [future.result() for future in futures]
+            attached = webcolors.SharedTables(shared_tables.name)
+            assert ["css3"] == attached.specs
+            attached.close()
+            # The tables of the block still open are used again.
+            assert expected == _nearest_names()
+        with self.assertRaises(FileNotFoundError):
+            webcolors.SharedTables(shared_tables.name)
+
+    def test_invalid(self):
+        """
+        Attaching requires a name, and only supported specifications can be
+        shared.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.SharedTables()
+        with self.assertRaises(ValueError):
+            webcolors.SharedTables(create=True, specs=["css4"])
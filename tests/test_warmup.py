@@ -0,0 +1,253 @@
+"""
+Test pre-warming of caches and lookup tables, and the caches' statistics.
+
+"""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent import futures
+
+import webcolors
+from webcolors import html5, tables
+
+from .helpers import run_script
+
+
+class MemoCacheTests(unittest.TestCase):
+    """
+    Test the bounded, hit-counting cache of conversion results.
+
+    """
+
+    def test_hits_and_eviction(self):
+        """
+        Results are cached, and the least-hit entries are evicted when the
+        cache is full.
+
+        """
+        calls = []
+
+        def double(value):
+            """
+            Record a call, and double the value.
+
+            """
+            calls.append(value)
+            if value < 0:
+                raise ValueError(value)
+            return 2 * value
+
+        cache = tables.MemoCache(double, maxsize=4)
+        for value in (1, 1, 1, 2, 2, 3, 4):
+            assert 2 * value == cache(value)
+        assert [1, 2, 3, 4] == calls
+        assert [1, 2] == cache.hottest(2)
+        assert {"hits": 3, "misses": 4, "size": 4, "maxsize": 4} == (cache.statistics())
+        with self.assertRaises(ValueError):
+            cache(-1)
+        assert 4 == len(cache.results)
+        cache(5)
+        assert [1, 2, 5] == cache.hottest(10)
+        cache.clear()
+        assert {"hits": 0, "misses": 0, "size": 0, "maxsize": 4} == (cache.statistics())
+
+    def test_lookup_cache(self):
+        """
+        A cache without per-entry counts evicts the entries cached longest
+        ago.
+
+        """
+        cache = tables.LookupCache(str, maxsize=4)
+        for value in (1, 2, 3, 4, 1, 5):
+            assert str(value) == cache(value)
+        assert [3, 4, 5] == list(cache.results)
+        assert {"hits": 1, "misses": 5, "size": 3, "maxsize": 4} == (cache.statistics())
+        cache.clear()
+        assert {"hits": 0, "misses": 0, "size": 0, "maxsize": 4} == (cache.statistics())
+
+    def test_threads(self):
+        """
+        Threads share cached results, and the cache's entries and counts stay
+        consistent while threads use it.
+
+        """
+        cache = tables.MemoCache(str, maxsize=1000)
+        values = list(range(100)) * 50
+
+        def convert(_):
+            """
+            Look up every value, checking the results.
+
+            """
+            return all(str(value) == cache(value) for value in values)
+
+        with futures.ThreadPoolExecutor(8) as executor:
+            assert all(executor.map(convert, range(8)))
+        statistics = cache.statistics()
+        # Each thread counts its own hits and misses, so none are lost.
+        assert 8 * len(values) == statistics["hits"] + statistics["misses"]
+        assert 100 == statistics["size"]
+        assert 100 == len(cache.hottest(1000))
+        # The counts of threads which have exited are carried over.
+        thread = threading.Thread(target=cache, args=(0,))
+        thread.start()
+        thread.join()
+        assert statistics["hits"] + 1 == cache.statistics()["hits"]
+
+        cache = tables.MemoCache(str, maxsize=16)
+        with futures.ThreadPoolExecutor(8) as executor:
+            results = executor.map(convert, range(8))
+            for _ in range(10):
+                cache.hottest(5)
+                cache.statistics()
+            assert all(results)
+        cache.evict()
+        assert 8 == len(cache.results)
+
+    def test_concurrent_writers(self):
+        """
+        The cache never holds more than its maximum number of entries while
+        many threads store results at once.
+
+        """
+        sizes = []
+
+        def record(value):
+            """
+            Record the size of the cache, and convert the value.
+
+            """
+            sizes.append(len(cache.results))
+            return str(value)
+
+        for cache_class in (tables.LookupCache, tables.MemoCache):
+            with self.subTest(cache_class=cache_class.__name__):
+                cache = cache_class(record, maxsize=8)
+
+                def convert(start, cache=cache):
+                    """
+                    Store a run of distinct values.
+
+                    """
+                    for value in range(start, start + 1000):
+                        cache(value)
+                        sizes.append(len(cache.results))
+
+                with futures.ThreadPoolExecutor(8) as executor:
+                    list(executor.map(convert, range(0, 8000, 1000)))
+                assert 8000 == cache.statistics()["misses"]
+                assert max(sizes) <= 8
+                sizes.clear()
+
+
+class PrewarmTests(unittest.TestCase):
+    """
+    Test pre-warming from manifests, and the production of manifests.
+
+    """
+
+    def setUp(self):
+        """
+        Start each test with an empty, enabled cache of legacy colors.
+
+        """
+        webcolors.enable_legacy_cache()
+        self.addCleanup(webcolors.disable_legacy_cache)
+
+    def test_prewarm(self):
+        """
+        Pre-warming loads the lookup tables in a fresh process.
+
+        """
+        script = (
+            "import webcolors; from webcolors import constants, tables; "
+            "webcolors.prewarm_caches(); "
+            "print(sorted(name for name in vars(constants) "
+            "if name.endswith('_HEX_TO_NAMES') or name == 'HEX_COLOR_RE'), "
+            "sorted(tables.BUILT_TABLES))"
+        )
+        assert (
+            "['CSS21_HEX_TO_NAMES', 'CSS2_HEX_TO_NAMES', 'CSS3_HEX_TO_NAMES', "
+            "'HEX_COLOR_RE', 'HTML4_HEX_TO_NAMES'] ['all_names_index']"
+        ) == run_script(script)
+
+    def test_legacy_cache_opt_in(self):
+        """
+        Legacy colors are cached only once enabled, or once a manifest of
+        legacy colors is loaded, and long values are never cached.
+
+        """
+        webcolors.disable_legacy_cache()
+        webcolors.html5_parse_legacy_color("chucknorris")
+        assert 0 == webcolors.cache_statistics()["legacy"]["size"]
+        webcolors.prewarm_caches({"nearest": []})
+        webcolors.html5_parse_legacy_color("chucknorris")
+        assert 0 == webcolors.cache_statistics()["legacy"]["size"]
+        webcolors.prewarm_caches({"legacy": []})
+        webcolors.html5_parse_legacy_color("chucknorris")
+        assert 1 == webcolors.cache_statistics()["legacy"]["size"]
+        webcolors.disable_legacy_cache()
+        assert 0 == webcolors.cache_statistics()["legacy"]["size"]
+        webcolors.enable_legacy_cache()
+        for value in ("x" * 32, "x" * 33, "x" * 10000):
+            webcolors.html5_parse_legacy_color(value)
+        assert ["x" * 32] == webcolors.cache_manifest()["legacy"]
+
+    def test_manifest_round_trip(self):
+        """
+        A manifest of the hottest values, saved as JSON, pre-warms the
+        caches of another process.
+
+        """
+        for value in ["chucknorris"] * 3 + ["Window"] * 2 + ["navy", "", None]:
+            try:
+                webcolors.html5_parse_legacy_color(value)
+            except ValueError:
+                pass
+        list(
+            webcolors.pixels_to_names(
+                b"\x01\x02\x03", 1, spec=webcolors.HTML4, nearest=True
+            )
+        )
+        manifest = webcolors.cache_manifest(limit=2)
+        assert ["chucknorris", "Window"] == manifest["legacy"]
+        assert webcolors.HTML4 in manifest["nearest"]
+        assert [] == webcolors.cache_manifest(limit=0)["legacy"]
+        statistics = webcolors.cache_statistics()
+        assert {"hits": 3, "misses": 3, "size": 3, "maxsize": 4096} == (
+            statistics["legacy"]
+        )
+        assert {"hits", "misses", "size", "maxsize"} == set(statistics["nearest"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "manifest.json")
+            with open(path, "w", encoding="utf-8") as manifest_file:
+                json.dump(
+                    {
+                        "legacy": manifest["legacy"] + ["transparent"],
+                        "nearest": manifest["nearest"],
+                    },
+                    manifest_file,
+                )
+            html5._LEGACY_COLORS.clear()  # pylint: disable=protected-access
+            webcolors.prewarm_caches(path)
+        assert ["chucknorris", "Window"] == sorted(
+            webcolors.cache_manifest()["legacy"], reverse=True
+        )
+        assert 0 == webcolors.cache_statistics()["legacy"]["hits"]
+        webcolors.html5_parse_legacy_color("chucknorris")
+        assert 1 == webcolors.cache_statistics()["legacy"]["hits"]
+
+    def test_invalid(self):
+        """
+        Pre-warming needs no manifest, but invalid manifests and limits are
+        rejected.
+
+        """
+        webcolors.prewarm_caches()
+        for manifest in (["navy"], {"names": ["navy"]}, {"nearest": ["css4"]}):
+            with self.assertRaises(ValueError):
+                webcolors.prewarm_caches(manifest)
+        with self.assertRaises(ValueError):
+            webcolors.cache_manifest(limit=-1)